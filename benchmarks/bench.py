@@ -0,0 +1,96 @@
+"""
+Benchmarks of the client against the offline mock server, hashnode_py.mock.
+
+    python -m benchmarks.bench --rounds 200 --latency 0.005
+
+Every scenario reports requests/sec, p50/p99 latency, bytes transferred per call and peak memory.
+test_bench.py runs the same scenarios under pytest-benchmark when it is installed.
+"""
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from hashnode_py.client import HashnodeClient
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.session import HashnodeSession
+
+_TAGS = [{'slug': 'python', 'name': 'Python'}]
+
+# scenario name: a callable building the call to measure from a client
+SCENARIOS = {
+    'get_feed': lambda client: lambda: client.get_feed(20),
+    'get_followers': lambda client: lambda: client.get_followers('alice', 20, 1),
+    'User.get_posts': lambda client: (
+        lambda user: lambda: user.get_posts(20, 1, lazy_content=False))(client.get_user('alice')),
+    'publish_post': lambda client: (
+        lambda publication: lambda: publication.publish_post('Benchmark', 'Body', tags_slug=_TAGS)
+    )(client.get_publication('blog.hashnode.dev')),
+}
+
+
+def make_client(server: MockHashnodeServer) -> HashnodeClient:
+    """
+    Returns an uncached client talking to the mock server.
+    """
+    return HashnodeClient('benchmark', session=HashnodeSession('benchmark', url=server.url))
+
+
+def measure(call, server: MockHashnodeServer, rounds: int = 100) -> dict:
+    """
+    Runs call rounds times, after one warm-up call.
+    Args:
+        call: The callable to measure.
+        server (MockHashnodeServer): The server answering the calls, whose stats count the traffic.
+        rounds (int, optional): The number of measured calls. Defaults to 100.
+    Returns:
+        dict: requests_per_sec, p50_ms, p99_ms, bytes_in and bytes_out per call, and the peak_memory_kib
+            of one call.
+    """
+    call()
+    before = server.stats.as_dict()
+    timings = []
+    started = time.perf_counter()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    elapsed = time.perf_counter() - started
+    after = server.stats.as_dict()
+    # Traced separately, as tracemalloc slows down the timed calls; the server thread is traced too.
+    tracemalloc.start()
+    call()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    percentiles = statistics.quantiles(timings, n=100, method='inclusive')
+    return {
+        'requests_per_sec': (after['requests'] - before['requests']) / elapsed,
+        'p50_ms': percentiles[49] * 1000,
+        'p99_ms': percentiles[98] * 1000,
+        'bytes_in': (after['bytes_in'] - before['bytes_in']) / rounds,
+        'bytes_out': (after['bytes_out'] - before['bytes_out']) / rounds,
+        'peak_memory_kib': peak / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--total-items', type=int, default=100, help='items of every paginated connection')
+    parser.add_argument('--content-size', type=int, default=2000, help='characters of post content')
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS), help='defaults to all')
+    args = parser.parse_args()
+
+    columns = ['requests_per_sec', 'p50_ms', 'p99_ms', 'bytes_in', 'bytes_out', 'peak_memory_kib']
+    print(f"{'scenario':<16}" + ''.join(f'{column:>18}' for column in columns))
+    with MockHashnodeServer(latency=args.latency, total_items=args.total_items,
+                            content_size=args.content_size) as server:
+        client = make_client(server)
+        for name in args.scenario or SCENARIOS:
+            result = measure(SCENARIOS[name](client), server, args.rounds)
+            print(f'{name:<16}' + ''.join(f'{result[column]:>18.1f}' for column in columns))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Per-object memory footprint of the resource models, built from mock API responses.
+
+    python -m benchmarks.bench_memory --count 100000
+
+The footprint counts everything a list of objects keeps alive once the response is released,
+with and without keep_raw, next to a baseline keeping the same attributes in an instance __dict__,
+as the models did before they used __slots__.
+"""
+import argparse
+import gc
+import tracemalloc
+
+from graphql import graphql_sync
+
+from hashnode_py.mock import MockData
+from hashnode_py.queries.follow_queries import followers_info
+from hashnode_py.queries.user_queries import posts
+from hashnode_py.resources.fields import is_set
+from hashnode_py.resources.post import Post
+from hashnode_py.resources.user import User
+from hashnode_py.schema import load_schema
+
+
+class _Client:
+    def __init__(self, keep_raw: bool):
+        self.keep_raw = keep_raw
+
+
+class _DictModel:
+    """
+    The attributes of a resource object kept in an instance __dict__.
+    """
+
+
+def _as_dict_model(obj) -> _DictModel:
+    copy = _DictModel()
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if is_set(obj, name):
+                copy.__dict__[name] = object.__getattribute__(obj, name)
+    return copy
+
+
+# model: (resource, query, variables, path to the nodes, page size variable)
+MODELS = {
+    'User': (User, followers_info, {'username': 'alice', 'page': 1}, ('user', 'followers', 'nodes'), 'pageSize'),
+    'Post': (Post, posts, {'username': 'alice', 'page': 1}, ('user', 'posts', 'nodes'), 'page_size'),
+}
+
+
+def _nodes(model: str, root, count: int) -> list:
+    resource, query, variables, path, page_size = MODELS[model]
+    nodes = graphql_sync(load_schema(), query, root_value=root,
+                         variable_values=dict(variables, **{page_size: count})).data
+    for key in path:
+        nodes = nodes[key]
+    return nodes
+
+
+def footprint(model: str, count: int, keep_raw: bool, content_size: int = 2000, baseline: bool = False) -> float:
+    """
+    Returns the bytes kept alive per object, or per baseline object keeping its attributes in a __dict__.
+    """
+    resource = MODELS[model][0]
+    root = MockData(total_items=count, content_size=content_size).root()
+    client = _Client(keep_raw)
+    # The schema and the first execution of a query allocate caches, which are not per object.
+    _nodes(model, MockData(total_items=1).root(), 1)
+    gc.collect()
+    tracemalloc.start()
+    nodes = _nodes(model, root, count)
+    objects = [resource(node, client) for node in nodes]
+    if baseline:
+        objects = [_as_dict_model(obj) for obj in objects]
+    del nodes
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--content-size', type=int, default=2000, help='characters of post content')
+    args = parser.parse_args()
+
+    print(f"{'model':<14}{'keep_raw=False':>18}{'keep_raw=True':>18}")
+    for model in MODELS:
+        for baseline in (False, True):
+            sizes = [footprint(model, args.count, keep_raw, args.content_size, baseline) for keep_raw in (False, True)]
+            name = f'{model} (dict)' if baseline else model
+            print(f'{name:<14}' + ''.join(f'{size:>18.0f}' for size in sizes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,19 @@
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from bench import SCENARIOS, make_client, measure  # noqa: E402
+from hashnode_py.mock import MockHashnodeServer  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def server():
+    with MockHashnodeServer() as server:
+        yield server
+
+
+@pytest.mark.parametrize('scenario', sorted(SCENARIOS))
+def test_scenario(benchmark, server, scenario):
+    call = SCENARIOS[scenario](make_client(server))
+    benchmark.extra_info.update(measure(call, server, rounds=20))
+    benchmark(call)
@@ -1 +1,3 @@
 from hashnode_py.client import HashnodeClient
+from hashnode_py.async_client import AsyncHashnodeClient
+from hashnode_py.cache import MemoryCache, SQLiteCache
@@ -0,0 +1,337 @@
+import asyncio
+import contextvars
+
+from gql import Client
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+from hashnode_py.client import _RESOURCES, _batch_results, _feed_variables
+from hashnode_py.documents import documents, operation_of
+from hashnode_py.loader import AsyncDataLoader
+from hashnode_py.resources.user import User
+from hashnode_py.resources.publication import Publication
+from hashnode_py.resources.post import Post
+from hashnode_py.resources.tag import Tag
+from hashnode_py.resources.follow import Follows, Followers
+from hashnode_py.queries.user_queries import user_info
+from hashnode_py.queries.post_queries import post_info, feed
+from hashnode_py.queries.publication_queries import publication_info
+from hashnode_py.queries.follow_queries import follows_info, followers_info
+from hashnode_py.queries.tag_queries import tag_info
+from hashnode_py.queries.builder import batch_query, project_query
+from hashnode_py.resources.fields import select_fields
+from hashnode_py.ratelimit import RateLimiter
+from hashnode_py.retry import RetryPolicy, retry_after
+from hashnode_py.schema import load_schema
+from hashnode_py.session import HASHNODE_URL
+
+# The status and headers of the response to the request a task is sending. A dict is set rather than
+# the values, so a response received in a task spawned by gql, e.g. for a timeout, still reaches it.
+_response = contextvars.ContextVar('hashnode_response', default=None)
+
+
+async def _keep_response(session, context, params):
+    response = _response.get()
+    if response is not None:
+        response['status'] = params.response.status
+        response['headers'] = params.response.headers
+
+
+class AsyncHashnodeClient:
+    # Tells resource objects that their blocking methods cannot use this client.
+    is_async = True
+
+    def __init__(self, token: str, max_concurrency: int = 10, url: str = HASHNODE_URL,
+                 transport=None, fetch_schema: bool = False, batch_size: int = 20,
+                 coalesce: bool = False, coalesce_wait: float = 0.005, retry: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None, validate: bool = None, keep_raw: bool = False):
+        """
+        Initializes an asyncio client that keeps one persistent connection pool open for all requests.
+        Resources returned by this client expose awaitable methods such as Post.aget_comments.
+        Args:
+            token (str): The token used for authorization.
+            max_concurrency (int, optional): The maximum number of requests in flight at once. Defaults to 10.
+            url (str, optional): The GraphQL endpoint. Defaults to the public Hashnode API.
+            transport (optional): A gql async transport, e.g. HTTPXAsyncTransport. Defaults to AIOHTTPTransport.
+            fetch_schema (bool, optional): Whether to introspect the live schema on connect instead of
+                using the snapshot bundled with the package. Defaults to False.
+            batch_size (int, optional): The maximum number of lookups merged into one request. Defaults to 20.
+            coalesce (bool, optional): Whether get_user/get_post/get_tag/get_publication calls made by tasks
+                within coalesce_wait seconds are deduplicated and sent as one batched request. Defaults to False.
+            coalesce_wait (float, optional): How long in seconds lookups are collected. Defaults to 0.005.
+            retry (RetryPolicy, optional): Retries queries failing with a 429, a 5xx or a connection error.
+                Defaults to a single attempt.
+            rate_limiter (RateLimiter, optional): Paces the requests of all tasks; the same limiter can be
+                shared with sync clients of the token. Defaults to no limit.
+            validate (bool, optional): Whether documents are validated before their first request. When None,
+                the package's own queries and mutations are validated against the bundled snapshot, and every
+                document when fetch_schema is set. Defaults to None.
+            keep_raw (bool, optional): Whether returned resources keep their API dictionary as their data
+                attribute. Defaults to False.
+        """
+        if not token:
+            raise ValueError("No token provided")
+        self.token = token
+        self.max_concurrency = max_concurrency
+        self.keep_raw = keep_raw
+        if transport is None:
+            try:
+                import aiohttp
+                from gql.transport.aiohttp import AIOHTTPTransport
+            except ImportError as e:
+                raise ImportError(
+                    "AsyncHashnodeClient requires aiohttp, install it with: pip install gql[aiohttp]") from e
+            # Records the response of every request, as response_headers is overwritten by concurrent tasks.
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_request_end.append(_keep_response)
+            transport = AIOHTTPTransport(url=url, headers={'Authorization': token}, ssl=True,
+                                         client_session_args={'trace_configs': [trace_config]})
+        self.transport = transport
+        self.client = Client(
+            transport=self.transport,
+            fetch_schema_from_transport=fetch_schema
+        )
+        self._session = None
+        self._connect_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.validate = validate
+        self.loaders = None
+        if coalesce:
+            self.loaders = {
+                kind: AsyncDataLoader(self._batch_fetcher(kind), wait=coalesce_wait, max_batch_size=batch_size)
+                for kind in _RESOURCES
+            }
+
+    async def connect(self):
+        """
+        Opens the persistent connection pool and fetches the schema if needed.
+        Returns:
+            AsyncClientSession: The connected gql session.
+        """
+        if self._session is None:
+            async with self._connect_lock:
+                if self._session is None:
+                    self._session = await self.client.connect_async()
+        return self._session
+
+    async def close(self):
+        """
+        Closes the connection pool.
+        """
+        async with self._connect_lock:
+            if self._session is not None:
+                await self.client.close_async()
+                self._session = None
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def get_user(self, username: str) -> User:
+        """
+        Retrieves user information using the provided username and returns a User object.
+        Args:
+            username (str): The username of the user to retrieve information for.
+        Returns:
+            User: An object representing the user's information.
+        """
+        if self.loaders:
+            return await self.loaders['user'].load(username)
+        query = user_info
+        variables = {'username': username}
+        data = await self.fetch_data(query=query, variables=variables)
+        return User(data['user'], self)
+
+    async def get_publication(self, host_url: str = None, host_id: str = None) -> Publication:
+        """
+        Fetches publication information for a given host or id.
+        Args:
+            host_url (str): The host for which the publication information is to be fetched.
+            host_id (str): The id for which the publication information is to be fetched.
+        Returns:
+            Publication: The publication information for the given host or id.
+        """
+        if self.loaders and host_url and not host_id:
+            return await self.loaders['publication'].load(host_url)
+        query = publication_info
+        if host_id:
+            variables = {'id': host_id}
+        elif host_url:
+            variables = {'host': host_url}
+        else:
+            raise ValueError("Either host or id must be provided")
+        data = await self.fetch_data(query=query, variables=variables)
+        return Publication(data['publication'], self)
+
+    async def get_post(self, post_id: str, fields: list[str] = None) -> Post:
+        """
+        Fetches post information for a given post id.
+        Args:
+            post_id (str): The id for which the post information is to be fetched.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+        Returns:
+            Post: The post information for the given post id.
+        """
+        if self.loaders and not fields:
+            return await self.loaders['post'].load(post_id)
+        query = post_info
+        if fields:
+            query = project_query(post_info, ('post',), select_fields(Post.FIELDS, fields))
+        variables = {'id': post_id}
+        data = await self.fetch_data(query=query, variables=variables)
+        return Post(data['post'], self)
+
+    async def get_tag(self, tag_slug: str) -> Tag:
+        """
+        Fetches tag information for a given tag slug.
+        Args:
+            tag_slug (str): The slug for which the tag information is to be fetched.
+        Returns:
+            Tag: The tag information for the given tag slug.
+        """
+        if self.loaders:
+            return await self.loaders['tag'].load(tag_slug)
+        query = tag_info
+        variables = {'slug': tag_slug}
+        data = await self.fetch_data(query=query, variables=variables)
+        return Tag(data['tag'], self)
+
+    async def get_followers(self, username: str, page_size: int, page_number: int,
+                            fields: list[str] = None) -> Followers:
+        """
+        Retrieves followers for a user based on the specified page size and page number.
+        Args:
+            username (str): The username of the user to retrieve followers for.
+            page_size (int): The number of followers to retrieve per page.
+            page_number (int): The page number to retrieve.
+            fields (list[str], optional): The User attributes to fetch for each follower. Defaults to all.
+        Returns:
+            Followers: A followers objects representing the followers of the specified user.
+        """
+        query = followers_info
+        if fields:
+            query = project_query(followers_info, ('user', 'followers', 'nodes'), select_fields(User.FIELDS, fields))
+        variables = {'username': username, 'pageSize': page_size, 'page': page_number}
+        data = await self.fetch_data(query=query, variables=variables)
+        users = [User(i, self) for i in data['user']['followers']['nodes']]
+        return Followers(users, data['user']['followers']['pageInfo'], self)
+
+    async def get_follows(self, username: str, page_size: int, page_number: int) -> Follows:
+        """
+        Retrieves follows for a user based on the specified page size and page number.
+        Args:
+            username (str): The username of the user to retrieve follows for.
+            page_size (int): The number of follows to retrieve per page.
+            page_number (int): The page number to retrieve.
+        Returns:
+            Follows: A follows objects representing the follows of the specified user.
+        """
+        query = follows_info
+        variables = {'username': username, 'pageSize': page_size, 'page': page_number}
+        data = await self.fetch_data(query=query, variables=variables)
+        users = [User(i, self) for i in data['user']['follows']['nodes']]
+        return Follows(users, data['user']['follows']['pageInfo'], self)
+
+    async def get_feed(self, number_of_posts: int,
+                       feed_type: str = None,
+                       min_reading_time: int = None,
+                       max_reading_time: int = None,
+                       tags_id: list = None,
+                       fields: list[str] = None) -> list[Post]:
+        """
+        Retrieves posts from the feed.
+        Args:
+            number_of_posts (int): The number of posts to retrieve.
+            feed_type (str, optional): The type of feed to retrieve. Defaults to None.
+            min_reading_time (int, optional): The minimum reading time of the posts. Defaults to None.
+            max_reading_time (int, optional): The maximum reading time of the posts. Defaults to None.
+            tags_id (list, optional): The list of tag ids to retrieve. Defaults to None.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+        Returns:
+            list: A list of Post objects.
+        """
+        query = feed
+        if fields:
+            query = project_query(feed, ('feed', 'edges', 'node'), select_fields(Post.FIELDS, fields))
+        variables = _feed_variables(number_of_posts, feed_type, min_reading_time, max_reading_time, tags_id)
+        data = await self.fetch_data(query=query, variables=variables)
+        return [Post(i['node'], self) for i in data['feed']['edges']]
+
+    def _batch_fetcher(self, kind: str):
+        async def fetch(keys: list) -> dict:
+            query, variables = batch_query(kind, keys)
+            try:
+                data = await self.fetch_data(query=query, variables=variables)
+            except TransportQueryError as e:
+                if not e.data:
+                    raise
+                return _batch_results(kind, keys, e.data, self, e.errors)
+            return _batch_results(kind, keys, data, self)
+        return fetch
+
+    async def fetch_data(self, query: str, variables: dict = None, retry_mutation: bool = False) -> dict:
+        """
+        Fetches data from the GraphQL API, waiting for a free slot when max_concurrency requests are in flight.
+        Args:
+            query (str): The query to be executed.
+            variables (dict, optional): The variables used in the query.
+            retry_mutation (bool, optional): Mark a mutation as safe to retry under the retry policy.
+        Returns:
+            dict: The data returned from the query.
+        """
+        if not variables:
+            variables = {}
+
+        document = documents.parse(query)
+        await self.connect()
+        if self.validate or (self.validate is None and (self.client.fetch_schema_from_transport
+                                                         or documents.is_own(query))):
+            documents.validate(document, self.client.schema or load_schema())
+
+        if self.retry is None:
+            return await self._execute(document, variables)
+        operation_type, operation = operation_of(document)
+        return await self.retry.acall(
+            lambda: self._execute(document, variables), operation_type, operation, retry_mutation)
+
+    async def _execute(self, document, variables: dict) -> dict:
+        response = {}
+        token = _response.set(response)
+        if self.rate_limiter is not None:
+            await self.rate_limiter.aacquire()
+        try:
+            async with self._semaphore:
+                result = await self.transport.execute(document, variable_values=variables)
+        except TransportServerError as e:
+            e.retry_after = retry_after(response.get('headers'))
+            if self.rate_limiter is not None and e.code == 429:
+                self.rate_limiter.throttle(e.retry_after)
+            raise
+        finally:
+            _response.reset(token)
+            if self.rate_limiter is not None:
+                self.rate_limiter.arelease()
+        status = response.get('status')
+        if self.rate_limiter is not None:
+            # A 429 with a GraphQL error body returns a result, so the status is read from this request's response.
+            if status == 429:
+                self.rate_limiter.throttle(retry_after(response.get('headers')))
+            elif status is None or status < 400:
+                self.rate_limiter.observe(response.get('headers'))
+        if result.errors:
+            error = TransportQueryError(
+                str(result.errors[0]),
+                errors=result.errors,
+                data=result.data,
+                extensions=result.extensions,
+            )
+            # GraphQL errors sent with a 429 or 5xx status carry it, so they are retried like plain-text ones.
+            if status is not None and status >= 400:
+                error.code = status
+                error.retry_after = retry_after(response.get('headers'))
+            raise error
+        return result.data
@@ -0,0 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BulkResult(list):
+    def __init__(self, keys: list, results: list, errors: dict):
+        """
+        A list of fetched objects in the order of the requested keys.
+        Keys that failed hold None and their exception is kept in errors.
+        Args:
+            keys (list): The requested keys.
+            results (list): The fetched objects, None where the fetch failed.
+            errors (dict): The exception raised for each failed key.
+        """
+        super(BulkResult, self).__init__(results)
+        self.keys = keys
+        self.errors = errors
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every key was fetched successfully.
+        """
+        return not self.errors
+
+    def items(self) -> list:
+        """
+        Returns the (key, object) pairs in the order of the requested keys.
+        """
+        return list(zip(self.keys, self))
+
+
+def fetch_bulk(fetch_many, keys: list, max_workers: int, batch_size: int = 1) -> BulkResult:
+    """
+    Splits the distinct keys into batches and calls fetch_many once per batch on a thread pool.
+    Args:
+        fetch_many: A callable taking a list of keys and returning a dict of key to object or exception.
+        keys (list): The keys to fetch. Duplicates are fetched once.
+        max_workers (int): The maximum number of threads.
+        batch_size (int, optional): The number of keys passed to each fetch_many call. Defaults to 1.
+    Returns:
+        BulkResult: The fetched objects in the order of keys.
+    """
+    keys = list(keys)
+    unique = list(dict.fromkeys(keys))
+    batches = [unique[i:i + batch_size] for i in range(0, len(unique), batch_size)]
+    fetched = {}
+    errors = {}
+    if batches:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+            futures = [(batch, executor.submit(fetch_many, batch)) for batch in batches]
+        for batch, future in futures:
+            try:
+                results = future.result()
+            except Exception as e:
+                results = {key: e for key in batch}
+            for key in batch:
+                result = results.get(key)
+                if isinstance(result, Exception):
+                    errors[key] = result
+                else:
+                    fetched[key] = result
+    return BulkResult(keys, [fetched.get(key) for key in keys], errors)
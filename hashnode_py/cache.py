@@ -0,0 +1,350 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+from hashnode_py.queries.invalidation import ANY
+
+
+def cache_key(query: str, variables: dict = None, token: str = '') -> str:
+    """
+    Returns the cache key of a request, ignoring whitespace differences in the query.
+    Args:
+        query (str): The GraphQL query text.
+        variables (dict, optional): The variables used in the query.
+        token (str, optional): The token of the client, since responses depend on the viewer.
+    Returns:
+        str: A hex digest identifying the request.
+    """
+    normalized = ' '.join(query.split())
+    payload = json.dumps([token, normalized, variables or {}], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def content_digest(value: dict) -> str:
+    """
+    Returns a digest of a response, used to tell whether a refreshed response changed.
+    Args:
+        value (dict): The response data.
+    Returns:
+        str: A hex digest of the response content.
+    """
+    return _digest(_dumps(value))
+
+
+def _dumps(value: dict) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _digest(payload: str) -> str:
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def matches(variables: dict, match: dict = None) -> bool:
+    """
+    Whether the variables of a cached request satisfy an invalidation match.
+    Args:
+        variables (dict): The variables of the cached request.
+        match (dict, optional): The required variable values; ANY matches any variable. None matches everything.
+    Returns:
+        bool: True if the entry should be invalidated.
+    """
+    if match is None:
+        return True
+    for name, value in match.items():
+        if name == ANY:
+            if value not in variables.values():
+                return False
+        elif variables.get(name) != value:
+            return False
+    return True
+
+
+class CacheStats:
+    def __init__(self):
+        """
+        Counters of a response cache.
+        """
+        super(CacheStats, self).__init__()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.stale_hits = 0
+        self.refresh_errors = 0
+
+    def as_dict(self) -> dict:
+        """
+        Returns the counters and the hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'sets': self.sets,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'invalidations': self.invalidations,
+            'stale_hits': self.stale_hits,
+            'refresh_errors': self.refresh_errors,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
+
+
+class ResponseCache(ABC):
+    def __init__(self, default_ttl: float = 300, ttls: dict = None, stale_ttl: float = 0):
+        """
+        The base class of response caches used by HashnodeClient.fetch_data.
+        Args:
+            default_ttl (float, optional): How long in seconds a response stays fresh. Defaults to 300.
+            ttls (dict, optional): Per-operation TTLs keyed by operation name, e.g. {'Feed': 60}.
+            stale_ttl (float, optional): How long in seconds an expired response may still be served
+                while it is refreshed in the background. Defaults to 0, never.
+        """
+        super(ResponseCache, self).__init__()
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.stale_ttl = stale_ttl
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+
+    def ttl_for(self, operation: str) -> float:
+        """
+        Returns the TTL of an operation.
+        """
+        return self.ttls.get(operation, self.default_ttl)
+
+    def get(self, key: str):
+        """
+        Returns the cached response of a key, or None if it is missing or past its stale window.
+        """
+        entry = self.lookup(key)
+        return None if entry is None else entry[0]
+
+    @abstractmethod
+    def lookup(self, key: str):
+        """
+        Returns the cached entry of a key.
+        Args:
+            key (str): The cache key.
+        Returns:
+            tuple: The response, its content digest and whether it is stale,
+                or None if it is missing or past its stale window.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: dict, ttl: float, operation: str = None, variables: dict = None) -> str:
+        """
+        Stores a response.
+        Args:
+            key (str): The cache key.
+            value (dict): The response data.
+            ttl (float): How long in seconds the response stays fresh.
+            operation (str, optional): The operation name, used to invalidate related entries.
+            variables (dict, optional): The variables of the request, used to invalidate related entries.
+        Returns:
+            str: The content digest of the response.
+        """
+
+    @abstractmethod
+    def touch(self, key: str, ttl: float):
+        """
+        Makes an entry fresh again without rewriting it, after a refresh found it unchanged.
+        Args:
+            key (str): The cache key.
+            ttl (float): How long in seconds the response stays fresh.
+        """
+
+    @abstractmethod
+    def invalidate(self, operation: str, match: dict = None):
+        """
+        Drops the entries of an operation whose variables satisfy match.
+        Args:
+            operation (str): The operation name of the cached query.
+            match (dict, optional): The required variable values. Defaults to every entry of the operation.
+        """
+
+    @abstractmethod
+    def clear(self):
+        """
+        Drops every entry.
+        """
+
+
+class MemoryCache(ResponseCache):
+    def __init__(self, max_entries: int = 1024, default_ttl: float = 300, ttls: dict = None,
+                 stale_ttl: float = 0):
+        """
+        An in-memory LRU response cache. Responses are stored serialized, so every lookup returns
+        a copy that callers may modify.
+        Args:
+            max_entries (int, optional): The number of entries kept before the least recently used is evicted.
+            default_ttl (float, optional): How long in seconds a response stays fresh. Defaults to 300.
+            ttls (dict, optional): Per-operation TTLs keyed by operation name, e.g. {'Feed': 60}.
+            stale_ttl (float, optional): How long in seconds an expired response may still be served
+                while it is refreshed in the background. Defaults to 0, never.
+        """
+        super(MemoryCache, self).__init__(default_ttl, ttls, stale_ttl)
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+
+    def lookup(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            now = time.time()
+            if entry[1] + self.stale_ttl <= now:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            stale = entry[1] <= now
+            if stale:
+                self.stats.stale_hits += 1
+        return json.loads(entry[0]), entry[4], stale
+
+    def set(self, key: str, value: dict, ttl: float, operation: str = None, variables: dict = None) -> str:
+        payload = _dumps(value)
+        digest = _digest(payload)
+        with self._lock:
+            self._entries[key] = (payload, time.time() + ttl, operation, dict(variables or {}), digest)
+            self._entries.move_to_end(key)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return digest
+
+    def touch(self, key: str, ttl: float):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (entry[0], time.time() + ttl) + entry[2:]
+
+    def invalidate(self, operation: str, match: dict = None):
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if entry[2] == operation and matches(entry[3], match)]
+            for key in stale:
+                del self._entries[key]
+            self.stats.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCache(ResponseCache):
+    def __init__(self, path: str, max_entries: int = 100000, default_ttl: float = 300, ttls: dict = None,
+                 stale_ttl: float = 0):
+        """
+        An on-disk LRU response cache stored in a SQLite database, shared across processes and runs.
+        Args:
+            path (str): The database file.
+            max_entries (int, optional): The number of entries kept before the least recently used is evicted.
+            default_ttl (float, optional): How long in seconds a response stays fresh. Defaults to 300.
+            ttls (dict, optional): Per-operation TTLs keyed by operation name, e.g. {'Feed': 60}.
+            stale_ttl (float, optional): How long in seconds an expired response may still be served
+                while it is refreshed in the background. Defaults to 0, never.
+        """
+        super(SQLiteCache, self).__init__(default_ttl, ttls, stale_ttl)
+        self.path = path
+        self.max_entries = max_entries
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, value TEXT, expires_at REAL, used_at REAL, operation TEXT, variables TEXT, '
+            'digest TEXT)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)')
+        # Counted once: writes keep it up to date, and it is recounted before evicting, as other
+        # processes sharing the file change it too.
+        self._size = self._count()
+
+    def _count(self) -> int:
+        return self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def lookup(self, key: str):
+        with self._lock:
+            row = self._db.execute(
+                'SELECT value, expires_at, digest FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            now = time.time()
+            if row[1] + self.stale_ttl <= now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._size -= 1
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._db.execute('UPDATE responses SET used_at = ? WHERE key = ?', (now, key))
+            self.stats.hits += 1
+            stale = row[1] <= now
+            if stale:
+                self.stats.stale_hits += 1
+            return json.loads(row[0]), row[2], stale
+
+    def set(self, key: str, value: dict, ttl: float, operation: str = None, variables: dict = None) -> str:
+        payload = _dumps(value)
+        digest = _digest(payload)
+        with self._lock:
+            now = time.time()
+            exists = self._db.execute('SELECT 1 FROM responses WHERE key = ?', (key,)).fetchone()
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, payload, now + ttl, now, operation, json.dumps(variables or {}, default=str), digest)
+            )
+            self.stats.sets += 1
+            if exists is None:
+                self._size += 1
+            if self._size > self.max_entries:
+                self._size = self._count()
+                excess = self._size - self.max_entries
+                if excess > 0:
+                    self._db.execute(
+                        'DELETE FROM responses WHERE key IN '
+                        '(SELECT key FROM responses ORDER BY used_at LIMIT ?)', (excess,)
+                    )
+                    self._size -= excess
+                    self.stats.evictions += excess
+        return digest
+
+    def touch(self, key: str, ttl: float):
+        with self._lock:
+            self._db.execute('UPDATE responses SET expires_at = ? WHERE key = ?', (time.time() + ttl, key))
+
+    def invalidate(self, operation: str, match: dict = None):
+        with self._lock:
+            rows = self._db.execute('SELECT key, variables FROM responses WHERE operation = ?', (operation,))
+            stale = [(key,) for key, variables in rows.fetchall() if matches(json.loads(variables), match)]
+            self._db.executemany('DELETE FROM responses WHERE key = ?', stale)
+            self._size -= len(stale)
+            self.stats.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._size = 0
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._db.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._count()
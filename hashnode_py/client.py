@@ -1,9 +1,12 @@
-from gql import Client, gql
-from gql.transport.requests import RequestsHTTPTransport
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from gql.transport.exceptions import TransportQueryError
 
 from hashnode_py.resources.user import User
 from hashnode_py.resources.publication import Publication
-from hashnode_py.resources.post import Post
+from hashnode_py.resources.post import Post, build_posts, list_selection
 from hashnode_py.resources.tag import Tag
 from hashnode_py.resources.follow import Follows, Followers
 from hashnode_py.queries.user_queries import user_info
@@ -11,30 +14,94 @@ from hashnode_py.queries.post_queries import post_info, feed
 from hashnode_py.queries.publication_queries import publication_info
 from hashnode_py.queries.follow_queries import follows_info, followers_info
 from hashnode_py.queries.tag_queries import tag_info
+from hashnode_py.queries.builder import batch_query, project_query
+from hashnode_py.queries.persisted import persisted_hashes
+from hashnode_py.queries.cost import DEFAULT_BUDGET, estimate, items_within
+from hashnode_py.queries.invalidation import invalidations
+from hashnode_py.resources.fields import select_fields
+from hashnode_py.bulk import BulkResult, fetch_bulk
+from hashnode_py.cache import ResponseCache, cache_key, content_digest
+from hashnode_py.documents import documents, operation_of
+from hashnode_py.instrumentation import RequestEvent, RequestHooks
+from hashnode_py.loader import DataLoader
+from hashnode_py.mirror import sync_publication
+from hashnode_py.profiling import Profiler
+from hashnode_py.pagination import Paginator, cursor_page, offset_page
+from hashnode_py.ratelimit import RateLimiter
+from hashnode_py.retry import RetryPolicy
+from hashnode_py.session import HashnodeSession, get_session
 
 
 class HashnodeClient:
-    def __init__(self, token: str):
+    def __init__(self, token: str, session: HashnodeSession = None, max_workers: int = 8,
+                 batch_size: int = 20, coalesce: bool = False, coalesce_wait: float = 0.005,
+                 cache: ResponseCache = None, retry: RetryPolicy = None, rate_limiter: RateLimiter = None,
+                 max_cost: int = DEFAULT_BUDGET, persisted_queries: bool = None, validate: bool = None,
+                 hooks: list[RequestHooks] = None, keep_raw: bool = False):
         """
-        Initializes the class with a token and sets up the client with the provided token for API requests.
+        Initializes the class with a token and attaches the shared session of that token.
+        Every client created with the same token reuses one pooled transport and one fetched schema.
         :param token: Str - the token used for authorization
+        :param session: HashnodeSession - an explicit session to use instead of the shared one
+        :param max_workers: Int - the number of threads used by the bulk get_* methods
+        :param batch_size: Int - the number of lookups merged into one request by the bulk get_* methods
+        :param coalesce: Bool - whether concurrent get_user/get_post/get_tag/get_publication calls
+            made within coalesce_wait seconds are deduplicated and sent as one batched request
+        :param coalesce_wait: Float - how long in seconds lookups are collected before being sent
+        :param cache: ResponseCache - a MemoryCache or SQLiteCache used for queries, never for mutations.
+            With a stale_ttl, get_user and get_publication return stale entries immediately and refresh
+            them in the background
+        :param retry: RetryPolicy - retries queries failing with a 429, a 5xx or a connection error,
+            with backoff; its stats count the retries. Mutations are only retried when marked safe
+        :param rate_limiter: RateLimiter - paces the requests of the token; it is attached to the session,
+            so every client and thread sharing the token shares it
+        :param max_cost: Int - the estimated cost (see hashnode_py.queries.cost) a single request stays within;
+            larger get_feed calls and bulk lookups are split into several requests
+        :param persisted_queries: Bool - send the SHA-256 hash of each document instead of its text,
+            falling back to the full text when the server has not seen it yet; the transport's own setting
+            is used when None. Other clients sharing the token are not affected
+        :param validate: Bool - whether documents are validated against the schema before their first request.
+            When None, the package's own queries and mutations are validated against the bundled snapshot,
+            and every document when the session introspects the live schema
+        :param hooks: List - RequestHooks receiving the operation, sizes, timings and retry count of every
+            request sent, e.g. a SpanEmitter or a MetricsCollector from hashnode_py.instrumentation
+        :param keep_raw: Bool - keep the API dictionary of every returned User, Post, Tag, ... as its data
+            attribute. Off by default, so the dictionaries are freed once the objects are built
         :return: None
         """
         if not token:
             raise ValueError("No token provided")
         self.token = token
-        headers = {
-            'Authorization': self.token
-        }
-        _transport = RequestsHTTPTransport(
-            url='https://gql.hashnode.com/',
-            headers=headers,
-            use_json=True,
-        )
-        self.client = Client(
-            transport=_transport,
-            fetch_schema_from_transport=True
-        )
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_cost = max_cost
+        self.keep_raw = keep_raw
+        self._batch_sizes = {}
+        self.session = session or get_session(token, pool_size=max(10, max_workers), rate_limiter=rate_limiter)
+        if session is not None and rate_limiter is not None:
+            session.rate_limiter = rate_limiter
+        self.persisted_queries = persisted_queries
+        if persisted_queries:
+            persisted_hashes()
+        self.validate = validate
+        self.client = self.session.client
+        self.cache = cache
+        self.retry = retry
+        self.hooks = list(hooks or ())
+        if self.hooks and hasattr(self.session.transport, 'pop_responses'):
+            self.session.transport.record_responses = True
+        self.loaders = None
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._refresher = None
+        # Bumped by every invalidation, so a refresh started before it does not write back stale data.
+        self._generation = 0
+        self._objects = OrderedDict()
+        if coalesce:
+            self.loaders = {
+                kind: DataLoader(self._batch_fetcher(kind), wait=coalesce_wait, max_batch_size=self._batch_size(kind))
+                for kind in _RESOURCES
+            }
 
     def get_user(self, username: str) -> User:
         """
@@ -44,11 +111,11 @@ class HashnodeClient:
         Returns:
             User: An object representing the user's information.
         """
+        if self.loaders:
+            return self.loaders['user'].load(username)
         query = user_info
         variables = {'username': username}
-        data = self.fetch_data(query=query, variables=variables)
-        data = data['user']
-        user = User(data, HashnodeClient(self.token))
+        user = self._fetch_object(query, variables, 'user', User)
         return user
 
     def get_publication(self, host_url: str = None, host_id: str = None) -> Publication:
@@ -60,6 +127,8 @@ class HashnodeClient:
         Returns:
             Publication: The publication information for the given host or id.
         """
+        if self.loaders and host_url and not host_id:
+            return self.loaders['publication'].load(host_url)
         query = publication_info
         if host_id:
             variables = {'id': host_id}
@@ -67,24 +136,27 @@ class HashnodeClient:
             variables = {'host': host_url}
         else:
             raise ValueError("Either host or id must be provided")
-        data = self.fetch_data(query=query, variables=variables)
-        data = data['publication']
-        publication = Publication(data, HashnodeClient(self.token))
+        publication = self._fetch_object(query, variables, 'publication', Publication)
         return publication
 
-    def get_post(self, post_id: str) -> Post:
+    def get_post(self, post_id: str, fields: list[str] = None) -> Post:
         """
         Fetches post information for a given post id.
         Args:
             post_id (str): The id for which the post information is to be fetched.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
         Returns:
             Post: The post information for the given post id.
         """
+        if self.loaders and not fields:
+            return self.loaders['post'].load(post_id)
         query = post_info
+        if fields:
+            query = project_query(post_info, ('post',), select_fields(Post.FIELDS, fields))
         variables = {'id': post_id}
         data = self.fetch_data(query=query, variables=variables)
         data = data['post']
-        post = Post(data, HashnodeClient(self.token))
+        post = Post(data, self)
         return post
 
     def get_tag(self, tag_slug: str) -> Tag:
@@ -95,30 +167,36 @@ class HashnodeClient:
         Returns:
             Tag: The tag information for the given tag slug.
         """
+        if self.loaders:
+            return self.loaders['tag'].load(tag_slug)
         query = tag_info
         variables = {'slug': tag_slug}
         data = self.fetch_data(query=query, variables=variables)
         data = data['tag']
-        tag = Tag(data, HashnodeClient(self.token))
+        tag = Tag(data, self)
         return tag
 
-    def get_followers(self, username: str, page_size: int, page_number: int) -> Followers:
+    def get_followers(self, username: str, page_size: int, page_number: int,
+                      fields: list[str] = None) -> Followers:
         """
         Retrieves followers for a user based on the specified page size and page number.
         Args:
             username (str): The username of the user to retrieve followers for.
             page_size (int): The number of followers to retrieve per page.
             page_number (int): The page number to retrieve.
+            fields (list[str], optional): The User attributes to fetch for each follower. Defaults to all.
         Returns:
             Followers: A followers objects representing the followers of the specified user.
         """
         query = followers_info
+        if fields:
+            query = project_query(followers_info, ('user', 'followers', 'nodes'), select_fields(User.FIELDS, fields))
         variables = {'username': username, 'pageSize': page_size, 'page': page_number}
         data = self.fetch_data(query=query, variables=variables)
         nodes = data['user']['followers']['nodes']
-        users = [User(i, HashnodeClient(self.token)) for i in nodes]
+        users = [User(i, self) for i in nodes]
         page_info = data['user']['followers']['pageInfo']
-        result = Followers(users, page_info, HashnodeClient(self.token))
+        result = Followers(users, page_info, self)
         return result
 
     def get_follows(self, username: str, page_size: int, page_number: int) -> Follows:
@@ -135,82 +213,510 @@ class HashnodeClient:
         variables = {'username': username, 'pageSize': page_size, 'page': page_number}
         data = self.fetch_data(query=query, variables=variables)
         nodes = data['user']['follows']['nodes']
-        users = [User(i, HashnodeClient(self.token)) for i in nodes]
+        users = [User(i, self) for i in nodes]
         page_info = data['user']['follows']['pageInfo']
-        result = Follows(users, page_info, HashnodeClient(self.token))
+        result = Follows(users, page_info, self)
         return result
 
     def get_feed(self, number_of_posts: int,
                  feed_type: str = None,
                  min_reading_time: int = None,
                  max_reading_time: int = None,
-                 tags_id: list = None) -> list[Post]:
+                 tags_id: list = None,
+                 fields: list[str] = None,
+                 lazy_content: bool = True) -> list[Post]:
         """
         Retrieves posts for a user based on the specified page size and page number.
         Args:
-            number_of_posts (int): The number of posts to retrieve.
+            number_of_posts (int): The number of posts to retrieve. Requests estimated to cost more than
+                max_cost are split into several pages.
             feed_type (str, optional): The type of feed to retrieve. Defaults to None.
             min_reading_time (int, optional): The minimum reading time of the posts. Defaults to None.
             max_reading_time (int, optional): The maximum reading time of the posts. Defaults to None.
             tags_id (list, optional): The list of tag ids to retrieve. Defaults to None.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+            lazy_content (bool, optional): Whether the content of the posts is only fetched when first read,
+                unless content is listed in fields. Defaults to True.
         Returns:
             list: A list of dictionaries containing Post objects.
         """
         query = feed
-        variables = None
+        keep, lazy = list_selection(fields, lazy_content)
+        if keep:
+            query = project_query(feed, ('feed', 'edges', 'node'), keep)
+        page_size = items_within(lambda n: estimate(query, {'first': n}), self.max_cost, maximum=50)
+        if number_of_posts > page_size:
+            pages = self.iter_feed(page_size, feed_type, min_reading_time, max_reading_time, tags_id,
+                                   fields, lazy_content, limit=number_of_posts)
+            return list(pages.prefetch(1))
+        variables = _feed_variables(number_of_posts, feed_type, min_reading_time, max_reading_time, tags_id)
+        data = self.fetch_data(query=query, variables=variables)
+        edges = data['feed']['edges']
+        result = build_posts([i['node'] for i in edges], self, lazy, self.batch_size)
+        return result
 
-        if number_of_posts > 50:
-            raise ValueError("Number of posts must be less than 50")
+    def iter_feed(self, page_size: int = 20,
+                  feed_type: str = None,
+                  min_reading_time: int = None,
+                  max_reading_time: int = None,
+                  tags_id: list = None,
+                  fields: list[str] = None,
+                  lazy_content: bool = True,
+                  limit: int = None,
+                  stop=None) -> Paginator:
+        """
+        Iterates over the feed, following the cursor one page at a time.
+        Args:
+            page_size (int, optional): The number of posts fetched per request, at most 50. Defaults to 20.
+            feed_type (str, optional): The type of feed to retrieve. Defaults to None.
+            min_reading_time (int, optional): The minimum reading time of the posts. Defaults to None.
+            max_reading_time (int, optional): The maximum reading time of the posts. Defaults to None.
+            tags_id (list, optional): The list of tag ids to retrieve. Defaults to None.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+            lazy_content (bool, optional): Whether the content of the posts is only fetched when first read,
+                unless content is listed in fields. Defaults to True.
+            limit (int, optional): The maximum number of posts to yield. Defaults to the whole feed.
+            stop (optional): A callable receiving each Post; iteration ends when it returns True.
+        Returns:
+            Paginator: An iterable of Post objects.
+        """
+        query = feed
+        keep, lazy = list_selection(fields, lazy_content)
+        if keep:
+            query = project_query(feed, ('feed', 'edges', 'node'), keep)
+        variables = _feed_variables(page_size, feed_type, min_reading_time, max_reading_time, tags_id)
 
-        if feed_type:
-            feed_type = feed_type.upper()
-            variables = {
-                "first": number_of_posts,
-                "type": feed_type
-            }
+        def fetch_page(after):
+            data = self.fetch_data(query=query, variables={**variables, 'after': after})
+            return cursor_page(data['feed'])
 
-        if min_reading_time:
-            variables = {
-                "first": number_of_posts,
-                "minReadTime": min_reading_time
-            }
+        return Paginator(fetch_page, lambda nodes: build_posts(nodes, self, lazy, self.batch_size),
+                         limit=limit, stop=stop, fields=Post.FIELDS)
 
-        if max_reading_time:
-            variables = {
-                "first": number_of_posts,
-                "maxReadTime": max_reading_time
-            }
+    def iter_followers(self, username: str, page_size: int = 20, fields: list[str] = None,
+                       limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all followers of a user, one page at a time.
+        Args:
+            username (str): The username of the user to retrieve followers for.
+            page_size (int, optional): The number of followers fetched per request. Defaults to 20.
+            fields (list[str], optional): The User attributes to fetch for each follower. Defaults to all.
+            limit (int, optional): The maximum number of followers to yield. Defaults to all.
+            stop (optional): A callable receiving each User; iteration ends when it returns True.
+        Returns:
+            Paginator: An iterable of User objects.
+        """
+        query = followers_info
+        if fields:
+            query = project_query(followers_info, ('user', 'followers', 'nodes'), select_fields(User.FIELDS, fields))
 
-        if tags_id:
-            variables = {
-                "first": number_of_posts,
-                "tags": tags_id
-            }
+        def fetch_page(page):
+            variables = {'username': username, 'pageSize': page_size, 'page': page}
+            data = self.fetch_data(query=query, variables=variables)
+            return offset_page(data['user']['followers'])
 
-        if not feed_type and not min_reading_time and not max_reading_time and not tags_id:
-            variables = {
-                "first": number_of_posts
-            }
+        return Paginator(fetch_page, lambda nodes: [User(i, self) for i in nodes], cursor=1, limit=limit, stop=stop,
+                         fields=User.FIELDS)
 
-        data = self.fetch_data(query=query, variables=variables)
-        edges = data['feed']['edges']
-        nodes = [Post(i['node'], self.client) for i in edges]
-        result = [node for node in nodes]
-        return result
+    def iter_follows(self, username: str, page_size: int = 20, limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all users followed by a user, one page at a time.
+        Args:
+            username (str): The username of the user to retrieve follows for.
+            page_size (int, optional): The number of users fetched per request. Defaults to 20.
+            limit (int, optional): The maximum number of users to yield. Defaults to all.
+            stop (optional): A callable receiving each User; iteration ends when it returns True.
+        Returns:
+            Paginator: An iterable of User objects.
+        """
+        def fetch_page(page):
+            variables = {'username': username, 'pageSize': page_size, 'page': page}
+            data = self.fetch_data(query=follows_info, variables=variables)
+            return offset_page(data['user']['follows'])
+
+        return Paginator(fetch_page, lambda nodes: [User(i, self) for i in nodes], cursor=1, limit=limit, stop=stop,
+                         fields=User.FIELDS)
+
+    def get_users(self, usernames: list[str], max_workers: int = None) -> BulkResult:
+        """
+        Retrieves many users concurrently, batch_size lookups per request.
+        Args:
+            usernames (list): The usernames of the users to retrieve.
+            max_workers (int, optional): The number of threads to use. Defaults to the client max_workers.
+        Returns:
+            BulkResult: The User objects in the order of usernames, with per-username errors in .errors.
+        """
+        return self._fetch_bulk('user', usernames, max_workers)
+
+    def get_publications(self, hosts: list[str], max_workers: int = None) -> BulkResult:
+        """
+        Fetches many publications concurrently by host, batch_size lookups per request.
+        Args:
+            hosts (list): The hosts of the publications to fetch.
+            max_workers (int, optional): The number of threads to use. Defaults to the client max_workers.
+        Returns:
+            BulkResult: The Publication objects in the order of hosts, with per-host errors in .errors.
+        """
+        return self._fetch_bulk('publication', hosts, max_workers)
+
+    def get_posts(self, post_ids: list[str], max_workers: int = None) -> BulkResult:
+        """
+        Fetches many posts concurrently, batch_size lookups per request.
+        Args:
+            post_ids (list): The ids of the posts to fetch.
+            max_workers (int, optional): The number of threads to use. Defaults to the client max_workers.
+        Returns:
+            BulkResult: The Post objects in the order of post_ids, with per-id errors in .errors.
+        """
+        return self._fetch_bulk('post', post_ids, max_workers)
+
+    def get_tags(self, tag_slugs: list[str], max_workers: int = None) -> BulkResult:
+        """
+        Fetches many tags concurrently, batch_size lookups per request.
+        Args:
+            tag_slugs (list): The slugs of the tags to fetch.
+            max_workers (int, optional): The number of threads to use. Defaults to the client max_workers.
+        Returns:
+            BulkResult: The Tag objects in the order of tag_slugs, with per-slug errors in .errors.
+        """
+        return self._fetch_bulk('tag', tag_slugs, max_workers)
+
+    def sync_publication(self, host: str, store_path: str, drafts: bool = True, comments: bool = True) -> dict:
+        """
+        Creates or updates a local SQLite mirror of the posts, drafts and comments of a publication.
+        After the first run only posts updated since the last sync have their content fetched.
+        Args:
+            host (str): The host of the publication, e.g. 'blog.hashnode.dev'.
+            store_path (str): The SQLite database file of the mirror, queried with hashnode_py.mirror.Mirror.
+            drafts (bool, optional): Whether to mirror the drafts. Defaults to True.
+            comments (bool, optional): Whether to mirror the comments. Defaults to True.
+        Returns:
+            dict: The number of posts listed, fetched and removed, and of comments and drafts stored.
+        """
+        return sync_publication(self, host, store_path, drafts=drafts, comments=comments)
 
-    def fetch_data(self, query: str, variables: dict = None) -> dict:
+    def _batch_fetcher(self, kind: str):
+        return lambda keys: self._fetch_batch(kind, keys)
+
+    def _batch_size(self, kind: str) -> int:
+        """
+        Returns how many lookups of a kind fit in one request, at most batch_size and within max_cost.
+        """
+        if kind not in self._batch_sizes:
+            self._batch_sizes[kind] = items_within(
+                lambda n: estimate(batch_query(kind, range(n))[0]), self.max_cost, maximum=self.batch_size)
+        return self._batch_sizes[kind]
+
+    def _fetch_bulk(self, kind: str, keys: list, max_workers: int = None) -> BulkResult:
+        return fetch_bulk(
+            self._batch_fetcher(kind),
+            keys,
+            max_workers or self.max_workers,
+            self._batch_size(kind)
+        )
+
+    def _fetch_batch(self, kind: str, keys: list) -> dict:
+        """
+        Looks up many entities of one kind in a single aliased request.
+        Args:
+            kind (str): One of 'post', 'user', 'tag' or 'publication'.
+            keys (list): The ids, usernames, slugs or hosts to look up.
+        Returns:
+            dict: The resource object, or the exception explaining its absence, for each key.
+        """
+        query, variables = batch_query(kind, keys)
+        try:
+            data = self.fetch_data(query=query, variables=variables)
+        except TransportQueryError as e:
+            if not e.data:
+                raise
+            return _batch_results(kind, keys, e.data, self, e.errors)
+        return _batch_results(kind, keys, data, self)
+
+    def _fetch_object(self, query: str, variables: dict, field: str, resource):
+        """
+        Fetches a resource with stale-while-revalidate, reusing the object built from an identical response.
+        Args:
+            query (str): The GraphQL query text.
+            variables (dict): The variables used in the query.
+            field (str): The root field holding the resource data.
+            resource: The resource class, e.g. User.
+        Returns:
+            The resource object.
+        """
+        response, digest = self._fetch(query, variables, revalidate=True)
+        if digest is None:
+            return resource(response[field], self)
+        with self._lock:
+            obj = self._objects.get(digest)
+            if obj is not None:
+                self._objects.move_to_end(digest)
+                return obj
+        obj = resource(response[field], self)
+        with self._lock:
+            self._objects[digest] = obj
+            while len(self._objects) > _REUSED_OBJECTS:
+                self._objects.popitem(last=False)
+        return obj
+
+    def fetch_data(self, query: str, variables: dict = None, use_cache: bool = True,
+                   revalidate: bool = False, retry_mutation: bool = False) -> dict:
         """
         Fetches data from the GraphQL API using the provided variables, headers, and query.
+        Query results are served from and stored in the client cache, if any; mutations never are,
+        and a successful mutation evicts the cached queries it makes stale.
         :param variables: Dict - the variables used in the query
         :param query: Str - the query to be executed
+        :param use_cache: Bool - set to False to bypass the cache for this request
+        :param revalidate: Bool - serve a stale cached response within the cache's stale_ttl
+            and refresh it in the background
+        :param retry_mutation: Bool - mark a mutation as safe to retry under the client's retry policy
         :return: Dict - the data returned from the query
         """
+        return self._fetch(query, variables, use_cache, revalidate, retry_mutation)[0]
+
+    def _fetch(self, query: str, variables: dict = None, use_cache: bool = True,
+               revalidate: bool = False, retry_mutation: bool = False) -> tuple[dict, str]:
         if not variables:
             variables = {}
 
-        response = self.client.execute(
-            document=gql(query),
-            variable_values=variables
-        )
+        document = documents.parse(query)
+        key = None
+        operation_type, operation = operation_of(document)
+        if self.cache is not None and use_cache:
+            if operation_type == 'query':
+                key = cache_key(query, variables, self.token)
+                entry = self.cache.lookup(key)
+                if entry is not None:
+                    cached, digest, stale = entry
+                    if not stale:
+                        return cached, digest
+                    if revalidate:
+                        self._revalidate(key, document, variables, operation, digest, self._validates(query))
+                        return cached, digest
+
+        response = self._execute(document, variables, operation_type, operation, retry_mutation,
+                                 self._validates(query))
+
+        digest = None
+        if key is not None:
+            digest = self.cache.set(key, response, self.cache.ttl_for(operation), operation, variables)
+        elif self.cache is not None and operation_type == 'mutation':
+            self.invalidate(operation, variables)
+        return response, digest
+
+    def _validates(self, query: str) -> bool:
+        """
+        Whether a document is validated: the snapshot bundled with the package only covers what the package
+        itself sends, so other documents are left to the server unless the live schema is introspected.
+        """
+        if self.validate is not None:
+            return self.validate
+        return self.session.introspects or documents.is_own(query)
+
+    def _execute(self, document, variables: dict, operation_type: str, operation: str, safe: bool = False,
+                 validate: bool = False) -> dict:
+        def execute():
+            return self.session.execute(document=document, variables=variables, validate=validate,
+                                        persisted_queries=self.persisted_queries)
 
+        if not self.hooks:
+            return self._send(execute, operation_type, operation, safe)
+        event = RequestEvent(operation_type, operation, variables)
+        for hook in self.hooks:
+            hook.on_request_start(event)
+        pop_responses = getattr(self.session.transport, 'pop_responses', None)
+
+        def attempt():
+            event.attempts += 1
+            if pop_responses is not None:
+                pop_responses()
+            try:
+                return execute()
+            finally:
+                if pop_responses is not None:
+                    event.record(pop_responses())
+
+        try:
+            response = self._send(attempt, operation_type, operation, safe)
+        except Exception as e:
+            event.finish(e)
+            for hook in self.hooks:
+                hook.on_error(event, e)
+            raise
+        event.finish()
+        for hook in self.hooks:
+            hook.on_response(event)
         return response
+
+    def _send(self, execute, operation_type: str, operation: str, safe: bool = False) -> dict:
+        if self.retry is None:
+            return execute()
+        return self.retry.call(execute, operation_type, operation, safe)
+
+    def _revalidate(self, key: str, document, variables: dict, operation: str, digest: str, validate: bool):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresher is None:
+                self._refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix='hashnode-refresh')
+            generation = self._generation
+        future = self._refresher.submit(
+            self._refresh, key, document, variables, operation, digest, validate, generation)
+        future.add_done_callback(self._refreshed)
+
+    def _refresh(self, key: str, document, variables: dict, operation: str, digest: str, validate: bool,
+                 generation: int):
+        """
+        Refetches a stale entry, only rewriting it when its content changed and no mutation
+        invalidated the cache since the refresh started.
+        """
+        try:
+            response = self._execute(document, variables, 'query', operation, validate=validate)
+            ttl = self.cache.ttl_for(operation)
+            with self._lock:
+                if self._generation != generation:
+                    return
+                if content_digest(response) == digest:
+                    self.cache.touch(key, ttl)
+                else:
+                    self.cache.set(key, response, ttl, operation, variables)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _refreshed(self, future):
+        # The stale entry keeps being served, so a failed refresh is only counted.
+        if not future.cancelled() and future.exception() is not None:
+            with self._lock:
+                self.cache.stats.refresh_errors += 1
+
+    def close(self):
+        """
+        Stops the background refreshes, waiting for those in flight.
+        The session stays open, as other clients of the token share it.
+        :return: None
+        """
+        with self._lock:
+            refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            refresher.shutdown(wait=True)
+
+    def profile(self, interval: float = 0.001) -> Profiler:
+        """
+        Returns a sampling profiler splitting the time spent in the client into parsing, validation,
+        transport, JSON decoding and object construction, to be used as a context manager:
+        with client.profile() as profiler: ...; then profiler.report() or profiler.dump('client.folded')
+        :param interval: Float - the seconds between samples
+        :return: Profiler - the profiler, not started yet
+        """
+        return Profiler(interval)
+
+    def invalidate(self, mutation: str, variables: dict):
+        """
+        Evicts the cached queries made stale by a mutation. Unknown mutations clear the whole cache.
+        :param mutation: Str - the mutation operation name, e.g. 'UpdatePost'
+        :param variables: Dict - the variables the mutation was sent with
+        :return: None
+        """
+        if self.cache is None:
+            return
+        stale = invalidations(mutation, variables)
+        with self._lock:
+            self._generation += 1
+            if stale is None:
+                self.cache.clear()
+                return
+            for operation, match in stale:
+                self.cache.invalidate(operation, match)
+
+
+# The number of User and Publication objects kept for reuse by unchanged responses.
+_REUSED_OBJECTS = 1024
+
+_RESOURCES = {
+    'post': Post,
+    'user': User,
+    'tag': Tag,
+    'publication': Publication,
+}
+
+
+def _batch_results(kind: str, keys: list, data: dict, client, errors: list = None) -> dict:
+    """
+    Maps the aliased fields of a batch query back to resource objects.
+    Args:
+        kind (str): One of 'post', 'user', 'tag' or 'publication'.
+        keys (list): The keys in the order of their aliases k0, k1, ...
+        data (dict): The data returned for the batch query.
+        client: The client given to the resource objects.
+        errors (list, optional): The GraphQL errors returned with partial data.
+    Returns:
+        dict: The resource object, or the exception explaining its absence, for each key.
+    """
+    alias_errors = {}
+    for error in errors or []:
+        path = error.get('path') or [None]
+        alias_errors[path[0]] = TransportQueryError(error.get('message', str(error)), errors=[error])
+
+    resource = _RESOURCES[kind]
+    result = {}
+    for i, key in enumerate(keys):
+        alias = f'k{i}'
+        if data.get(alias) is not None:
+            result[key] = resource(data[alias], client)
+        else:
+            result[key] = alias_errors.get(alias) or LookupError(f"No {kind} found for {key!r}")
+    return result
+
+
+def _feed_variables(number_of_posts: int, feed_type: str = None, min_reading_time: int = None,
+                    max_reading_time: int = None, tags_id: list = None) -> dict:
+    """
+    Builds the variables of the feed query.
+    Args:
+        number_of_posts (int): The number of posts to retrieve.
+        feed_type (str, optional): The type of feed to retrieve. Defaults to None.
+        min_reading_time (int, optional): The minimum reading time of the posts. Defaults to None.
+        max_reading_time (int, optional): The maximum reading time of the posts. Defaults to None.
+        tags_id (list, optional): The list of tag ids to retrieve. Defaults to None.
+    Returns:
+        dict: The variables of the feed query.
+    """
+    variables = None
+
+    if number_of_posts > 50:
+        raise ValueError("Number of posts must be less than 50")
+
+    if feed_type:
+        feed_type = feed_type.upper()
+        variables = {
+            "first": number_of_posts,
+            "type": feed_type
+        }
+
+    if min_reading_time:
+        variables = {
+            "first": number_of_posts,
+            "minReadTime": min_reading_time
+        }
+
+    if max_reading_time:
+        variables = {
+            "first": number_of_posts,
+            "maxReadTime": max_reading_time
+        }
+
+    if tags_id:
+        variables = {
+            "first": number_of_posts,
+            "tags": tags_id
+        }
+
+    if not feed_type and not min_reading_time and not max_reading_time and not tags_id:
+        variables = {
+            "first": number_of_posts
+        }
+
+    return variables
@@ -0,0 +1,186 @@
+import hashlib
+import threading
+import weakref
+from collections import OrderedDict
+
+from gql import gql
+from graphql import DocumentNode, GraphQLSchema, OperationDefinitionNode, OperationType, print_ast, validate
+
+# The number of query texts remembered by the document cache and the query builder.
+MAX_DOCUMENTS = 1024
+
+
+class DocumentCache:
+    def __init__(self, max_entries: int = MAX_DOCUMENTS):
+        """
+        Initializes an empty cache of parsed GraphQL documents keyed by query text.
+        Args:
+            max_entries (int, optional): The number of documents, validations and digests each kept before
+                the least recently used is evicted, so dynamically built query texts do not grow it forever.
+                Defaults to 1024.
+        """
+        super(DocumentCache, self).__init__()
+        self.max_entries = max_entries
+        self._documents = OrderedDict()
+        self._validated = weakref.WeakKeyDictionary()
+        self._digests = OrderedDict()
+        self._own = OrderedDict()
+        self._package = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.validation_hits = 0
+        self.validation_misses = 0
+
+    def _remember(self, entries: OrderedDict, key, value):
+        # Called with the lock held.
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def parse(self, query: str) -> DocumentNode:
+        """
+        Returns the parsed document of a query, parsing it only the first time it is seen.
+        Args:
+            query (str): The GraphQL query text.
+        Returns:
+            DocumentNode: The parsed document.
+        """
+        with self._lock:
+            document = self._documents.get(query)
+            if document is not None:
+                self._documents.move_to_end(query)
+                self.hits += 1
+                return document
+        document = gql(query)
+        with self._lock:
+            self.misses += 1
+            existing = self._documents.get(query)
+            if existing is not None:
+                return existing
+            self._remember(self._documents, query, document)
+            return document
+
+    def validate(self, document: DocumentNode, schema: GraphQLSchema) -> None:
+        """
+        Validates a document against a schema once and remembers the outcome.
+        Args:
+            document (DocumentNode): The parsed document.
+            schema (GraphQLSchema): The schema to validate against.
+        Raises:
+            GraphQLError: If the document is not valid for the schema.
+        """
+        with self._lock:
+            validated = self._validated.get(schema)
+            if validated is not None and id(document) in validated:
+                validated.move_to_end(id(document))
+                self.validation_hits += 1
+                return
+        errors = validate(schema, document)
+        if errors:
+            raise errors[0]
+        with self._lock:
+            self.validation_misses += 1
+            validated = self._validated.get(schema)
+            if validated is None:
+                validated = self._validated[schema] = OrderedDict()
+            # Keep a reference so the id of a validated document is never reused.
+            self._remember(validated, id(document), document)
+
+    def own(self, query: str) -> str:
+        """
+        Marks a query text built by the package, e.g. a projected or batched query, as one of its documents.
+        Args:
+            query (str): The GraphQL query text.
+        Returns:
+            str: The query text.
+        """
+        with self._lock:
+            self._remember(self._own, query, None)
+        return query
+
+    def is_own(self, query: str) -> bool:
+        """
+        Whether a query text is one of the package's documents, the only ones the bundled schema
+        snapshot is known to cover: QUERIES, MUTATIONS or a query built from them.
+        """
+        if self._package is None:
+            # Imported here, as the query modules import this one.
+            from hashnode_py.queries import MUTATIONS, QUERIES
+
+            self._package = frozenset(QUERIES.values()) | frozenset(MUTATIONS.values())
+        return query in self._package or query in self._own
+
+    def digest(self, document: DocumentNode) -> str:
+        """
+        Returns the SHA-256 hash of the text a document is sent as, used by persisted queries.
+        Args:
+            document (DocumentNode): The parsed document.
+        Returns:
+            str: The hex digest of the printed document.
+        """
+        with self._lock:
+            entry = self._digests.get(id(document))
+            if entry is not None:
+                self._digests.move_to_end(id(document))
+                return entry[1]
+        digest = hashlib.sha256(print_ast(document).encode()).hexdigest()
+        with self._lock:
+            # Keep a reference so the id of a hashed document is never reused.
+            self._remember(self._digests, id(document), (document, digest))
+        return digest
+
+    def warm(self, queries) -> None:
+        """
+        Parses every given query ahead of time.
+        Args:
+            queries: An iterable of GraphQL query texts.
+        """
+        for query in queries:
+            if query not in self._documents:
+                self.parse(query)
+
+    def stats(self) -> dict:
+        """
+        Returns the cache counters.
+        Returns:
+            dict: The size of the cache and its parse and validation hit and miss counts.
+        """
+        with self._lock:
+            return {
+                'size': len(self._documents),
+                'hits': self.hits,
+                'misses': self.misses,
+                'validation_hits': self.validation_hits,
+                'validation_misses': self.validation_misses,
+            }
+
+    def clear(self) -> None:
+        """
+        Drops every cached document and resets the counters.
+        """
+        with self._lock:
+            self._documents.clear()
+            self._validated = weakref.WeakKeyDictionary()
+            self._digests.clear()
+            self.hits = self.misses = 0
+            self.validation_hits = self.validation_misses = 0
+
+
+def operation_of(document: DocumentNode) -> tuple[str, str]:
+    """
+    Returns the type and name of the first operation of a document.
+    Args:
+        document (DocumentNode): The parsed document.
+    Returns:
+        tuple: The operation type ('query' or 'mutation') and its name, or None if it is anonymous.
+    """
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            name = definition.name.value if definition.name else None
+            return definition.operation.value, name
+    return OperationType.QUERY.value, None
+
+
+documents = DocumentCache()
@@ -0,0 +1,238 @@
+import json
+import threading
+import time
+from collections import deque
+
+try:
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:
+    SpanKind = Status = StatusCode = None
+
+# The upper bounds in seconds of the request duration histogram buckets.
+DURATION_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class RequestEvent:
+    def __init__(self, operation_type: str, operation: str, variables: dict = None):
+        """
+        The measurements of one request sent by fetch_data, retries included.
+        Args:
+            operation_type (str): 'query' or 'mutation'.
+            operation (str): The operation name.
+            variables (dict, optional): The variables of the request.
+        """
+        super(RequestEvent, self).__init__()
+        self.operation_type = operation_type
+        self.operation = operation
+        self.variables_bytes = len(json.dumps(variables)) if variables else 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.status = None
+        self.attempts = 0
+        self.error = None
+        self.timings = {}
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self._started = time.perf_counter()
+
+    @property
+    def retries(self) -> int:
+        """
+        The number of attempts after the first one.
+        """
+        return max(0, self.attempts - 1)
+
+    def record(self, responses: list):
+        """
+        Adds the HTTP responses of an attempt: their body sizes, status and time to first byte.
+        """
+        for response in responses:
+            body = response.request.body if response.request is not None else None
+            self.request_bytes += len(body) if body else 0
+            self.response_bytes += len(response.content or b'')
+            self.status = response.status_code
+            # requests measures elapsed from sending the request until the response headers are parsed.
+            self.timings['ttfb'] = self.timings.get('ttfb', 0.0) + response.elapsed.total_seconds()
+
+    def finish(self, error: Exception = None):
+        self.error = error
+        self.timings['total'] = time.perf_counter() - self._started
+        self.end_time_ns = time.time_ns()
+
+    def as_dict(self) -> dict:
+        """
+        Returns the measurements.
+        """
+        return {
+            'operation_type': self.operation_type,
+            'operation': self.operation,
+            'variables_bytes': self.variables_bytes,
+            'request_bytes': self.request_bytes,
+            'response_bytes': self.response_bytes,
+            'status': self.status,
+            'retries': self.retries,
+            'error': repr(self.error) if self.error is not None else None,
+            'timings': dict(self.timings),
+        }
+
+
+class RequestHooks:
+    """
+    Receives the events of the requests a client sends. Subclasses override the methods they need
+    and are passed to HashnodeClient(hooks=[...]). Responses served from the cache send no events.
+    """
+
+    def on_request_start(self, event: RequestEvent):
+        """
+        Called before the first attempt of a request.
+        """
+
+    def on_response(self, event: RequestEvent):
+        """
+        Called once a request succeeded, with its sizes, timings and retry count.
+        """
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        """
+        Called once a request failed for good, retries included.
+        """
+
+
+def _attributes(event: RequestEvent) -> dict:
+    attributes = {
+        'graphql.operation.type': event.operation_type,
+        'graphql.operation.name': event.operation,
+        'graphql.variables.size': event.variables_bytes,
+        'http.request.body.size': event.request_bytes,
+        'http.response.body.size': event.response_bytes,
+        'http.request.resend_count': event.retries,
+    }
+    if event.status is not None:
+        attributes['http.response.status_code'] = event.status
+    if 'ttfb' in event.timings:
+        attributes['hashnode.ttfb_seconds'] = event.timings['ttfb']
+    return attributes
+
+
+class SpanEmitter(RequestHooks):
+    def __init__(self, tracer=None, max_spans: int = 1000):
+        """
+        Turns every request into a span named "<operation type> <operation name>", with the GraphQL
+        and HTTP semantic convention attributes of OpenTelemetry.
+        Args:
+            tracer (optional): An opentelemetry.trace.Tracer the spans are started on. Without one, spans are
+                kept offline in self.spans as dicts shaped like OTLP spans.
+            max_spans (int, optional): The number of offline spans kept, the oldest dropped first. Defaults to 1000.
+        """
+        super(SpanEmitter, self).__init__()
+        if tracer is not None and Status is None:
+            raise ImportError("A tracer needs opentelemetry-api, install it with: pip install opentelemetry-api")
+        self.tracer = tracer
+        self.spans = deque(maxlen=max_spans)
+
+    def _emit(self, event: RequestEvent, error: Exception = None):
+        name = f'{event.operation_type} {event.operation}'
+        attributes = _attributes(event)
+        if self.tracer is None:
+            self.spans.append({
+                'name': name,
+                'kind': 'CLIENT',
+                'start_time_unix_nano': event.start_time_ns,
+                'end_time_unix_nano': event.end_time_ns,
+                'attributes': attributes,
+                'status': {'code': 'ERROR', 'message': repr(error)} if error is not None else {'code': 'OK'},
+            })
+            return
+        span = self.tracer.start_span(name, kind=SpanKind.CLIENT, attributes=attributes,
+                                      start_time=event.start_time_ns)
+        if error is not None:
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, repr(error)))
+        span.end(end_time=event.end_time_ns)
+
+    def on_response(self, event: RequestEvent):
+        self._emit(event)
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        self._emit(event, error)
+
+
+class MetricsCollector(RequestHooks):
+    def __init__(self, buckets: tuple = DURATION_BUCKETS, prefix: str = 'hashnode'):
+        """
+        Aggregates requests per operation into Prometheus-style counters and a duration histogram,
+        without a Prometheus client: render() returns the text exposition format.
+        Args:
+            buckets (tuple, optional): The upper bounds in seconds of the duration histogram buckets.
+                Defaults to DURATION_BUCKETS.
+            prefix (str, optional): The prefix of the metric names. Defaults to 'hashnode'.
+        """
+        super(MetricsCollector, self).__init__()
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.operations = {}
+        self._lock = threading.Lock()
+
+    def _observe(self, event: RequestEvent, error: Exception = None):
+        total = event.timings['total']
+        with self._lock:
+            metrics = self.operations.get(event.operation)
+            if metrics is None:
+                metrics = self.operations[event.operation] = {
+                    'requests': 0, 'errors': 0, 'retries': 0, 'seconds': 0.0, 'max_seconds': 0.0,
+                    'request_bytes': 0, 'response_bytes': 0, 'buckets': [0] * len(self.buckets),
+                }
+            metrics['requests'] += 1
+            metrics['errors'] += error is not None
+            metrics['retries'] += event.retries
+            metrics['seconds'] += total
+            metrics['max_seconds'] = max(metrics['max_seconds'], total)
+            metrics['request_bytes'] += event.request_bytes
+            metrics['response_bytes'] += event.response_bytes
+            for i, bound in enumerate(self.buckets):
+                if total <= bound:
+                    metrics['buckets'][i] += 1
+
+    def on_response(self, event: RequestEvent):
+        self._observe(event)
+
+    def on_error(self, event: RequestEvent, error: Exception):
+        self._observe(event, error)
+
+    def as_dict(self) -> dict:
+        """
+        Returns the metrics of every operation, the slowest on average first.
+        """
+        with self._lock:
+            operations = {name: dict(metrics, buckets=list(metrics['buckets']))
+                          for name, metrics in self.operations.items()}
+        return dict(sorted(operations.items(), key=lambda item: -item[1]['seconds'] / item[1]['requests']))
+
+    def render(self) -> str:
+        """
+        Returns the metrics in the Prometheus text exposition format.
+        """
+        name = self.prefix
+        operations = self.as_dict()
+        lines = []
+        for metric, key, kind, help_text in (
+            ('requests_total', 'requests', 'counter', 'Requests sent, retries excluded.'),
+            ('request_errors_total', 'errors', 'counter', 'Requests that failed after their retries.'),
+            ('request_retries_total', 'retries', 'counter', 'Attempts retried after a transient error.'),
+            ('request_bytes_total', 'request_bytes', 'counter', 'Request body bytes sent.'),
+            ('response_bytes_total', 'response_bytes', 'counter', 'Response body bytes received.'),
+        ):
+            lines.append(f'# HELP {name}_{metric} {help_text}')
+            lines.append(f'# TYPE {name}_{metric} {kind}')
+            for operation, metrics in operations.items():
+                lines.append(f'{name}_{metric}{{operation="{operation}"}} {metrics[key]}')
+        metric = f'{name}_request_duration_seconds'
+        lines.append(f'# HELP {metric} Request duration, retries and backoff included.')
+        lines.append(f'# TYPE {metric} histogram')
+        for operation, metrics in operations.items():
+            for bound, count in zip(self.buckets, metrics['buckets']):
+                lines.append(f'{metric}_bucket{{operation="{operation}",le="{bound}"}} {count}')
+            lines.append(f'{metric}_bucket{{operation="{operation}",le="+Inf"}} {metrics["requests"]}')
+            lines.append(f'{metric}_sum{{operation="{operation}"}} {metrics["seconds"]}')
+            lines.append(f'{metric}_count{{operation="{operation}"}} {metrics["requests"]}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class DataLoader:
+    def __init__(self, batch_fn, wait: float = 0.005, max_batch_size: int = 20):
+        """
+        Coalesces concurrent lookups made within a short tick into one batched call.
+        Identical keys requested in the same tick share a single result.
+        Args:
+            batch_fn: A callable taking a list of keys and returning a dict of key to object or exception.
+            wait (float, optional): How long in seconds to collect keys before dispatching. Defaults to 0.005.
+            max_batch_size (int, optional): Dispatch immediately once this many keys are pending. Defaults to 20.
+        """
+        super(DataLoader, self).__init__()
+        self.batch_fn = batch_fn
+        self.wait = wait
+        self.max_batch_size = max_batch_size
+        self._pending = {}
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def load(self, key):
+        """
+        Returns the object of a key, blocking until the batch containing it has been fetched.
+        Args:
+            key: The key to look up.
+        Returns:
+            The object returned by batch_fn for the key.
+        """
+        dispatch_now = False
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = Future()
+                self._pending[key] = future
+                if len(self._pending) >= self.max_batch_size:
+                    dispatch_now = True
+                elif self._timer is None:
+                    self._timer = threading.Timer(self.wait, self.dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+        if dispatch_now:
+            self.dispatch()
+        return future.result()
+
+    def dispatch(self):
+        """
+        Fetches every pending key now.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return
+        try:
+            results = self.batch_fn(list(pending))
+        except Exception as e:
+            results = {key: e for key in pending}
+        _resolve(pending, results)
+
+
+class AsyncDataLoader:
+    def __init__(self, batch_fn, wait: float = 0.005, max_batch_size: int = 20):
+        """
+        The asyncio counterpart of DataLoader, collecting lookups made by tasks of one event loop.
+        Args:
+            batch_fn: A coroutine function taking a list of keys and returning a dict of key to object or exception.
+            wait (float, optional): How long in seconds to collect keys before dispatching. Defaults to 0.005.
+            max_batch_size (int, optional): Dispatch immediately once this many keys are pending. Defaults to 20.
+        """
+        super(AsyncDataLoader, self).__init__()
+        self.batch_fn = batch_fn
+        self.wait = wait
+        self.max_batch_size = max_batch_size
+        self._pending = {}
+        self._handle = None
+        self._tasks = set()
+
+    async def load(self, key):
+        """
+        Returns the object of a key once the batch containing it has been fetched.
+        Args:
+            key: The key to look up.
+        Returns:
+            The object returned by batch_fn for the key.
+        """
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch_size:
+                self._flush(loop)
+            elif self._handle is None:
+                self._handle = loop.call_later(self.wait, self._flush, loop)
+        return await asyncio.shield(future)
+
+    def _flush(self, loop):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            task = loop.create_task(self._dispatch(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: dict):
+        try:
+            results = await self.batch_fn(list(pending))
+        except Exception as e:
+            results = {key: e for key in pending}
+        _resolve(pending, results)
+
+
+def _resolve(pending: dict, results: dict):
+    for key, future in pending.items():
+        if future.done():
+            continue
+        result = results.get(key)
+        if isinstance(result, Exception):
+            future.set_exception(result)
+        else:
+            future.set_result(result)
@@ -0,0 +1,329 @@
+import json
+import sqlite3
+import threading
+import time
+
+from gql.transport.exceptions import TransportQueryError
+
+from hashnode_py.pagination import cursor_page
+from hashnode_py.queries.builder import batch_query, project_query
+from hashnode_py.queries.post_queries import comments as comments_query
+from hashnode_py.queries.publication_queries import drafts as drafts_query, publication_posts
+from hashnode_py.resources.comment import Comment
+from hashnode_py.resources.draft import Draft
+from hashnode_py.resources.post import Post
+
+# The post listing leaves content out; it is only fetched for new and updated posts.
+_LISTING_FIELDS = frozenset(path[0] for path in Post.FIELDS.values() if path[0] != 'content')
+_CONTENT = frozenset(['id', 'content'])
+
+# The error codes of a token that is not a member of the publication.
+_FORBIDDEN = ('FORBIDDEN', 'UNAUTHENTICATED')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS publications (
+  host TEXT PRIMARY KEY, id TEXT, high_water TEXT, synced_at REAL);
+CREATE TABLE IF NOT EXISTS posts (
+  id TEXT PRIMARY KEY, host TEXT, slug TEXT, title TEXT, published_at TEXT, updated_at TEXT,
+  response_count INTEGER, data TEXT, markdown TEXT);
+CREATE INDEX IF NOT EXISTS posts_host ON posts (host, published_at);
+CREATE TABLE IF NOT EXISTS drafts (
+  id TEXT PRIMARY KEY, host TEXT, updated_at TEXT, data TEXT);
+CREATE TABLE IF NOT EXISTS comments (
+  id TEXT PRIMARY KEY, post_id TEXT, date_added TEXT, data TEXT);
+CREATE INDEX IF NOT EXISTS comments_post ON comments (post_id, date_added);
+"""
+
+
+def _stamp(node: dict) -> str:
+    return node['updatedAt'] or node['publishedAt'] or ''
+
+
+class Mirror:
+    def __init__(self, path: str, client=None):
+        """
+        A local SQLite copy of the posts, drafts and comments of publications, kept current by sync.
+        Args:
+            path (str): The database file.
+            client (optional): The client attached to the objects returned by the query helpers.
+        """
+        super(Mirror, self).__init__()
+        self.path = path
+        self.client = client
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def sync(self, client, host: str, drafts: bool = True, comments: bool = True, page_size: int = 50) -> dict:
+        """
+        Brings the mirror of a publication up to date.
+        Every sync lists the posts without their content. Content is only fetched for posts that are
+        new or whose updatedAt is newer than the stored high-water mark, and comments only for those
+        posts and the ones whose responseCount changed. Posts gone from the publication are removed.
+        A post whose content or comments could not be fetched, e.g. deleted during the sync, is left as
+        stored, and the high-water mark stays below it so the next sync fetches it again.
+        Args:
+            client: The HashnodeClient used to fetch.
+            host (str): The host of the publication, e.g. 'blog.hashnode.dev'.
+            drafts (bool, optional): Whether to mirror the drafts, which needs a token of a member.
+                Without one, the stored drafts are kept and 'drafts' is None in the result. Defaults to True.
+            comments (bool, optional): Whether to mirror the comments. Defaults to True.
+            page_size (int, optional): The number of items fetched per request, at most 50. Defaults to 50.
+        Returns:
+            dict: The number of posts listed, fetched and removed, and of comments and drafts stored,
+                drafts being None when they were not mirrored.
+        """
+        publication_id, nodes = self._list_posts(client, host, page_size)
+        # Fetched before the content and comments, so a token without access fails fast.
+        draft_nodes = self._fetch_drafts(client, publication_id, page_size) if drafts else None
+        high_water = self.high_water(host) or ''
+        with self._lock:
+            stored = dict(self._db.execute(
+                'SELECT id, response_count FROM posts WHERE host = ?', (host,)).fetchall())
+        listed = {node['id'] for node in nodes}
+        changed = [node['id'] for node in nodes if node['id'] not in stored or _stamp(node) > high_water]
+        content = self._fetch_content(client, changed)
+        missing = {post_id for post_id in changed if post_id not in content}
+        discussed = [node['id'] for node in nodes
+                     if node['id'] in content or stored.get(node['id']) != node['responseCount']]
+        threads = {post_id: self._fetch_comments(client, post_id, page_size) for post_id in discussed} \
+            if comments else {}
+        threads = {post_id: thread for post_id, thread in threads.items() if thread is not None}
+        stamps = [_stamp(node) for node in nodes if node['id'] not in missing]
+        if missing:
+            floor = min(_stamp(node) for node in nodes if node['id'] in missing)
+            stamps = [stamp for stamp in stamps if stamp < floor]
+        removed = [post_id for post_id in stored if post_id not in listed]
+
+        with self._lock, self._db:
+            for node in nodes:
+                if node['id'] in missing:
+                    continue
+                row = (host, node['slug'], node['title'], node['publishedAt'], node['updatedAt'],
+                       node['responseCount'], json.dumps(node))
+                if node['id'] in content:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (node['id'],) + row + (content[node['id']],))
+                else:
+                    self._db.execute(
+                        'UPDATE posts SET host = ?, slug = ?, title = ?, published_at = ?, updated_at = ?, '
+                        'response_count = ?, data = ? WHERE id = ?', row + (node['id'],))
+            for post_id in removed:
+                self._db.execute('DELETE FROM posts WHERE id = ?', (post_id,))
+                self._db.execute('DELETE FROM comments WHERE post_id = ?', (post_id,))
+            for post_id, thread in threads.items():
+                self._db.execute('DELETE FROM comments WHERE post_id = ?', (post_id,))
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO comments VALUES (?, ?, ?, ?)',
+                    [(comment['id'], post_id, comment['dateAdded'], json.dumps(comment)) for comment in thread])
+            if draft_nodes is not None:
+                self._db.execute('DELETE FROM drafts WHERE host = ?', (host,))
+                self._db.executemany(
+                    'INSERT INTO drafts VALUES (?, ?, ?, ?)',
+                    [(draft['id'], host, draft['updatedAt'], json.dumps(draft)) for draft in draft_nodes])
+            self._db.execute(
+                'INSERT OR REPLACE INTO publications VALUES (?, ?, ?, ?)',
+                (host, publication_id, max([high_water] + stamps), time.time()))
+
+        return {
+            'listed': len(nodes),
+            'fetched': len(content),
+            'removed': len(removed),
+            'comments': sum(len(thread) for thread in threads.values()),
+            'drafts': len(draft_nodes) if draft_nodes is not None else None,
+        }
+
+    @staticmethod
+    def _list_posts(client, host: str, page_size: int) -> tuple[str, list]:
+        listing = project_query(publication_posts, ('publication', 'posts', 'edges', 'node'), _LISTING_FIELDS)
+        nodes = []
+        after = None
+        while True:
+            variables = {'host': host, 'first': page_size, 'after': after}
+            data = client.fetch_data(query=listing, variables=variables, use_cache=False)
+            publication = data['publication']
+            if publication is None:
+                raise ValueError(f"No publication found for host {host!r}")
+            page, after = cursor_page(publication['posts'])
+            nodes.extend(page)
+            if after is None:
+                return publication['id'], nodes
+
+    @staticmethod
+    def _fetch_content(client, post_ids: list) -> dict:
+        content = {}
+        for start in range(0, len(post_ids), client.batch_size):
+            chunk = post_ids[start:start + client.batch_size]
+            query, variables = batch_query('post', chunk, _CONTENT)
+            data = client.fetch_data(query=query, variables=variables, use_cache=False)
+            for alias, post_id in zip(variables, chunk):
+                post = data[alias]
+                if post is not None:
+                    content[post_id] = post['content']['markdown'] if post['content'] else None
+        return content
+
+    @staticmethod
+    def _fetch_comments(client, post_id: str, page_size: int) -> list:
+        """
+        Returns the comments of a post, or None if the post is gone.
+        """
+        thread = []
+        after = None
+        while True:
+            variables = {'id': post_id, 'first': page_size, 'after': after}
+            data = client.fetch_data(query=comments_query, variables=variables, use_cache=False)
+            if data['post'] is None:
+                return None
+            page, after = cursor_page(data['post']['comments'])
+            thread.extend(page)
+            if after is None:
+                return thread
+
+    @staticmethod
+    def _fetch_drafts(client, publication_id: str, page_size: int) -> list:
+        """
+        Returns the drafts of a publication, or None if the token may not read them.
+        """
+        nodes = []
+        after = None
+        while True:
+            variables = {'id': publication_id, 'first': page_size, 'after': after}
+            try:
+                data = client.fetch_data(query=drafts_query, variables=variables, use_cache=False)
+            except TransportQueryError as e:
+                if any((error.get('extensions') or {}).get('code') in _FORBIDDEN for error in e.errors or ()):
+                    return None
+                raise
+            if data['publication'] is None or data['publication']['drafts'] is None:
+                return None
+            page, after = cursor_page(data['publication']['drafts'])
+            nodes.extend(page)
+            if after is None:
+                return nodes
+
+    def store_post(self, publication_id: str, node: dict) -> bool:
+        """
+        Writes one post fetched with its content, e.g. after a post_published or post_updated webhook.
+        The high-water mark is left alone, so the next sync still picks up posts updated before it.
+        Args:
+            publication_id (str): The id of the publication of the post.
+            node (dict): The post data, content included.
+        Returns:
+            bool: False if the publication is not mirrored.
+        """
+        with self._lock, self._db:
+            row = self._db.execute('SELECT host FROM publications WHERE id = ?', (publication_id,)).fetchone()
+            if row is None:
+                return False
+            data = {key: value for key, value in node.items() if key != 'content'}
+            markdown = node['content']['markdown'] if node.get('content') else None
+            self._db.execute(
+                'INSERT OR REPLACE INTO posts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (node['id'], row[0], node['slug'], node['title'], node['publishedAt'], node['updatedAt'],
+                 node['responseCount'], json.dumps(data), markdown))
+        return True
+
+    def remove_post(self, post_id: str):
+        """
+        Deletes a post and its comments, e.g. after a post_deleted webhook.
+        """
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM posts WHERE id = ?', (post_id,))
+            self._db.execute('DELETE FROM comments WHERE post_id = ?', (post_id,))
+
+    def high_water(self, host: str) -> str:
+        """
+        Returns the newest updatedAt of the mirrored posts of a publication, or None before its first sync.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT high_water FROM publications WHERE host = ?', (host,)).fetchone()
+        return row[0] if row else None
+
+    def posts(self, host: str = None, since: str = None, search: str = None, limit: int = None) -> list[Post]:
+        """
+        Returns mirrored posts, newest first.
+        Args:
+            host (str, optional): Only the posts of this publication. Defaults to all.
+            since (str, optional): Only the posts published or updated after this ISO 8601 date.
+            search (str, optional): Only the posts whose title or markdown contains this text.
+            limit (int, optional): The maximum number of posts. Defaults to all.
+        Returns:
+            list: A list of Post objects.
+        """
+        clauses, parameters = [], []
+        if host:
+            clauses.append('host = ?')
+            parameters.append(host)
+        if since:
+            clauses.append('max(coalesce(updated_at, ""), coalesce(published_at, "")) > ?')
+            parameters.append(since)
+        if search:
+            clauses.append('(title LIKE ? OR markdown LIKE ?)')
+            parameters += [f'%{search}%'] * 2
+        sql = 'SELECT data, markdown FROM posts'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        sql += ' ORDER BY published_at DESC'
+        if limit:
+            sql += ' LIMIT ?'
+            parameters.append(limit)
+        with self._lock:
+            rows = self._db.execute(sql, parameters).fetchall()
+        return [self._post(data, markdown) for data, markdown in rows]
+
+    def post(self, post_id: str) -> Post:
+        """
+        Returns a mirrored post, or None if it is not mirrored.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT data, markdown FROM posts WHERE id = ?', (post_id,)).fetchone()
+        return self._post(*row) if row else None
+
+    def comments(self, post_id: str) -> list[Comment]:
+        """
+        Returns the mirrored comments of a post, oldest first.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT data FROM comments WHERE post_id = ? ORDER BY date_added', (post_id,)).fetchall()
+        return [Comment(json.loads(row[0]), self.client) for row in rows]
+
+    def drafts(self, host: str) -> list[Draft]:
+        """
+        Returns the mirrored drafts of a publication, most recently updated first.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT data FROM drafts WHERE host = ? ORDER BY updated_at DESC', (host,)).fetchall()
+        return [Draft(json.loads(row[0]), self.client) for row in rows]
+
+    def _post(self, data: str, markdown: str) -> Post:
+        data = json.loads(data)
+        data['content'] = {'markdown': markdown}
+        return Post(data, self.client)
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        self._db.close()
+
+
+def sync_publication(client, host: str, store_path: str, drafts: bool = True, comments: bool = True) -> dict:
+    """
+    Creates or updates the local mirror of a publication at store_path. See Mirror.sync.
+    Args:
+        client: The HashnodeClient used to fetch.
+        host (str): The host of the publication, e.g. 'blog.hashnode.dev'.
+        store_path (str): The SQLite database file of the mirror.
+        drafts (bool, optional): Whether to mirror the drafts. Defaults to True.
+        comments (bool, optional): Whether to mirror the comments. Defaults to True.
+    Returns:
+        dict: The number of posts listed, fetched and removed, and of comments and drafts stored.
+    """
+    mirror = Mirror(store_path, client)
+    try:
+        return mirror.sync(client, host, drafts=drafts, comments=comments)
+    finally:
+        mirror.close()
@@ -0,0 +1,379 @@
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from graphql import graphql_sync
+
+from hashnode_py.schema import load_schema
+
+_DATE = '2024-01-01T00:00:00.000Z'
+
+
+class MockStats:
+    def __init__(self):
+        """
+        Counters of a mock server.
+        """
+        super(MockStats, self).__init__()
+        self.requests = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def as_dict(self) -> dict:
+        """
+        Returns the counters.
+        """
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'bytes_in': self.bytes_in,
+            'bytes_out': self.bytes_out,
+        }
+
+
+class MockData:
+    def __init__(self, total_items: int = 100, content_size: int = 2000):
+        """
+        Generates deterministic Hashnode objects for the mock server.
+        Args:
+            total_items (int, optional): The number of items of every paginated connection. Defaults to 100.
+            content_size (int, optional): The number of characters of post and draft content. Defaults to 2000.
+        """
+        super(MockData, self).__init__()
+        self.total_items = total_items
+        self.content_size = content_size
+
+    def content(self, seed: str) -> dict:
+        line = f'Lorem ipsum {seed} dolor sit amet. '
+        text = (line * (self.content_size // len(line) + 1))[:self.content_size]
+        return {'markdown': text, 'html': f'<p>{text}</p>', 'text': text}
+
+    def user(self, username: str) -> dict:
+        return {
+            'id': f'user-{username}',
+            'username': username,
+            'name': username.title(),
+            'bio': {'markdown': 'bio', 'html': '<p>bio</p>', 'text': 'bio'},
+            'profilePicture': None,
+            'followersCount': self.total_items,
+            'followingsCount': self.total_items,
+            'tagline': None,
+            'dateJoined': _DATE,
+            'location': None,
+            'availableFor': None,
+            'deactivated': False,
+            'following': False,
+            'followsBack': False,
+            'isPro': False,
+            'socialMediaLinks': {'website': f'https://{username}.dev'},
+            'badges': [],
+            'tagsFollowing': [self.tag('python')],
+            'publications': lambda info, first, after=None: self.cursor_connection(
+                lambda i: dict(self.publication(host=f'{username}-{i}.hashnode.dev'), role='OWNER'),
+                first, after, total=1, edge_fields=('role',)),
+            'posts': lambda info, pageSize, page: self.offset_connection(
+                lambda i: self.post(f'{username}-post-{i}'), pageSize, page),
+            'followers': lambda info, pageSize, page: self.offset_connection(
+                lambda i: self.user(f'{username}-follower-{i}'), pageSize, page),
+            'follows': lambda info, pageSize, page: self.offset_connection(
+                lambda i: self.user(f'{username}-follows-{i}'), pageSize, page),
+        }
+
+    def post(self, post_id: str) -> dict:
+        return {
+            'id': post_id,
+            'slug': f'slug-{post_id}',
+            'title': f'Title {post_id}',
+            'subtitle': None,
+            'author': self.user('author'),
+            'url': f'https://blog.hashnode.dev/{post_id}',
+            'publication': {'id': 'publication', 'title': 'Blog', 'url': 'https://blog.hashnode.dev'},
+            'cuid': post_id,
+            'coverImage': None,
+            'brief': f'Brief of {post_id}',
+            'readTimeInMinutes': max(1, self.content_size // 1000),
+            'views': 10,
+            'reactionCount': 1,
+            'responseCount': 0,
+            'featured': False,
+            'bookmarked': False,
+            'featuredAt': None,
+            'publishedAt': _DATE,
+            'updatedAt': _DATE,
+            'isFollowed': False,
+            'content': self.content(post_id),
+            'comments': lambda info, first, after=None: self.cursor_connection(
+                lambda i: self.comment(f'{post_id}-comment-{i}'), first, after),
+        }
+
+    def comment(self, comment_id: str) -> dict:
+        return {
+            'id': comment_id,
+            'content': self.content(comment_id),
+            'author': self.user('reader'),
+            'dateAdded': _DATE,
+            'stamp': None,
+            'totalReactions': 0,
+            'myTotalReactions': 0,
+        }
+
+    def draft(self, draft_id: str) -> dict:
+        return {
+            'id': draft_id,
+            'slug': f'slug-{draft_id}',
+            'title': f'Draft {draft_id}',
+            'subtitle': None,
+            'author': self.user('author'),
+            'coverImage': None,
+            'readTimeInMinutes': 1,
+            'content': self.content(draft_id),
+            'updatedAt': _DATE,
+            'lastBackup': None,
+            'lastSuccessfulBackupAt': None,
+            'lastFailedBackupAt': None,
+        }
+
+    def publication(self, id: str = None, host: str = None) -> dict:
+        host = host or 'blog.hashnode.dev'
+        return {
+            'id': id or f'publication-{host}',
+            'title': host,
+            'displayTitle': host,
+            'descriptionSEO': None,
+            'about': None,
+            'url': f'https://{host}',
+            'author': self.user('author'),
+            'headerColor': None,
+            'integrations': {'gaTrackingID': None},
+            'followersCount': self.total_items,
+            'pinnedPost': None,
+            'posts': lambda info, first, after=None: self.cursor_connection(
+                lambda i: self.post(f'{host}-post-{i}'), first, after),
+            'drafts': lambda info, first, after=None: self.cursor_connection(
+                lambda i: self.draft(f'{host}-draft-{i}'), first, after),
+        }
+
+    def tag(self, slug: str) -> dict:
+        return {
+            'id': f'tag-{slug}',
+            'name': slug.title(),
+            'slug': slug,
+            'logo': None,
+            'tagline': None,
+            'info': None,
+            'followersCount': self.total_items,
+            'postsCount': self.total_items,
+        }
+
+    def scheduled_post(self, draft_id: str) -> dict:
+        return {
+            'id': f'scheduled-{draft_id}',
+            'author': self.user('author'),
+            'draft': self.draft(draft_id),
+            'scheduledDate': _DATE,
+            'scheduledBy': self.user('author'),
+            'publication': self.publication(),
+        }
+
+    def webhook(self, webhook_id: str, data: dict = None) -> dict:
+        data = data or {}
+        return {
+            'id': webhook_id,
+            'url': data.get('url', 'https://example.com/hook'),
+            'publication': self.publication(data.get('publicationId')),
+            'events': data.get('events', ['POST_PUBLISHED']),
+            'secret': data.get('secret', 'secret'),
+            'createdAt': _DATE,
+            'updatedAt': _DATE,
+        }
+
+    def offset_connection(self, make, page_size: int, page: int, total: int = None) -> dict:
+        total = self.total_items if total is None else total
+        start = (page - 1) * page_size
+        end = min(start + page_size, total)
+        return {
+            'nodes': [make(i) for i in range(start, end)],
+            'totalDocuments': total,
+            'pageInfo': {
+                'hasNextPage': end < total,
+                'hasPreviousPage': page > 1,
+                'previousPage': page - 1 if page > 1 else None,
+                'nextPage': page + 1 if end < total else None,
+            },
+        }
+
+    def cursor_connection(self, make, first: int, after: str = None, total: int = None,
+                          edge_fields: tuple = ()) -> dict:
+        total = self.total_items if total is None else total
+        start = int(after) if after else 0
+        end = min(start + first, total)
+        edges = []
+        for i in range(start, end):
+            node = make(i)
+            edge = {'node': node, 'cursor': str(i + 1)}
+            edge.update({name: node[name] for name in edge_fields})
+            edges.append(edge)
+        return {
+            'edges': edges,
+            'totalDocuments': total,
+            'pageInfo': {'hasNextPage': end < total, 'endCursor': str(end) if edges else None},
+        }
+
+    def root(self) -> dict:
+        """
+        Returns the root value resolving every query and mutation of the bundled schema.
+        """
+        post = lambda key: {'post': self.post(key)}
+        comment = lambda key: {'comment': self.comment(key)}
+        reply = lambda key: {'reply': self.comment(key)}
+        scheduled = lambda key: {'scheduledPost': self.scheduled_post(key)}
+        return {
+            'user': lambda info, username: self.user(username),
+            'post': lambda info, id: self.post(id),
+            'publication': lambda info, id=None, host=None: self.publication(id, host),
+            'tag': lambda info, slug: self.tag(slug),
+            'feed': lambda info, first, after=None, filter=None: self.cursor_connection(
+                lambda i: self.post(f'feed-{i}'), first, after),
+            'toggleFollowUser': lambda info, id=None, username=None: {
+                'user': dict(self.user(username or id), following=True)},
+            'likePost': lambda info, input: post(input['postId']),
+            'publishPost': lambda info, input: post(_new_id(input['title'])),
+            'updatePost': lambda info, input: post(input['id']),
+            'removePost': lambda info, input: post(input['id']),
+            'likeComment': lambda info, input: comment(input['commentId']),
+            'addComment': lambda info, input: comment(_new_id(input['contentMarkdown'])),
+            'updateComment': lambda info, input: comment(input['id']),
+            'removeComment': lambda info, input: comment(input['id']),
+            'addReply': lambda info, input: reply(_new_id(input['contentMarkdown'])),
+            'updateReply': lambda info, input: reply(input['replyId']),
+            'removeReply': lambda info, input: reply(input['replyId']),
+            'publishDraft': lambda info, input: post(input['draftId']),
+            'scheduleDraft': lambda info, input: scheduled(input['draftId']),
+            'rescheduleDraft': lambda info, input: scheduled(input['draftId']),
+            'cancelScheduledDraft': lambda info, input: scheduled(input['draftId']),
+            'createWebhook': lambda info, input: {'webhook': self.webhook(_new_id(input['url']), input)},
+            'updateWebhook': lambda info, input: {'webhook': self.webhook(input['id'], input)},
+            'deleteWebhook': lambda info, id: {'webhook': self.webhook(id)},
+        }
+
+
+def _new_id(seed: str) -> str:
+    return hashlib.sha1(f'{seed}{time.time_ns()}'.encode()).hexdigest()[:24]
+
+
+class MockHashnodeServer:
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency: float = 0.0, total_items: int = 100,
+                 content_size: int = 2000, error_rate: float = 0.0, error_status: int = 503, seed: int = 0):
+        """
+        A local stand-in for the Hashnode GraphQL API, executing requests against the bundled schema
+        with generated data. It also answers automatic persisted queries.
+        Args:
+            host (str, optional): The interface to listen on. Defaults to 127.0.0.1.
+            port (int, optional): The port to listen on. Defaults to a free one.
+            latency (float, optional): The seconds every response is delayed by. Defaults to 0.
+            total_items (int, optional): The number of items of every paginated connection. Defaults to 100.
+            content_size (int, optional): The number of characters of post content. Defaults to 2000.
+            error_rate (float, optional): The fraction of requests failing with error_status. Defaults to 0.
+            error_status (int, optional): The HTTP status of injected errors. Defaults to 503.
+            seed (int, optional): The seed of the error injection. Defaults to 0.
+        """
+        super(MockHashnodeServer, self).__init__()
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.data = MockData(total_items, content_size)
+        self.stats = MockStats()
+        self.persisted = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._root = self.data.root()
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        The endpoint to pass to HashnodeSession(url=...).
+        """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/'
+
+    def start(self) -> 'MockHashnodeServer':
+        """
+        Serves requests from a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops serving and closes the socket.
+        """
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def respond(self, body: bytes) -> tuple[int, dict]:
+        """
+        Answers one request body.
+        Returns:
+            tuple: The HTTP status and the JSON response.
+        """
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.bytes_in += len(body)
+            failed = self.error_rate and self._random.random() < self.error_rate
+            if failed:
+                self.stats.errors += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return self.error_status, {'errors': [{'message': 'Injected error'}]}
+        request = json.loads(body)
+        query = request.get('query')
+        persisted = (request.get('extensions') or {}).get('persistedQuery')
+        if persisted:
+            digest = persisted['sha256Hash']
+            if query is None:
+                query = self.persisted.get(digest)
+                if query is None:
+                    return 200, {'errors': [{
+                        'message': 'PersistedQueryNotFound', 'extensions': {'code': 'PERSISTED_QUERY_NOT_FOUND'}}]}
+            else:
+                self.persisted[digest] = query
+        result = graphql_sync(load_schema(), query, root_value=self._root,
+                              variable_values=request.get('variables'), operation_name=request.get('operationName'))
+        return 200, result.formatted
+
+
+def _handler(server: MockHashnodeServer):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            status, payload = server.respond(body)
+            data = json.dumps(payload).encode()
+            with server._lock:
+                server.stats.bytes_out += len(data)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            if status == 429:
+                self.send_header('Retry-After', '0')
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
@@ -0,0 +1,208 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from hashnode_py.resources.fields import field_kind, field_value
+
+# field type: pandas nullable dtype
+_PANDAS_DTYPES = {'int': 'Int64', 'bool': 'boolean', 'str': 'string'}
+
+
+class Paginator:
+    def __init__(self, fetch_page, build_page, cursor=None, limit: int = None, stop=None, fields: dict = None):
+        """
+        Lazily walks a paginated connection, requesting the next page only when the current one is consumed.
+        Args:
+            fetch_page: A callable taking a cursor (an endCursor or a page number) and returning
+                the raw nodes of that page and the cursor of the next page, or None on the last page.
+            build_page: A callable turning the raw nodes of a page into resource objects.
+            cursor (optional): The cursor of the first page. Defaults to None.
+            limit (int, optional): The maximum number of items to yield. Defaults to no limit.
+            stop (optional): A callable receiving each object; iteration ends when it returns True.
+            fields (dict, optional): The FIELDS table of the resource, which enables the columnar exports
+                to_records, to_arrow and to_pandas. Defaults to None.
+        """
+        super(Paginator, self).__init__()
+        self.fetch_page = fetch_page
+        self.build_page = build_page
+        self.cursor = cursor
+        self.limit = limit
+        self.stop = stop
+        self.fields = fields
+        self.read_ahead = 0
+
+    def prefetch(self, pages: int = 2) -> 'Paginator':
+        """
+        Fetches upcoming pages in the background while the current one is being consumed.
+        Page-number connections request up to `pages` pages ahead; cursor connections can only
+        request the next page, which is sent as soon as the cursor of the current page is known.
+        Args:
+            pages (int, optional): The maximum number of pages fetched ahead. Defaults to 2.
+        Returns:
+            Paginator: The paginator itself.
+        """
+        self.read_ahead = pages
+        return self
+
+    def pages(self):
+        """
+        Yields the raw nodes of every page, truncated to limit.
+        """
+        if self.read_ahead:
+            fetched = self._prefetched_pages()
+        else:
+            fetched = self._sequential_pages()
+        remaining = self.limit
+        try:
+            for nodes, cursor in fetched:
+                if remaining is not None:
+                    nodes = nodes[:remaining]
+                    remaining -= len(nodes)
+                if nodes:
+                    yield nodes
+                if cursor is None or not nodes or remaining == 0:
+                    return
+        finally:
+            fetched.close()
+
+    def _sequential_pages(self):
+        cursor = self.cursor
+        while True:
+            nodes, cursor = self.fetch_page(cursor)
+            yield nodes, cursor
+
+    def _prefetched_pages(self):
+        numbered = isinstance(self.cursor, int)
+        window = self.read_ahead + 1 if numbered else 1
+        executor = ThreadPoolExecutor(max_workers=window)
+        futures = deque()
+        try:
+            if numbered:
+                for page in range(self.cursor, self.cursor + window):
+                    futures.append(executor.submit(self.fetch_page, page))
+                next_page = self.cursor + window
+            else:
+                futures.append(executor.submit(self.fetch_page, self.cursor))
+            while futures:
+                nodes, cursor = futures.popleft().result()
+                if cursor is not None and nodes:
+                    # Keep the window full: one page consumed, one more requested.
+                    if numbered:
+                        futures.append(executor.submit(self.fetch_page, next_page))
+                        next_page += 1
+                    else:
+                        futures.append(executor.submit(self.fetch_page, cursor))
+                yield nodes, cursor
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter__(self):
+        for nodes in self.pages():
+            for item in self.build_page(nodes):
+                if self.stop is not None and self.stop(item):
+                    return
+                yield item
+
+    def _columnar_pages(self):
+        """
+        Yields the columns of every page, built from the raw nodes without creating resource objects.
+        The columns are the fields present in the nodes, in the order of the FIELDS table.
+        """
+        if self.fields is None:
+            raise ValueError("This paginator has no field table to export columns from")
+        if self.stop is not None:
+            raise ValueError("stop receives resource objects and cannot be used with a columnar export, use limit")
+        selected = None
+        for nodes in self.pages():
+            if selected is None:
+                selected = {name: path for name, path in self.fields.items() if path[0] in nodes[0]}
+            yield {name: [field_value(node, path) for node in nodes] for name, path in selected.items()}
+
+    def schema(self) -> dict:
+        """
+        Returns the type, 'int', 'bool' or 'str', of every field of the field table.
+        """
+        return {name: field_kind(path) for name, path in self.fields.items()}
+
+    def columns(self) -> dict:
+        """
+        Walks every page and returns one list of values per field.
+        Returns:
+            dict: The attribute names, as in the resource's FIELDS, and their values.
+        """
+        columns = {}
+        for page in self._columnar_pages():
+            for name, values in page.items():
+                columns.setdefault(name, []).extend(values)
+        return columns
+
+    def to_records(self) -> list[dict]:
+        """
+        Walks every page and returns one dictionary per item, keyed by attribute name.
+        """
+        records = []
+        for page in self._columnar_pages():
+            names = list(page)
+            records.extend(dict(zip(names, row)) for row in zip(*page.values()))
+        return records
+
+    def to_arrow(self):
+        """
+        Walks every page and returns a pyarrow.Table, converting each page to a record batch as it arrives.
+        Integer fields become int64 columns and boolean fields bool columns, both nullable.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow requires pyarrow, install it with: pip install pyarrow") from e
+        types = {'int': pa.int64(), 'bool': pa.bool_(), 'str': pa.string()}
+        kinds = self.schema()
+        schema = None
+        batches = []
+        for page in self._columnar_pages():
+            if schema is None:
+                schema = pa.schema([(name, types[kinds[name]]) for name in page])
+            batches.append(pa.record_batch(
+                [pa.array(values, type=schema.field(name).type) for name, values in page.items()], schema=schema))
+        if schema is None:
+            schema = pa.schema([(name, types[kind]) for name, kind in kinds.items()])
+        return pa.Table.from_batches(batches, schema=schema)
+
+    def to_pandas(self):
+        """
+        Walks every page and returns a pandas.DataFrame with nullable Int64, boolean and string columns.
+        Like to_arrow, an empty result keeps a typed column for every field of the field table.
+        """
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("to_pandas requires pandas, install it with: pip install pandas") from e
+        kinds = self.schema()
+        columns = self.columns() or {name: [] for name in kinds}
+        return pd.DataFrame({
+            name: pd.array(values, dtype=_PANDAS_DTYPES[kinds[name]]) for name, values in columns.items()
+        })
+
+
+def cursor_page(connection: dict) -> tuple[list, str]:
+    """
+    Splits a cursor connection into its nodes and the cursor of the next page.
+    Args:
+        connection (dict): A connection with edges{node} and pageInfo{hasNextPage endCursor}.
+    Returns:
+        tuple: The nodes and the next cursor, or None on the last page.
+    """
+    page_info = connection['pageInfo']
+    nodes = [edge['node'] for edge in connection['edges']]
+    return nodes, page_info['endCursor'] if page_info['hasNextPage'] else None
+
+
+def offset_page(connection: dict) -> tuple[list, int]:
+    """
+    Splits a page-number connection into its nodes and the number of the next page.
+    Args:
+        connection (dict): A connection with nodes and pageInfo{hasNextPage nextPage}.
+    Returns:
+        tuple: The nodes and the next page number, or None on the last page.
+    """
+    page_info = connection['pageInfo']
+    return connection['nodes'], page_info['nextPage'] if page_info['hasNextPage'] else None
@@ -0,0 +1,160 @@
+import sys
+import threading
+import time
+
+# (module prefix, phase) of the libraries the client calls into
+PHASE_MODULES = [
+    ('graphql.validation', 'validate'),
+    ('graphql.language', 'parse'),
+    # gql() only parses, and must come before the transports of the gql package.
+    ('gql.gql', 'parse'),
+    ('gql', 'transport'),
+    ('requests', 'transport'),
+    ('urllib3', 'transport'),
+]
+
+# JSON decoding happens inside the transport, so it is looked for anywhere in the stack.
+DECODE_MODULES = ('json.decoder', 'simplejson')
+
+PHASES = ('parse', 'validate', 'transport', 'decode', 'build', 'client')
+
+# Modules of the package that are not client code, so threads running only them are not sampled.
+_IGNORED = ('hashnode_py.mock', 'hashnode_py.profiling')
+
+
+def _module(frame) -> str:
+    return frame.f_globals.get('__name__') or ''
+
+
+def _is_client(module: str) -> bool:
+    return (module == 'hashnode_py' or module.startswith('hashnode_py.')) and not module.startswith(_IGNORED)
+
+
+def _matches(module: str, prefix: str) -> bool:
+    return module == prefix or module.startswith(prefix + '.')
+
+
+def classify(modules: list[str]) -> str:
+    """
+    Returns the phase of a sample.
+    Args:
+        modules (list[str]): The module names of the sampled stack, innermost first.
+    Returns:
+        str: 'decode' while JSON is decoded, else the phase of the library the innermost client frame
+            called into, else 'build' inside hashnode_py.resources and 'client' anywhere else.
+    """
+    innermost = next((i for i, module in enumerate(modules) if _is_client(module)), None)
+    if innermost is None:
+        return 'client'
+    called = modules[:innermost]
+    if any(_matches(module, prefix) for module in called for prefix in DECODE_MODULES):
+        return 'decode'
+    if called:
+        for prefix, phase in PHASE_MODULES:
+            if _matches(called[-1], prefix):
+                return phase
+    return 'build' if _matches(modules[innermost], 'hashnode_py.resources') else 'client'
+
+
+class Profiler:
+    def __init__(self, interval: float = 0.001):
+        """
+        A sampling profiler attributing the time threads spend in the client to phases: document parsing,
+        validation, the transport, JSON decoding, building resource objects and the rest of the client.
+        Samples are taken from every thread running hashnode_py code, so bulk and background requests
+        count too; time waiting on the network is attributed to the transport.
+        Args:
+            interval (float, optional): The seconds between samples. Defaults to 0.001.
+        """
+        super(Profiler, self).__init__()
+        self.interval = interval
+        self.samples = 0
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.calls = {}
+        self.stacks = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self) -> 'Profiler':
+        """
+        Starts sampling from a background thread.
+        """
+        if self._thread is not None:
+            raise ValueError("The profiler is already running")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='hashnode-profiler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stops sampling. The collected samples are kept, and start() adds to them.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        own = threading.get_ident()
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            weight, last = now - last, now
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._sample(frame, weight)
+
+    def _sample(self, frame, weight: float):
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        modules = [_module(f) for f in frames]
+        outermost = next((i for i in range(len(frames) - 1, -1, -1) if _is_client(modules[i])), None)
+        if outermost is None:
+            return
+        phase = classify(modules[:outermost + 1])
+        call = frames[outermost].f_code.co_qualname
+        stack = ';'.join(f'{modules[i]}:{frames[i].f_code.co_qualname}' for i in range(outermost, -1, -1))
+        with self._lock:
+            self.samples += 1
+            self.phases[phase] += weight
+            phases = self.calls.setdefault(call, dict.fromkeys(PHASES, 0.0))
+            phases[phase] += weight
+            self.stacks[stack] = self.stacks.get(stack, 0.0) + weight
+
+    def report(self) -> dict:
+        """
+        Returns the sampled seconds per phase, overall and per outermost client call, e.g.
+        {'samples': 120, 'phases': {'transport': 0.09, ...}, 'calls': {'HashnodeClient.get_user': {...}}}.
+        """
+        with self._lock:
+            return {
+                'samples': self.samples,
+                'phases': dict(self.phases),
+                'calls': {call: dict(phases) for call, phases in self.calls.items()},
+            }
+
+    def collapsed(self) -> str:
+        """
+        Returns the samples as collapsed stacks, one 'module:function;...;module:function <microseconds>'
+        line per stack, the format read by flamegraph.pl, speedscope and inferno.
+        """
+        with self._lock:
+            stacks = sorted(self.stacks.items())
+        return ''.join(f'{stack} {round(seconds * 1e6)}\n' for stack, seconds in stacks)
+
+    def dump(self, path: str):
+        """
+        Writes the collapsed stacks to a file.
+        """
+        with open(path, 'w') as f:
+            f.write(self.collapsed())
@@ -0,0 +1,15 @@
+from hashnode_py.queries import (
+    follow_queries, mutations, post_queries, publication_queries, tag_queries, user_queries)
+
+
+def _collect(*modules) -> dict:
+    return {
+        name: value
+        for module in modules
+        for name, value in vars(module).items()
+        if not name.startswith('_') and isinstance(value, str)
+    }
+
+
+QUERIES = _collect(follow_queries, post_queries, publication_queries, tag_queries, user_queries)
+MUTATIONS = _collect(mutations)
@@ -0,0 +1,90 @@
+from functools import lru_cache
+
+from graphql import FieldNode, OperationDefinitionNode, parse, print_ast
+
+from hashnode_py.documents import MAX_DOCUMENTS, documents
+from hashnode_py.queries.post_queries import post_info
+from hashnode_py.queries.publication_queries import publication_info
+from hashnode_py.queries.tag_queries import tag_info
+from hashnode_py.queries.user_queries import user_info
+
+# kind: (root field, argument name, argument type, query whose selection is reused)
+LOOKUPS = {
+    'post': ('post', 'id', 'ID!', post_info),
+    'user': ('user', 'username', 'String!', user_info),
+    'tag': ('tag', 'slug', 'String!', tag_info),
+    'publication': ('publication', 'host', 'String', publication_info),
+}
+
+
+@lru_cache(maxsize=None)
+def root_selection(query: str, field: str) -> str:
+    """
+    Returns the printed selection set of a root field of a query.
+    Args:
+        query (str): The GraphQL query text.
+        field (str): The name of the root field.
+    Returns:
+        str: The selection set, braces included.
+    """
+    document = parse(query)
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            for selection in definition.selection_set.selections:
+                if isinstance(selection, FieldNode) and selection.name.value == field:
+                    return print_ast(selection.selection_set)
+    raise ValueError(f"Query has no root field {field!r}")
+
+
+def project_query(query: str, path: tuple, keep: frozenset) -> str:
+    """
+    Returns a copy of a query whose entity selection only keeps the given fields.
+    Args:
+        query (str): The GraphQL query text.
+        path (tuple): The field names leading from the root to the entity, e.g. ('feed', 'edges', 'node').
+        keep (frozenset): The names of the entity fields to keep.
+    Returns:
+        str: The projected query text.
+    """
+    # Marked on every call, as the document cache forgets the least recently used texts.
+    return documents.own(_project_query(query, path, keep))
+
+
+@lru_cache(maxsize=MAX_DOCUMENTS)
+def _project_query(query: str, path: tuple, keep: frozenset) -> str:
+    document = parse(query)
+    node = next(d for d in document.definitions if isinstance(d, OperationDefinitionNode))
+    for name in path:
+        node = next(s for s in node.selection_set.selections
+                    if isinstance(s, FieldNode) and s.name.value == name)
+    node.selection_set.selections = tuple(
+        s for s in node.selection_set.selections if isinstance(s, FieldNode) and s.name.value in keep)
+    return print_ast(document)
+
+
+@lru_cache(maxsize=MAX_DOCUMENTS)
+def _batch_query(kind: str, count: int, keep: frozenset = None) -> str:
+    field, argument, argument_type, query = LOOKUPS[kind]
+    if keep:
+        query = project_query(query, (field,), keep)
+    selection = root_selection(query, field)
+    arguments = ', '.join(f'$k{i}: {argument_type}' for i in range(count))
+    fields = '\n'.join(f'  k{i}: {field}({argument}: $k{i}) {selection}' for i in range(count))
+    return f'query Batch{kind.title()}({arguments}) {{\n{fields}\n}}'
+
+
+def batch_query(kind: str, keys: list, keep: frozenset = None) -> tuple[str, dict]:
+    """
+    Builds one query looking up many entities of the same kind under the aliases k0, k1, ...
+    The query text only depends on the number of keys, so parsed documents are reused.
+    Args:
+        kind (str): One of 'post', 'user', 'tag' or 'publication'.
+        keys (list): The ids, usernames, slugs or hosts to look up.
+        keep (frozenset, optional): The entity fields to select. Defaults to all.
+    Returns:
+        tuple: The query text and its variables.
+    """
+    if kind not in LOOKUPS:
+        raise ValueError(f"Unknown lookup kind {kind!r}, expected one of {sorted(LOOKUPS)}")
+    variables = {f'k{i}': key for i, key in enumerate(keys)}
+    return documents.own(_batch_query(kind, len(keys), keep)), variables
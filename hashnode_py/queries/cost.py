@@ -0,0 +1,84 @@
+from graphql import FieldNode, InlineFragmentNode, OperationDefinitionNode, VariableNode
+
+from hashnode_py.documents import documents
+
+# field name: weight, for fields costing more to resolve than a scalar
+WEIGHTS = {
+    'content': 10,
+    'markdown': 20,
+    'html': 20,
+    'text': 5,
+    'comments': 5,
+    'replies': 5,
+    'drafts': 5,
+    'posts': 5,
+    'followers': 3,
+    'follows': 3,
+}
+
+# The arguments setting the number of nodes of a list field.
+PAGE_ARGUMENTS = ('first', 'last', 'pageSize')
+
+# The budget a single request should stay within.
+DEFAULT_BUDGET = 1500
+
+
+def _page_size(field: FieldNode, variables: dict) -> int:
+    for argument in field.arguments or ():
+        if argument.name.value in PAGE_ARGUMENTS:
+            value = argument.value
+            if isinstance(value, VariableNode):
+                value = variables.get(value.name.value)
+                return 1 if value is None else int(value)
+            return int(getattr(value, 'value', 1))
+    return 1
+
+
+def _selection_cost(selection_set, variables: dict, weights: dict) -> int:
+    if selection_set is None:
+        return 0
+    cost = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            children = _selection_cost(selection.selection_set, variables, weights)
+            cost += weights.get(selection.name.value, 1) + _page_size(selection, variables) * children
+        elif isinstance(selection, InlineFragmentNode):
+            cost += _selection_cost(selection.selection_set, variables, weights)
+    return cost
+
+
+def estimate(query: str, variables: dict = None, weights: dict = None) -> int:
+    """
+    Estimates the cost of a request: every field costs its weight, and the selection of a paginated
+    field costs once per requested node, so nesting and page sizes multiply.
+    Args:
+        query (str): The GraphQL query text.
+        variables (dict, optional): The variables of the request, used to resolve page sizes.
+        weights (dict, optional): Field weights replacing WEIGHTS.
+    Returns:
+        int: The estimated cost.
+    """
+    document = documents.parse(query)
+    weights = WEIGHTS if weights is None else weights
+    return sum(
+        _selection_cost(definition.selection_set, variables or {}, weights)
+        for definition in document.definitions
+        if isinstance(definition, OperationDefinitionNode)
+    )
+
+
+def items_within(cost_of, budget: int = DEFAULT_BUDGET, maximum: int = None) -> int:
+    """
+    Returns the largest number of items a request can ask for within a budget.
+    Args:
+        cost_of: A callable returning the cost of a request for a number of items.
+        budget (int, optional): The cost a request should stay within. Defaults to DEFAULT_BUDGET.
+        maximum (int, optional): The most items a request may ask for, e.g. the API page size limit.
+    Returns:
+        int: The number of items, at least 1.
+    """
+    one = cost_of(1)
+    per_item = max(1, cost_of(2) - one)
+    base = one - per_item
+    count = max(1, (budget - base) // per_item)
+    return min(count, maximum) if maximum else count
@@ -0,0 +1,58 @@
+ALL = None
+ANY = '*'
+
+_POST_LISTS = [('Feed', ALL), ('UserPosts', ALL), ('PublicationPosts', ALL)]
+_POST = [('Post', {'id': 'postId'}), ('BatchPost', {ANY: 'postId'})]
+_COMMENTS = [('GetComments', ALL)]
+_DRAFTS = [('PublicationDrafts', ALL)]
+
+# mutation: [(cached query operation, {query variable: mutation variable} or ALL)]
+# ANY as the query variable matches entries where any variable has the mutation's value.
+INVALIDATES = {
+    'PublishPost': _POST_LISTS,
+    'UpdatePost': _POST + _POST_LISTS,
+    'RemovePost': _POST + _POST_LISTS + [('GetComments', {'id': 'postId'})],
+    'LikePost': _POST + _POST_LISTS,
+    'AddComment': _POST + [('GetComments', {'id': 'postId'})],
+    'UpdateComment': _COMMENTS,
+    'RemoveComment': _COMMENTS,
+    'LikeComment': _COMMENTS,
+    'AddReply': _COMMENTS,
+    'UpdateReply': _COMMENTS,
+    'RemoveReply': _COMMENTS,
+    'ToggleFollow': [
+        ('User', {'username': 'username'}),
+        ('BatchUser', {ANY: 'username'}),
+        ('Followers', {'username': 'username'}),
+        ('Follows', ALL),
+    ],
+    'PublishDraft': _DRAFTS + _POST_LISTS,
+    'ScheduleDraft': _DRAFTS,
+    'RescheduleDraft': _DRAFTS,
+    'CancelScheduledDraft': _DRAFTS,
+    'CreateWebhook': [],
+    'UpdateWebhook': [],
+    'DeleteWebhook': [],
+}
+
+
+def invalidations(mutation: str, variables: dict):
+    """
+    Returns the cached query entries made stale by a mutation.
+    Args:
+        mutation (str): The mutation operation name.
+        variables (dict): The variables the mutation was sent with.
+    Returns:
+        list: (operation, match) pairs, where match is a dict of query variable values or ALL.
+            None if the mutation is unknown, in which case the whole cache should be dropped.
+    """
+    rules = INVALIDATES.get(mutation)
+    if rules is None:
+        return None
+    result = []
+    for operation, match in rules:
+        if match is ALL:
+            result.append((operation, ALL))
+        else:
+            result.append((operation, {name: variables.get(source) for name, source in match.items()}))
+    return result
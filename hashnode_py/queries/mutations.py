@@ -268,7 +268,7 @@ mutation UpdateReply(
 """
 
 remove_reply = """
-mutation UpdateReply(
+mutation RemoveReply(
   $commentId: ID!
   $replyId: ID!
 ){
@@ -308,7 +308,7 @@ mutation PublishDraft(
 """
 
 schedule_draft = """
-mutation RescheduleDraft(
+mutation ScheduleDraft(
   $draftId: ID!
   $publishAt: DateTime!
   $authorId: ID!
@@ -356,7 +356,7 @@ mutation RescheduleDraft(
 """
 
 cancel_schedule = """
-mutation RescheduleDraft(
+mutation CancelScheduledDraft(
   $draftId: ID!
 ){
   cancelScheduledDraft(
@@ -372,7 +372,7 @@ mutation RescheduleDraft(
 """
 
 create_webhook = """
-mutation Webhook(
+mutation CreateWebhook(
   $publicationId: ID!
   $url: String!
   $events: [WebhookEvent!]!
@@ -400,7 +400,7 @@ mutation Webhook(
 """
 
 update_webhook = """
-mutation Webhook(
+mutation UpdateWebhook(
   $webhookId: ID!
   $url: String!
   $events: [WebhookEvent!]!
@@ -428,7 +428,7 @@ mutation Webhook(
 """
 
 remove_webhook = """
-mutation Webhook(
+mutation DeleteWebhook(
   $webhookId: ID!
 ){
   deleteWebhook(
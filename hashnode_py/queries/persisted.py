@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+from hashnode_py.documents import documents
+from hashnode_py.queries import MUTATIONS, QUERIES
+
+
+@lru_cache(maxsize=None)
+def persisted_hashes() -> dict:
+    """
+    Returns the persisted query hash of every query and mutation of the package, computing them once.
+    Returns:
+        dict: The SHA-256 hash sent in place of the document, keyed by query name, e.g. {'post_info': '...'}.
+    """
+    return {name: documents.digest(documents.parse(text)) for name, text in {**QUERIES, **MUTATIONS}.items()}
@@ -34,12 +34,14 @@ comments = """
 query GetComments(
   $id: ID!
   $first: Int!
+  $after: String
 ) {
   post(
     id: $id,
   ) {
     comments(
       first: $first
+      after: $after
     ){
       edges{
         node{
@@ -52,6 +54,10 @@ query GetComments(
           myTotalReactions
         }
       }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
     }
   }
 }
@@ -64,9 +70,11 @@ query Feed(
   $minReadTime:  Int
   $maxReadTime: Int
   $tags: [ObjectId!]
+  $after: String
 ){
   feed(
     first: $first
+    after: $after
     filter: {
       type: $type
       minReadTime: $minReadTime
@@ -99,6 +107,10 @@ query Feed(
         content{markdown}
       }
     }
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
   }
 }
 """
\ No newline at end of file
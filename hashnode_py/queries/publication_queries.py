@@ -23,14 +23,15 @@ query Publication(
 """
 
 drafts = """
-query Publication(
+query PublicationDrafts(
   $id: ObjectId
   $first: Int!
+  $after: String
 ) {
   publication(
     id: $id
   ) {
-    drafts(first: $first){
+    drafts(first: $first, after: $after){
       edges{
         node{
           id
@@ -50,7 +51,55 @@ query Publication(
           lastFailedBackupAt
         }
       }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
     }
   }
 }
-"""
\ No newline at end of file
+"""
+publication_posts = """
+query PublicationPosts(
+  $host: String
+  $first: Int!
+  $after: String
+) {
+  publication(
+    host: $host
+  ) {
+    id
+    posts(first: $first, after: $after){
+      edges{
+        node{
+          id
+          slug
+          title
+          subtitle
+          author{username}
+          url
+          publication{title}
+          cuid
+          coverImage{url}
+          brief
+          readTimeInMinutes
+          views
+          reactionCount
+          responseCount
+          featured
+          bookmarked
+          featuredAt
+          publishedAt
+          updatedAt
+          isFollowed
+          content{markdown}
+        }
+      }
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+    }
+  }
+}
+"""
@@ -22,7 +22,7 @@ query User($username: String!)
 }
 """
 social_media = """
-query User($username: String!) 
+query SocialMedia($username: String!) 
 {
   user(username: $username) 
   {
@@ -41,7 +41,7 @@ query User($username: String!)
 """
 
 badges = """
-query User($username: String!) 
+query Badges($username: String!) 
 {
   user(username: $username) 
   {
@@ -59,7 +59,7 @@ query User($username: String!)
 """
 
 publications = """
-query User($username: String!) 
+query UserPublications($username: String!) 
 {
   user(username: $username) 
   {
@@ -86,7 +86,7 @@ query User($username: String!)
 """
 
 posts = """
-query User(
+query UserPosts(
   $username: String!
   $page_size: Int!
   $page: Int!
@@ -121,13 +121,17 @@ query User(
         isFollowed
         content{markdown}
       }
+      pageInfo {
+        hasNextPage
+        nextPage
+      }
     }
   }
 }
 """
 
 tags_following = """
-query User(
+query TagsFollowing(
   $username: String!
 ) 
 {
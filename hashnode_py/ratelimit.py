@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+
+# (remaining, reset) header pairs, the IETF draft names first
+_HEADERS = [
+    ('RateLimit-Remaining', 'RateLimit-Reset'),
+    ('X-RateLimit-Remaining', 'X-RateLimit-Reset'),
+]
+
+
+class RateLimiterStats:
+    def __init__(self):
+        """
+        Counters of a rate limiter.
+        """
+        super(RateLimiterStats, self).__init__()
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def as_dict(self) -> dict:
+        """
+        Returns the counters.
+        """
+        return {
+            'requests': self.requests,
+            'throttled': self.throttled,
+            'waited': self.waited,
+        }
+
+
+class RateLimiter:
+    def __init__(self, rate: float = 10, burst: int = None, max_in_flight: int = 10, min_rate: float = 0.5,
+                 adaptive: bool = True):
+        """
+        A token bucket and an in-flight limit shared by every request of a token, across threads and tasks.
+        When adaptive, a 429 halves the rate and pauses requests for its Retry-After; the rate then
+        climbs back with every successful response. Exhausted RateLimit-Remaining headers pause
+        requests until the advertised reset.
+        Args:
+            rate (float, optional): The sustained number of requests per second. Defaults to 10.
+            burst (int, optional): The number of requests that may be sent at once after a quiet period.
+                Defaults to the rate.
+            max_in_flight (int, optional): The maximum number of concurrent requests, or None for no limit.
+                Defaults to 10.
+            min_rate (float, optional): The lowest rate an adaptive limiter slows down to. Defaults to 0.5.
+            adaptive (bool, optional): Whether to adapt to 429s and rate-limit headers. Defaults to True.
+        """
+        super(RateLimiter, self).__init__()
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = self.max_rate = rate
+        self.burst = burst or max(1, int(rate))
+        self.max_in_flight = max_in_flight
+        self.min_rate = min_rate
+        self.adaptive = adaptive
+        self.stats = RateLimiterStats()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        self._async_slots = None
+
+    def _reserve(self) -> float:
+        """
+        Takes a token and returns how long to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(self._paused_until - now, -self._tokens / self.rate if self._tokens < 0 else 0.0)
+            self.stats.requests += 1
+            self.stats.waited += wait
+            return wait
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        if self._slots is not None:
+            self._slots.acquire()
+
+    def release(self):
+        """
+        Frees the in-flight slot of a finished request.
+        """
+        if self._slots is not None:
+            self._slots.release()
+
+    async def aacquire(self):
+        """
+        Waits without blocking the event loop until a request may be sent.
+        """
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        if self.max_in_flight:
+            if self._async_slots is None:
+                self._async_slots = asyncio.Semaphore(self.max_in_flight)
+            await self._async_slots.acquire()
+
+    def arelease(self):
+        """
+        Frees the in-flight slot of a finished asyncio request.
+        """
+        if self._async_slots is not None:
+            self._async_slots.release()
+
+    def throttle(self, retry_after: float = None):
+        """
+        Slows down after a 429: halves the rate and pauses requests for retry_after seconds.
+        """
+        with self._lock:
+            self.stats.throttled += 1
+            if not self.adaptive:
+                return
+            self.rate = max(self.min_rate, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self._paused_until = max(self._paused_until, time.monotonic() + pause)
+            self._tokens = min(self._tokens, 0.0)
+
+    def observe(self, headers=None):
+        """
+        Speeds back up after a successful response and honors its rate-limit headers.
+        """
+        if not self.adaptive:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+            if not headers:
+                return
+            for remaining, reset in _HEADERS:
+                value = headers.get(remaining)
+                if value is None:
+                    continue
+                try:
+                    if int(value) > 0:
+                        return
+                    reset_in = float(headers.get(reset) or 1)
+                except ValueError:
+                    return
+                if reset_in > 1e9:
+                    # An epoch timestamp rather than a number of seconds.
+                    reset_in -= time.time()
+                self._paused_until = max(self._paused_until, time.monotonic() + max(0.0, reset_in))
+                return
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+    async def __aenter__(self):
+        await self.aacquire()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.arelease()
@@ -1,4 +1,8 @@
 class Comment(object):
+    __slots__ = (
+        'client', 'id', 'content', 'author', 'date_added', 'stamp', 'total_reactions', 'my_total_reactions'
+    )
+
     def __init__(self, data: dict, client):
         """
         Initialize the Comment object with the given data and client.
@@ -18,6 +22,8 @@ class Comment(object):
 
 
 class Reply(Comment):
+    __slots__ = ()
+
     def __init__(self, data: dict, client):
         """
         Initialize the Reply object with the given data and client.
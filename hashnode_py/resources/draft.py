@@ -1,9 +1,15 @@
 from hashnode_py.queries.mutations import (
     cancel_schedule, reschedule_draft, schedule_draft)
 from hashnode_py.resources.scheduled_post import ScheduledPost
+from hashnode_py.resources.fields import raw_data, sync_only
 
 
 class Draft:
+    __slots__ = (
+        'client', 'data', 'id', 'slug', 'title', 'subtitle', 'author', 'cover_image', 'read_time', 'content',
+        'updated_at', 'last_backup_status', 'last_backup_at', 'last_successful_backup', 'last_failed_backup'
+    )
+
     def __init__(self, data: dict, client):
         """
         Initialize the Draft object with the given data and client.
@@ -13,7 +19,7 @@ class Draft:
         """
         super(Draft, self).__init__()
         self.client = client
-        self.data = data
+        self.data = raw_data(data, client)
         self.id = data['id']
         self.slug = data['slug']
         self.title = data['title']
@@ -28,6 +34,7 @@ class Draft:
         self.last_successful_backup = data['lastSuccessfulBackupAt']
         self.last_failed_backup = data['lastFailedBackupAt']
 
+    @sync_only
     def schedule(self, author_id: str, publish_at: str) -> ScheduledPost:
         """
         Schedules the draft for publication.
@@ -43,6 +50,7 @@ class Draft:
         data = self.client.fetch_data(query=query, variables=variables)
         return ScheduledPost(data, self.client)
 
+    @sync_only
     def reschedule(self, publish_at: str) -> ScheduledPost:
         """
         ReSchedules the draft for publication.
@@ -57,6 +65,7 @@ class Draft:
         data = self.client.fetch_data(query=query, variables=variables)
         return ScheduledPost(data, self.client)
 
+    @sync_only
     def cancel_schedule(self):
         """
         ReSchedules the draft for publication.
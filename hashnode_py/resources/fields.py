@@ -0,0 +1,131 @@
+import functools
+
+
+class FieldNotFetchedError(AttributeError):
+    """
+    Raised when reading an attribute whose field was left out of the query's fields= selection.
+    """
+
+
+class AsyncClientError(TypeError):
+    """
+    Raised when a blocking method is called on an object returned by AsyncHashnodeClient.
+    """
+
+
+def sync_only(method):
+    """
+    Marks a resource method that sends requests synchronously, so calling it on an object of an
+    AsyncHashnodeClient raises AsyncClientError instead of failing on the unawaited coroutine.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if getattr(self.client, 'is_async', False):
+            name = f'{type(self).__name__}.{method.__name__}'
+            hint = f', await {type(self).__name__}.a{method.__name__}() instead' \
+                if hasattr(type(self), f'a{method.__name__}') else ''
+            raise AsyncClientError(f"{name}() cannot be called on objects returned by AsyncHashnodeClient{hint}")
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+# API keys of the integer and boolean fields; the other fields are strings.
+INTEGER_KEYS = frozenset([
+    'readTimeInMinutes', 'views', 'reactionCount', 'responseCount', 'followersCount', 'followingsCount',
+    'postsCount', 'totalReactions',
+])
+BOOLEAN_KEYS = frozenset([
+    'featured', 'bookmarked', 'isFollowed', 'deactivated', 'following', 'followsBack', 'isPro',
+])
+
+
+def field_kind(path: tuple) -> str:
+    """
+    Returns the type of a field: 'int', 'bool' or 'str'.
+    """
+    if path[-1] in INTEGER_KEYS:
+        return 'int'
+    if path[-1] in BOOLEAN_KEYS:
+        return 'bool'
+    return 'str'
+
+
+def field_value(data: dict, path: tuple):
+    """
+    Returns the value of a field from the dictionary returned by the API, following a nested key.
+    """
+    value = data[path[0]]
+    if len(path) > 1 and value is not None:
+        value = value[path[1]]
+    return value
+
+
+def assign_fields(obj, data: dict, fields: dict):
+    """
+    Copies the fetched fields of data onto obj, skipping the ones the query did not select.
+    Args:
+        obj: The resource object.
+        data (dict): The dictionary returned by the API.
+        fields (dict): The attribute name and (key, nested key) path of every field of the resource.
+    """
+    for name, path in fields.items():
+        if path[0] not in data:
+            continue
+        value = data[path[0]]
+        if len(path) > 1 and value is not None:
+            value = value[path[1]]
+        setattr(obj, name, value)
+
+
+def raw_data(data: dict, client):
+    """
+    Returns the dictionary a resource keeps as its data attribute.
+    Args:
+        data (dict): The dictionary returned by the API.
+        client: The client object, whose keep_raw option decides.
+    Returns:
+        dict: data when the client keeps raw dictionaries, else None so it can be freed.
+    """
+    return data if getattr(client, 'keep_raw', False) else None
+
+
+def is_set(obj, name: str) -> bool:
+    """
+    Whether an attribute was set on obj, without falling back to its __getattr__.
+    """
+    try:
+        object.__getattribute__(obj, name)
+    except AttributeError:
+        return False
+    return True
+
+
+def missing_field(obj, name: str, fields: dict):
+    """
+    Raises the error for an attribute that was not set on obj.
+    Args:
+        obj: The resource object.
+        name (str): The attribute name.
+        fields (dict): The attribute name and path of every field of the resource.
+    """
+    resource = type(obj).__name__
+    if name in fields:
+        raise FieldNotFetchedError(
+            f"{resource}.{name} was not fetched, include '{name}' in fields= to select it")
+    raise AttributeError(f"'{resource}' object has no attribute '{name}'")
+
+
+def select_fields(fields: dict, names) -> frozenset:
+    """
+    Returns the API keys to select for the given attribute names. The id is always selected.
+    Args:
+        fields (dict): The attribute name and path of every field of the resource.
+        names: The attribute names to select.
+    Returns:
+        frozenset: The API keys to keep in the query.
+    """
+    unknown = set(names) - set(fields)
+    if unknown:
+        raise ValueError(f"Unknown fields {sorted(unknown)}, expected any of {sorted(fields)}")
+    return frozenset([fields[name][0] for name in names] + ['id'])
@@ -1,11 +1,45 @@
+import threading
+
 from hashnode_py.queries.post_queries import *
 from hashnode_py.resources.comment import Comment
+from hashnode_py.resources.fields import assign_fields, is_set, missing_field, raw_data, select_fields, sync_only
+from hashnode_py.queries.builder import batch_query
+from hashnode_py.pagination import Paginator, cursor_page
 
 
 class Post:
+    # attribute: (API key, nested key)
+    FIELDS = {
+        'id': ('id',),
+        'slug': ('slug',),
+        'title': ('title',),
+        'subtitle': ('subtitle',),
+        'author': ('author', 'username'),
+        'url': ('url',),
+        'publication': ('publication', 'title'),
+        'cuid': ('cuid',),
+        'cover_image': ('coverImage', 'url'),
+        'brief': ('brief',),
+        'read_time': ('readTimeInMinutes',),
+        'views': ('views',),
+        'reaction_count': ('reactionCount',),
+        'response_count': ('responseCount',),
+        'featured': ('featured',),
+        'bookmarked': ('bookmarked',),
+        'featured_at': ('featuredAt',),
+        'published_at': ('publishedAt',),
+        'updated_at': ('updatedAt',),
+        'is_followed': ('isFollowed',),
+        'content': ('content', 'markdown'),
+    }
+    __slots__ = ('client', 'data', '_content_group') + tuple(FIELDS)
+
     def __init__(self, data: dict, client):
         """
         Initializes a Post object with the provided data and client.
+        Fields left out of a fields= selection are not set and raise FieldNotFetchedError when read,
+        except content, which is fetched on first access when the post belongs to a ContentGroup.
+        data is only kept when the client was created with keep_raw=True, and is None otherwise.
         Args:
             data (dict): The data dictionary containing post information.
             client: The client object.
@@ -14,29 +48,17 @@ class Post:
         """
         super(Post, self).__init__()
         self.client = client
-        self.data = data
-        self.id = data['id']
-        self.slug = data['slug']
-        self.title = data['title']
-        self.subtitle = data['subtitle']
-        self.author = data['author']['username']
-        self.url = data['url']
-        self.publication = data['publication']['title']
-        self.cuid = data['cuid']
-        self.cover_image = data['coverImage']['url'] if data['coverImage'] else None
-        self.brief = data['brief']
-        self.read_time = data['readTimeInMinutes']
-        self.views = data['views']
-        self.reaction_count = data['reactionCount']
-        self.response_count = data['responseCount']
-        self.featured = data['featured']
-        self.bookmarked = data['bookmarked']
-        self.featured_at = data['featuredAt']
-        self.published_at = data['publishedAt']
-        self.updated_at = data['updatedAt']
-        self.is_followed = data['isFollowed']
-        self.content = data['content']['markdown']
+        self.data = raw_data(data, client)
+        self._content_group = None
+        assign_fields(self, data, self.FIELDS)
+
+    def __getattr__(self, name):
+        if name == 'content' and self._content_group is not None:
+            self._content_group.load(self)
+            return self.content
+        missing_field(self, name, self.FIELDS)
 
+    @sync_only
     def get_comments(self, limit: int = 10) -> list:
         """
         Fetches comments for a post.
@@ -52,3 +74,113 @@ class Post:
         nodes = [Comment(i['node'], self.client) for i in edges]
         result = [node for node in nodes]
         return result
+
+    @sync_only
+    def iter_comments(self, page_size: int = 20, limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all comments of a post, following the cursor one page at a time.
+        Args:
+            page_size (int): The number of comments fetched per request. Default to 20.
+            limit (int, optional): The maximum number of comments to yield. Defaults to all.
+            stop (optional): A callable receiving each Comment; iteration ends when it returns True.
+        Returns:
+            Paginator: An iterable of Comment objects.
+        """
+        def fetch_page(after):
+            variables = {'id': self.id, 'first': page_size, 'after': after}
+            data = self.client.fetch_data(query=comments, variables=variables)
+            return cursor_page(data['post']['comments'])
+
+        return Paginator(fetch_page, lambda nodes: [Comment(i, self.client) for i in nodes], limit=limit, stop=stop)
+
+    async def aget_comments(self, limit: int = 10) -> list:
+        """
+        Fetches comments for a post fetched with AsyncHashnodeClient.
+        Args:
+            limit (int): The maximum number of comments to fetch. Default to 10.
+        Returns:
+            list: A list of Comment objects.
+        """
+        query = comments
+        variables = {'id': self.id, 'first': limit}
+        data = await self.client.fetch_data(query=query, variables=variables)
+        edges = data['post']['comments']['edges']
+        return [Comment(i['node'], self.client) for i in edges]
+
+
+class ContentGroup:
+    def __init__(self, client, batch_size: int = 20):
+        """
+        The posts of one result set whose content is fetched on first access.
+        Reading the content of one post also fetches it for the following unloaded posts of the set,
+        batch_size posts per request.
+        Args:
+            client: The client object used to fetch the content.
+            batch_size (int, optional): The number of posts whose content is fetched together. Defaults to 20.
+        """
+        super(ContentGroup, self).__init__()
+        self.client = client
+        self.batch_size = batch_size
+        self.posts = []
+        self._lock = threading.Lock()
+
+    def add(self, post: Post) -> Post:
+        """
+        Attaches a post whose content was not fetched to the group.
+        """
+        post._content_group = self
+        self.posts.append(post)
+        return post
+
+    def load(self, post: Post):
+        """
+        Fetches the content of a post and of the next unloaded posts of the group.
+        Args:
+            post (Post): The post whose content is read.
+        """
+        with self._lock:
+            if is_set(post, 'content'):
+                return
+            start = self.posts.index(post)
+            pending = [p for p in self.posts[start:] + self.posts[:start] if not is_set(p, 'content')]
+            pending = pending[:self.batch_size]
+            query, variables = batch_query('post', [p.id for p in pending], frozenset(['id', 'content']))
+            data = self.client.fetch_data(query=query, variables=variables)
+            for alias, p in zip(variables, pending):
+                node = data.get(alias)
+                p.content = node['content']['markdown'] if node and node['content'] else None
+
+
+def build_posts(nodes: list, client, lazy_content: bool, batch_size: int = 20) -> list:
+    """
+    Builds the Post objects of a result set, grouping them for lazy content loading if needed.
+    Args:
+        nodes (list): The raw post dictionaries.
+        client: The client object.
+        lazy_content (bool): Whether the content of the posts was left out of the query.
+        batch_size (int, optional): The number of posts whose content is fetched together. Defaults to 20.
+    Returns:
+        list: A list of Post objects.
+    """
+    posts = [Post(node, client) for node in nodes]
+    if lazy_content:
+        group = ContentGroup(client, batch_size)
+        posts = [group.add(post) for post in posts]
+    return posts
+
+
+def list_selection(fields: list = None, lazy_content: bool = True) -> tuple:
+    """
+    Returns the keys to select for a list of posts and whether their content is loaded lazily.
+    Content is loaded lazily when lazy_content is set and content is not explicitly listed in fields.
+    Args:
+        fields (list, optional): The Post attributes to fetch. Defaults to all.
+        lazy_content (bool, optional): Whether to leave the content out of the list query. Defaults to True.
+    Returns:
+        tuple: The keys to keep (None for the whole selection) and whether content is lazy.
+    """
+    lazy = lazy_content and not (fields and 'content' in fields)
+    if not fields and not lazy:
+        return None, False
+    names = [name for name in fields or Post.FIELDS if not (lazy and name == 'content')]
+    return select_fields(Post.FIELDS, names), lazy
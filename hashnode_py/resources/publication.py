@@ -4,9 +4,16 @@ from hashnode_py.queries.mutations import (
 from hashnode_py.resources.draft import Draft
 from hashnode_py.queries.publication_queries import drafts
 from hashnode_py.resources.webhook import Webhook
+from hashnode_py.pagination import Paginator, cursor_page
+from hashnode_py.resources.fields import raw_data, sync_only
 
 
 class Publication:
+    __slots__ = (
+        'client', 'data', 'id', 'title', 'display_title', 'description_seo', 'about', 'url', 'author',
+        'header_color', 'ga_tracking_id', 'followers_count', 'pinned_post'
+    )
+
     def __init__(self, data: dict, client):
         """
         Initialize the Tag object with the given data and client.
@@ -16,7 +23,7 @@ class Publication:
         """
         super(Publication, self).__init__()
         self.client = client
-        self.data = data
+        self.data = raw_data(data, client)
         self.id = data['id']
         self.title = data['title']
         self.display_title = data['displayTitle']
@@ -29,6 +36,7 @@ class Publication:
         self.followers_count = data['followersCount']
         self.pinned_post = data['pinnedPost']['id'] if data['pinnedPost'] else None
 
+    @sync_only
     def publish_post(self, title: str, content: str, tags_id: list = None, tags_slug: list[dict] = None,
                      subtitle: str = None, image_url: str = None, slug: str = None, origin_url: str = None,
                      disable_comments: bool = False, publish_as: str = None, series_id: str = None,
@@ -84,6 +92,7 @@ class Publication:
         data = self.client.fetch_data(query=query, variables=variables)
         return f'Successfully published with id: "{data["publishPost"]["post"]["id"]}"'
 
+    @sync_only
     def update_post(self, post_id: str, title: str = None, subtitle: str = None, content: str = None,
                     published_at: datetime = None, tags_id: list = None, tags_slug: list[dict] = None,
                     image_url: str = None, slug: str = None, origin_url: str = None, publication_id: str = None,
@@ -147,6 +156,7 @@ class Publication:
         data = self.client.fetch_data(query=query, variables=variables)
         return f'Successfully Updated with id: "{data["updatePost"]["post"]["id"]}"'
 
+    @sync_only
     def remove_post(self, post_id: str) -> str:
         """
         Removes a post from the specified publication.
@@ -160,6 +170,7 @@ class Publication:
         self.client.fetch_data(query=query, variables=variables)
         return f'Successfully removed"'
 
+    @sync_only
     def get_drafts(self, limit: int = 10) -> list:
         """
         Fetches comments for a post.
@@ -176,6 +187,39 @@ class Publication:
         result = [node for node in nodes]
         return result
 
+    @sync_only
+    def iter_drafts(self, page_size: int = 20, limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all drafts of the publication, following the cursor one page at a time.
+        Args:
+            page_size (int): The number of drafts fetched per request. Default to 20.
+            limit (int, optional): The maximum number of drafts to yield. Defaults to all.
+            stop (optional): A callable receiving each Draft; iteration ends when it returns True.
+        Returns:
+            Paginator: An iterable of Draft objects.
+        """
+        def fetch_page(after):
+            variables = {'id': self.id, 'first': page_size, 'after': after}
+            data = self.client.fetch_data(query=drafts, variables=variables)
+            return cursor_page(data['publication']['drafts'])
+
+        return Paginator(fetch_page, lambda nodes: [Draft(i, self.client) for i in nodes], limit=limit, stop=stop)
+
+    async def aget_drafts(self, limit: int = 10) -> list:
+        """
+        Fetches drafts of a publication fetched with AsyncHashnodeClient.
+        Args:
+            limit (int): The maximum number of drafts to fetch. Default to 10.
+        Returns:
+            list: A list of Draft objects.
+        """
+        query = drafts
+        variables = {'id': self.id, 'first': limit}
+        data = await self.client.fetch_data(query=query, variables=variables)
+        edges = data['publication']['drafts']['edges']
+        return [Draft(i['node'], self.client) for i in edges]
+
+    @sync_only
     def publish_draft(self, draft_id: str) -> str:
         """
         Publishes a draft.
@@ -187,6 +231,7 @@ class Publication:
         data = self.client.fetch_data(query=query, variables=variables)
         return f'Successfully published with id: "{data["publishDraft"]["post"]["id"]}"'
 
+    @sync_only
     def create_webhook(self, url: str, events: list[str], secret: str) -> Webhook:
         """
         Creates a webhook for the publication.
@@ -1,4 +1,9 @@
+from hashnode_py.resources.fields import raw_data
+
+
 class ScheduledPost:
+    __slots__ = ('client', 'data', 'id', 'author', 'draft_id', 'scheduled_date', 'scheduled_by', 'publication_id')
+
     def __init__(self, data: dict, client):
         """
         Initialize the ScheduledPost object with the given data and client.
@@ -9,7 +14,7 @@ class ScheduledPost:
         """
         super(ScheduledPost, self).__init__()
         self.client = client
-        self.data = data
+        self.data = raw_data(data, client)
         self.id = data['id']
         self.author = data['author']['username']
         self.draft_id = data['draft']['id']
@@ -1,4 +1,11 @@
+from hashnode_py.resources.fields import raw_data
+
+
 class Tag:
+    __slots__ = (
+        'client', 'data', 'id', 'name', 'slug', 'logo', 'tagline', 'info', 'followers_count', 'posts_count'
+    )
+
     def __init__(self, data: dict, client):
         """
         Initialize the Tag object with the given data and client.
@@ -8,7 +15,7 @@ class Tag:
         """
         super(Tag, self).__init__()
         self.client = client
-        self.data = data
+        self.data = raw_data(data, client)
         self.id = data['id']
         self.name = data['name']
         self.slug = data['slug']
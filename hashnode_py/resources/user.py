@@ -1,13 +1,36 @@
 from hashnode_py.queries.mutations import *
 from hashnode_py.queries.user_queries import *
 from hashnode_py.resources.publication import Publication
-from hashnode_py.resources.post import Post
+from hashnode_py.resources.post import Post, build_posts, list_selection
 from hashnode_py.resources.tag import Tag
 from hashnode_py.resources.follow import Follows, Followers
 from hashnode_py.resources.comment import Comment, Reply
+from hashnode_py.resources.fields import assign_fields, missing_field, raw_data, select_fields, sync_only
+from hashnode_py.queries.builder import project_query
+from hashnode_py.pagination import Paginator, offset_page
 
 
 class User:
+    # attribute: (API key, nested key)
+    FIELDS = {
+        'username': ('username',),
+        'id': ('id',),
+        'name': ('name',),
+        'bio': ('bio', 'text'),
+        'profile_picture': ('profilePicture',),
+        'followers_count': ('followersCount',),
+        'followings_count': ('followingsCount',),
+        'tagline': ('tagline',),
+        'date_joined': ('dateJoined',),
+        'location': ('location',),
+        'available_for': ('availableFor',),
+        'deactivated': ('deactivated',),
+        'following': ('following',),
+        'follows_back': ('followsBack',),
+        'is_pro': ('isPro',),
+    }
+    __slots__ = ('client', 'data') + tuple(FIELDS)
+
     def __init__(self, data: dict, client):
         """
         Initialize the User object with the given data and client.
@@ -31,26 +54,18 @@ class User:
             following: The follow status of the user.
             follows_back: The follow back status of the user.
             is_pro: The pro-status of the user.
+        Fields left out of a fields= selection are not set and raise FieldNotFetchedError when read.
+        data is only kept when the client was created with keep_raw=True, and is None otherwise.
         """
         super(User, self).__init__()
         self.client = client
-        self.data = data
-        self.username = data['username']
-        self.id = data['id']
-        self.name = data['name']
-        self.bio = data['bio']['text']
-        self.profile_picture = data['profilePicture']
-        self.followers_count = data['followersCount']
-        self.followings_count = data['followingsCount']
-        self.tagline = data['tagline']
-        self.date_joined = data['dateJoined']
-        self.location = data['location']
-        self.available_for = data['availableFor']
-        self.deactivated = data['deactivated']
-        self.following = data['following']
-        self.follows_back = data['followsBack']
-        self.is_pro = data['isPro']
+        self.data = raw_data(data, client)
+        assign_fields(self, data, self.FIELDS)
+
+    def __getattr__(self, name):
+        missing_field(self, name, self.FIELDS)
 
+    @sync_only
     def get_social_media(self, filter: str = 'all'):
         """
         Fetches the social media links of a user.
@@ -78,6 +93,7 @@ class User:
         elif filter in data:
             return social_data[filter]
 
+    @sync_only
     def get_badges(self, filter: str = 'description') -> list:
         """
         Retrieves badges for a user based on the specified filter.
@@ -97,6 +113,7 @@ class User:
             result = [{'badge': badge['name'], filter: badge[filter]} for badge in data]
             return result
 
+    @sync_only
     def get_publications(self, role: bool = False) -> list:
         """
         Retrieves publications for a user based on the specified filter.
@@ -122,22 +139,76 @@ class User:
             result = [node for node in nodes]
             return result
 
-    def get_posts(self, page_size: int, page_number: int):
+    @sync_only
+    def get_posts(self, page_size: int, page_number: int, fields: list[str] = None,
+                  lazy_content: bool = True):
         """
         Retrieves posts for a user based on the specified page size and page number.
         Args:
             page_size (int): The number of posts to retrieve per page.
             page_number (int): The page number to retrieve.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+            lazy_content (bool, optional): Whether the content of the posts is only fetched when first read,
+                unless content is listed in fields. Defaults to True.
         Returns:
             list: A list of dictionaries containing Post objects.
         """
         query = posts
+        keep, lazy = list_selection(fields, lazy_content)
+        if keep:
+            query = project_query(posts, ('user', 'posts', 'nodes'), keep)
         variables = {'username': self.username, 'page_size': page_size, 'page': page_number}
         data = self.client.fetch_data(query=query, variables=variables)
         data = data['user']['posts']['nodes']
-        result = [Post(i, self.client) for i in data]
+        result = build_posts(data, self.client, lazy)
         return result
 
+    @sync_only
+    def iter_posts(self, page_size: int = 20, fields: list[str] = None, lazy_content: bool = True,
+                   limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all posts of the user, one page at a time.
+        Args:
+            page_size (int): The number of posts fetched per request. Defaults to 20.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+            lazy_content (bool, optional): Whether the content of the posts is only fetched when first read,
+                unless content is listed in fields. Defaults to True.
+            limit (int, optional): The maximum number of posts to yield. Defaults to all.
+            stop (optional): A callable receiving each Post; iteration ends when it returns True.
+        Returns:
+            Paginator: An iterable of Post objects.
+        """
+        query = posts
+        keep, lazy = list_selection(fields, lazy_content)
+        if keep:
+            query = project_query(posts, ('user', 'posts', 'nodes'), keep)
+
+        def fetch_page(page):
+            variables = {'username': self.username, 'page_size': page_size, 'page': page}
+            data = self.client.fetch_data(query=query, variables=variables)
+            return offset_page(data['user']['posts'])
+
+        return Paginator(fetch_page, lambda nodes: build_posts(nodes, self.client, lazy),
+                         cursor=1, limit=limit, stop=stop, fields=Post.FIELDS)
+
+    async def aget_posts(self, page_size: int, page_number: int, fields: list[str] = None):
+        """
+        Retrieves posts for a user fetched with AsyncHashnodeClient.
+        Args:
+            page_size (int): The number of posts to retrieve per page.
+            page_number (int): The page number to retrieve.
+            fields (list[str], optional): The Post attributes to fetch, e.g. ['title', 'url']. Defaults to all.
+        Returns:
+            list: A list of Post objects.
+        """
+        query = posts
+        if fields:
+            query = project_query(posts, ('user', 'posts', 'nodes'), select_fields(Post.FIELDS, fields))
+        variables = {'username': self.username, 'page_size': page_size, 'page': page_number}
+        data = await self.client.fetch_data(query=query, variables=variables)
+        return [Post(i, self.client) for i in data['user']['posts']['nodes']]
+
+    @sync_only
     def get_tags_following(self):
         """
         Retrieves tags for a user based on the specified page size and page number.
@@ -151,15 +222,19 @@ class User:
         result = [Tag(i, self.client) for i in data]
         return result
 
-    def get_followers(self, page_size: int, page_number: int) -> Followers:
+    @sync_only
+    def get_followers(self, page_size: int, page_number: int, fields: list[str] = None) -> Followers:
         """
         Retrieves followers for a user based on the specified page size and page number.
+        Args:
+            fields (list[str], optional): The User attributes to fetch for each follower. Defaults to all.
         Returns:
             Followers: A followers objects representing the followers of the specified user.
         """
-        result = self.client.get_followers(self.username, page_size, page_number)
+        result = self.client.get_followers(self.username, page_size, page_number, fields=fields)
         return result
 
+    @sync_only
     def get_follows(self, page_size: int, page_number: int) -> Follows:
         """
         Retrieves follows for a user based on the specified page size and page number.
@@ -169,6 +244,26 @@ class User:
         result = self.client.get_follows(self.username, page_size, page_number)
         return result
 
+    @sync_only
+    def iter_followers(self, page_size: int = 20, fields: list[str] = None,
+                       limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all followers of the user, one page at a time.
+        Returns:
+            Paginator: An iterable of User objects.
+        """
+        return self.client.iter_followers(self.username, page_size, fields=fields, limit=limit, stop=stop)
+
+    @sync_only
+    def iter_follows(self, page_size: int = 20, limit: int = None, stop=None) -> Paginator:
+        """
+        Iterates over all users followed by the user, one page at a time.
+        Returns:
+            Paginator: An iterable of User objects.
+        """
+        return self.client.iter_follows(self.username, page_size, limit=limit, stop=stop)
+
+    @sync_only
     def toggle_follow(self, username: str):
         """
         Follows or unfollows a user based on the specified username and id.
@@ -184,6 +279,7 @@ class User:
         elif not status:
             return f'Successfully unfollowed {username}'
 
+    @sync_only
     def like_post(self, post_id: str, likes: int = 1):
         """
         Likes a post based on the specified post id.
@@ -197,6 +293,7 @@ class User:
         title = data['likePost']['post']['title']
         return f'Successfully liked "{title}"'
 
+    @sync_only
     def like_comment(self, comment_id: str, likes: int = 1):
         """
         Likes a comment based on the specified comment id.
@@ -210,6 +307,7 @@ class User:
         author = data['likeComment']['comment']['author']['username']
         return f'Successfully liked "{author}" comment'
 
+    @sync_only
     def add_comment(self, post_id: str, content: str) -> Comment:
         """
         Adds a comment to a post based on the specified post id and content.
@@ -225,6 +323,7 @@ class User:
         comment_data = data['addComment']['comment']
         return Comment(comment_data, self.client)
 
+    @sync_only
     def update_comment(self, comment_id: str, content: str) -> Comment:
         """
         Updates a comment based on the specified comment id and content.
@@ -240,6 +339,7 @@ class User:
         comment_data = data['updateComment']['comment']
         return Comment(comment_data, self.client)
 
+    @sync_only
     def remove_comment(self, comment_id: str) -> str:
         """
         Removes a comment based on the specified comment id.
@@ -251,6 +351,7 @@ class User:
         self.client.fetch_data(query=query, variables=variables)
         return f'Successfully removed comment'
 
+    @sync_only
     def add_reply(self, comment_id: str, content: str) -> Comment:
         """
         Adds a comment to a post based on the specified post id and content.
@@ -266,6 +367,7 @@ class User:
         comment_data = data['addReply']['reply']
         return Reply(comment_data, self.client)
 
+    @sync_only
     def update_reply(self, comment_id: str, reply_id: str, content: str) -> Comment:
         """
         Updates a comment based on the specified comment id and content.
@@ -282,6 +384,7 @@ class User:
         comment_data = data['updateReply']['reply']
         return Reply(comment_data, self.client)
 
+    @sync_only
     def remove_reply(self, comment_id: str, reply_id: str) -> str:
         """
         Removes a comment based on the specified comment id.
@@ -1,7 +1,10 @@
 from hashnode_py.queries.mutations import update_webhook, remove_webhook
+from hashnode_py.resources.fields import raw_data, sync_only
 
 
 class Webhook:
+    __slots__ = ('client', 'data', 'id', 'publication_id', 'url', 'events', 'secret', 'created_at', 'updated_at')
+
     def __init__(self, data: dict, client):
         """
         Initialize the Webhook object with the given data and client.
@@ -12,7 +15,7 @@ class Webhook:
         """
         super(Webhook, self).__init__()
         self.client = client
-        self.data = data
+        self.data = raw_data(data, client)
         self.id = data['id']
         self.publication_id = data['publication']['id']
         self.url = data['url']
@@ -21,6 +24,7 @@ class Webhook:
         self.created_at = data['createdAt']
         self.updated_at = data['updatedAt']
 
+    @sync_only
     def update(self, url: str = None, events: list[str] = None, secret: str = None):
         """
         Updates a webhook for the publication.
@@ -45,6 +49,7 @@ class Webhook:
         data = self.client.fetch_data(query=query, variables=variables)
         return Webhook(data, self.client)
 
+    @sync_only
     def delete(self):
         """
         Deletes a webhook for the publication.
@@ -0,0 +1,173 @@
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+_CONNECTION_ERRORS = (requests.ConnectionError, requests.Timeout, ConnectionError, TimeoutError)
+if aiohttp is not None:
+    _CONNECTION_ERRORS += (aiohttp.ClientConnectionError,)
+
+
+def retry_after(headers) -> float:
+    """
+    Parses a Retry-After header.
+    Args:
+        headers: The response headers, or None.
+    Returns:
+        float: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    value = headers.get('Retry-After') if headers else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryStats:
+    def __init__(self):
+        """
+        Counters of a retry policy.
+        """
+        super(RetryStats, self).__init__()
+        self.attempts = 0
+        self.retries = 0
+        self.gave_up = 0
+        self.retries_by_operation = {}
+
+    def as_dict(self) -> dict:
+        """
+        Returns the counters.
+        """
+        return {
+            'attempts': self.attempts,
+            'retries': self.retries,
+            'gave_up': self.gave_up,
+            'retries_by_operation': dict(self.retries_by_operation),
+        }
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 4, backoff: float = 0.5, max_backoff: float = 30,
+                 statuses: tuple = (429, 500, 502, 503, 504), safe_mutations: tuple = ()):
+        """
+        Retries requests failing with a transient error, waiting with jittered exponential backoff
+        or as long as the Retry-After header asks. Queries are always retried; mutations only when
+        listed in safe_mutations or sent with fetch_data(..., retry_mutation=True).
+        Args:
+            max_attempts (int, optional): The number of attempts, the first included. Defaults to 4.
+            backoff (float, optional): The upper bound in seconds of the first wait, doubled on every retry.
+                Defaults to 0.5.
+            max_backoff (float, optional): The longest wait in seconds, Retry-After included. Defaults to 30.
+            statuses (tuple, optional): The HTTP statuses retried. Defaults to 429 and 5xx gateway errors.
+            safe_mutations (tuple, optional): Mutation operation names that are safe to retry, e.g. ('UpdatePost',).
+        """
+        super(RetryPolicy, self).__init__()
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.safe_mutations = frozenset(safe_mutations)
+        self.stats = RetryStats()
+        self._lock = threading.Lock()
+
+    def is_transient(self, error: Exception) -> bool:
+        """
+        Whether an error is worth retrying: a connection failure or a retryable HTTP status,
+        whether the response body was plain text or GraphQL errors.
+        """
+        if isinstance(error, (TransportServerError, TransportQueryError)):
+            return getattr(error, 'code', None) in self.statuses
+        return isinstance(error, _CONNECTION_ERRORS)
+
+    def retries(self, operation_type: str, operation: str, safe: bool = False) -> bool:
+        """
+        Whether requests of an operation may be retried at all.
+        """
+        return operation_type != 'mutation' or safe or operation in self.safe_mutations
+
+    def delay(self, attempt: int, error: Exception) -> float:
+        """
+        Returns how long to wait before the next attempt.
+        Args:
+            attempt (int): The number of the failed attempt, starting at 1.
+            error (Exception): The error of the failed attempt.
+        Returns:
+            float: The Retry-After of the error if any, else a random wait up to the exponential backoff.
+        """
+        after = getattr(error, 'retry_after', None)
+        if after is not None:
+            return min(after, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def _count_attempt(self):
+        with self._lock:
+            self.stats.attempts += 1
+
+    def _next_delay(self, error: Exception, attempt: int, retryable: bool, operation: str):
+        if not retryable or not self.is_transient(error):
+            return None
+        with self._lock:
+            if attempt >= self.max_attempts:
+                self.stats.gave_up += 1
+                return None
+            self.stats.retries += 1
+            self.stats.retries_by_operation[operation] = self.stats.retries_by_operation.get(operation, 0) + 1
+        return self.delay(attempt, error)
+
+    def call(self, execute, operation_type: str, operation: str, safe: bool = False):
+        """
+        Calls execute until it succeeds, fails with a permanent error or runs out of attempts.
+        Args:
+            execute: A callable sending the request.
+            operation_type (str): 'query' or 'mutation'.
+            operation (str): The operation name.
+            safe (bool, optional): Whether a mutation is safe to retry. Defaults to False.
+        Returns:
+            The result of execute.
+        """
+        retryable = self.retries(operation_type, operation, safe)
+        attempt = 1
+        while True:
+            self._count_attempt()
+            try:
+                return execute()
+            except Exception as e:
+                wait = self._next_delay(e, attempt, retryable, operation)
+                if wait is None:
+                    raise
+            time.sleep(wait)
+            attempt += 1
+
+    async def acall(self, execute, operation_type: str, operation: str, safe: bool = False):
+        """
+        Awaits execute() like call, sleeping with asyncio between attempts.
+        """
+        retryable = self.retries(operation_type, operation, safe)
+        attempt = 1
+        while True:
+            self._count_attempt()
+            try:
+                return await execute()
+            except Exception as e:
+                wait = self._next_delay(e, attempt, retryable, operation)
+                if wait is None:
+                    raise
+            await asyncio.sleep(wait)
+            attempt += 1
@@ -0,0 +1,19 @@
+from functools import lru_cache
+from importlib import resources
+
+from graphql import GraphQLSchema, build_schema
+
+# The version of the bundled snapshot, bumped whenever data/schema.graphql changes.
+SCHEMA_VERSION = 1
+
+
+@lru_cache(maxsize=None)
+def load_schema() -> GraphQLSchema:
+    """
+    Builds the schema from the snapshot bundled with the package, once per process.
+    It covers the types used by hashnode_py, so documents can be validated without introspection.
+    Returns:
+        GraphQLSchema: The bundled schema.
+    """
+    source = resources.files('hashnode_py').joinpath('data/schema.graphql').read_text(encoding='utf-8')
+    return build_schema(source, assume_valid_sdl=True)
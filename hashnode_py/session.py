@@ -0,0 +1,296 @@
+import threading
+from collections import deque
+
+import requests
+from gql import Client
+from gql.transport.exceptions import TransportAlreadyConnected, TransportQueryError, TransportServerError
+from gql.transport.requests import RequestsHTTPTransport
+from graphql import DocumentNode, print_ast
+from requests.adapters import HTTPAdapter
+
+from hashnode_py.documents import documents
+from hashnode_py.queries.persisted import persisted_hashes
+from hashnode_py.ratelimit import RateLimiter
+from hashnode_py.retry import retry_after
+from hashnode_py.schema import load_schema
+
+HASHNODE_URL = 'https://gql.hashnode.com/'
+
+
+class HashnodeTransport(RequestsHTTPTransport):
+    def __init__(self, url: str, headers: dict, pool_size: int = 10, persisted_queries: bool = False, **kwargs):
+        """
+        Initializes a requests transport whose connection pool is sized for concurrent use.
+        Args:
+            url (str): The GraphQL endpoint.
+            headers (dict): The headers sent with every request.
+            pool_size (int): The maximum number of pooled connections kept open. Defaults to 10.
+            persisted_queries (bool): Whether to send automatic persisted queries: the SHA-256 hash
+                of the document first, and the full document only when the server does not know it.
+                Defaults to False.
+        """
+        super(HashnodeTransport, self).__init__(url=url, headers=headers, use_json=True, **kwargs)
+        self.pool_size = pool_size
+        self.persisted_queries = persisted_queries
+        self.persisted_hits = 0
+        self.persisted_misses = 0
+        self.record_responses = False
+        self._responses = threading.local()
+        if persisted_queries:
+            persisted_hashes()
+
+    def connect(self):
+        """
+        Opens the underlying requests session and mounts a pooled adapter on it.
+        """
+        if self.session is not None:
+            raise TransportAlreadyConnected("Transport is already connected")
+        self.session = requests.Session()
+        self._mount()
+        self.session.hooks['response'].append(self._keep_response)
+
+    def _mount(self):
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        for prefix in 'http://', 'https://':
+            self.session.mount(prefix, adapter)
+
+    def grow_pool(self, pool_size: int):
+        """
+        Enlarges the connection pool, remounting the adapter of an open session. A smaller size is ignored.
+        Requests in flight finish on the previous pool, whose connections are then dropped.
+        Args:
+            pool_size (int): The maximum number of pooled connections kept open.
+        """
+        if pool_size <= self.pool_size:
+            return
+        self.pool_size = pool_size
+        if self.session is not None:
+            self._mount()
+
+    def _keep_response(self, response, *args, **kwargs):
+        # Kept per thread, as response_headers is overwritten by every thread sharing the transport.
+        self._responses.last = response
+        if self.record_responses:
+            if not hasattr(self._responses, 'items'):
+                # Bounded, as clients sharing the session without hooks never pop their responses.
+                self._responses.items = deque(maxlen=8)
+            self._responses.items.append(response)
+
+    def last_response(self) -> requests.Response:
+        """
+        Returns the last HTTP response received by the current thread during its current request, or None.
+        """
+        return getattr(self._responses, 'last', None)
+
+    def pop_responses(self) -> list:
+        """
+        Returns and forgets the last HTTP responses received by the current thread.
+        Responses are only kept while record_responses is set.
+        """
+        items = getattr(self._responses, 'items', None)
+        if not items:
+            return []
+        responses = list(items)
+        items.clear()
+        return responses
+
+    def execute(self, document: DocumentNode, variable_values: dict = None, operation_name: str = None,
+                persisted_queries: bool = None, **kwargs):
+        """
+        Executes a document, attaching the Retry-After of a failed response to its TransportServerError.
+        persisted_queries overrides the transport's setting for this request when not None.
+        """
+        if persisted_queries is None:
+            persisted_queries = self.persisted_queries
+        self._responses.last = None
+        try:
+            if persisted_queries:
+                return self._execute_persisted(document, variable_values, operation_name, **kwargs)
+            return super(HashnodeTransport, self).execute(document, variable_values, operation_name, **kwargs)
+        except TransportServerError as e:
+            response = self.last_response()
+            e.retry_after = retry_after(response.headers if response is not None else None)
+            raise
+
+    def _execute_persisted(self, document: DocumentNode, variable_values: dict = None,
+                           operation_name: str = None, **kwargs):
+        payload = {'extensions': {'persistedQuery': {'version': 1, 'sha256Hash': documents.digest(document)}}}
+        if variable_values:
+            payload['variables'] = variable_values
+        if operation_name:
+            payload['operationName'] = operation_name
+        # The json body replaces the one gql builds, which would carry the full query text.
+        result = super(HashnodeTransport, self).execute(
+            document, variable_values, operation_name, extra_args={'json': payload}, **kwargs)
+        if not _persisted_query_not_found(result):
+            self.persisted_hits += 1
+            return result
+        self.persisted_misses += 1
+        payload['query'] = print_ast(document)
+        return super(HashnodeTransport, self).execute(
+            document, variable_values, operation_name, extra_args={'json': payload}, **kwargs)
+
+
+def _persisted_query_not_found(result) -> bool:
+    for error in result.errors or ():
+        code = (error.get('extensions') or {}).get('code')
+        if code == 'PERSISTED_QUERY_NOT_FOUND' or error.get('message') == 'PersistedQueryNotFound':
+            return True
+    return False
+
+
+class HashnodeSession:
+    def __init__(self, token: str, url: str = HASHNODE_URL, transport=None,
+                 fetch_schema: bool = False, pool_size: int = 10, rate_limiter: RateLimiter = None,
+                 persisted_queries: bool = False):
+        """
+        Holds the transport, the gql client and the schema shared by every object of a token.
+        Args:
+            token (str): The token used for authorization.
+            url (str, optional): The GraphQL endpoint. Defaults to the public Hashnode API.
+            transport (optional): A gql sync transport to use instead of the default HashnodeTransport.
+            fetch_schema (bool, optional): Whether to introspect the live schema on first use instead of
+                using the snapshot bundled with the package. Defaults to False.
+            pool_size (int, optional): The size of the HTTP connection pool. Defaults to 10.
+            rate_limiter (RateLimiter, optional): Paces every request of the session. Defaults to no limit.
+            persisted_queries (bool, optional): Whether the default transport sends automatic persisted
+                queries, unless a client asks otherwise. Defaults to False.
+        """
+        super(HashnodeSession, self).__init__()
+        self.token = token
+        self.rate_limiter = rate_limiter
+        self.transport = transport or HashnodeTransport(
+            url=url,
+            headers={'Authorization': token},
+            pool_size=pool_size,
+            persisted_queries=persisted_queries,
+        )
+        self.client = Client(
+            transport=self.transport,
+            fetch_schema_from_transport=fetch_schema
+        )
+        self._session = None
+        self._lock = threading.Lock()
+
+    def connect(self):
+        """
+        Opens the pooled HTTP session once and fetches the schema if needed.
+        Returns:
+            SyncClientSession: The connected gql session.
+        """
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self.client.connect_sync()
+        return self._session
+
+    @property
+    def schema(self):
+        """
+        The schema documents are validated against: the introspected one when fetch_schema is set,
+        otherwise the bundled snapshot, loaded on first use.
+        """
+        return self.client.schema or load_schema()
+
+    @property
+    def introspects(self) -> bool:
+        """
+        Whether the schema is the live one rather than the bundled snapshot.
+        """
+        return bool(self.client.fetch_schema_from_transport)
+
+    def execute(self, document: DocumentNode, variables: dict = None, validate: bool = False,
+                persisted_queries: bool = None) -> dict:
+        """
+        Executes a parsed document over the shared connection.
+        Args:
+            document (DocumentNode): The parsed GraphQL document.
+            variables (dict, optional): The variables used in the document.
+            validate (bool, optional): Whether to validate the document against the schema, only the first
+                time it is executed. Defaults to False.
+            persisted_queries (bool, optional): Whether to send it as a persisted query. Defaults to the
+                setting of the transport.
+        Returns:
+            dict: The data returned from the query.
+        """
+        self.connect()
+        if validate:
+            documents.validate(document, self.schema)
+        kwargs = {}
+        if persisted_queries is not None and isinstance(self.transport, HashnodeTransport):
+            kwargs['persisted_queries'] = persisted_queries
+        if self.rate_limiter is None:
+            result = self.transport.execute(document, variable_values=variables, **kwargs)
+        else:
+            result = self._limited_execute(document, variables, **kwargs)
+        if result.errors:
+            error = TransportQueryError(
+                str(result.errors[0]),
+                errors=result.errors,
+                data=result.data,
+                extensions=result.extensions,
+            )
+            # GraphQL errors sent with a 429 or 5xx status carry it, so they are retried like plain-text ones.
+            response = self._last_response()
+            if response is not None and response.status_code >= 400:
+                error.code = response.status_code
+                error.retry_after = retry_after(response.headers)
+            raise error
+        return result.data
+
+    def _last_response(self):
+        last_response = getattr(self.transport, 'last_response', None)
+        return last_response() if last_response is not None else None
+
+    def _limited_execute(self, document: DocumentNode, variables: dict, **kwargs):
+        with self.rate_limiter:
+            try:
+                result = self.transport.execute(document, variable_values=variables, **kwargs)
+            except TransportServerError as e:
+                if e.code == 429:
+                    self.rate_limiter.throttle(getattr(e, 'retry_after', None))
+                raise
+        # A 429 with a GraphQL error body returns a result, so the status is read from this thread's response.
+        response = self._last_response()
+        status = response.status_code if response is not None else None
+        if status == 429:
+            self.rate_limiter.throttle(retry_after(response.headers))
+        elif status is None or status < 400:
+            self.rate_limiter.observe(response.headers if response is not None else None)
+        return result
+
+    def close(self):
+        """
+        Closes the pooled HTTP session. The next request opens a new one.
+        """
+        with self._lock:
+            if self._session is not None:
+                self.client.close_sync()
+                self._session = None
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_session(token: str, pool_size: int = 10, rate_limiter: RateLimiter = None) -> HashnodeSession:
+    """
+    Returns the shared session of a token, creating it on first use.
+    Args:
+        token (str): The token used for authorization.
+        pool_size (int, optional): The size of the connection pool, grown if the session exists with
+            a smaller one. Defaults to 10.
+        rate_limiter (RateLimiter, optional): The rate limiter of the token, replacing the current one if given.
+    Returns:
+        HashnodeSession: The session shared by every client using this token.
+    """
+    with _sessions_lock:
+        session = _sessions.get(token)
+        if session is None:
+            session = HashnodeSession(token, pool_size=pool_size)
+            _sessions[token] = session
+        elif isinstance(session.transport, HashnodeTransport):
+            session.transport.grow_pool(pool_size)
+        if rate_limiter is not None:
+            session.rate_limiter = rate_limiter
+        return session
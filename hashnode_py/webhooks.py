@@ -0,0 +1,174 @@
+import hashlib
+import hmac
+import json
+import time
+
+from hashnode_py.queries.post_queries import post_info
+
+SIGNATURE_HEADER = 'x-hashnode-signature'
+
+# event type: the mutation whose cache invalidation rules apply
+_INVALIDATES_AS = {
+    'post_published': 'PublishPost',
+    'post_updated': 'UpdatePost',
+    'post_deleted': 'RemovePost',
+}
+
+
+class WebhookSignatureError(ValueError):
+    """
+    Raised when a webhook request is unsigned, wrongly signed or too old.
+    """
+
+
+class WebhookEvent:
+    def __init__(self, data: dict):
+        """
+        Initialize the WebhookEvent object with the payload of a webhook request.
+        Args:
+            data (dict): The decoded JSON body, {'metadata': {'uuid'}, 'data': {'eventType', 'publication', ...}}.
+        """
+        super(WebhookEvent, self).__init__()
+        self.data = data
+        self.uuid = data.get('metadata', {}).get('uuid')
+        event = data['data']
+        self.event_type = event['eventType']
+        self.publication_id = event['publication']['id'] if event.get('publication') else None
+        self.post_id = event['post']['id'] if event.get('post') else None
+        self.static_page_id = event['staticPage']['id'] if event.get('staticPage') else None
+
+
+def sign(body: bytes, secret: str, timestamp: int) -> str:
+    """
+    Returns the signature header Hashnode sends with a webhook body.
+    Args:
+        body (bytes): The raw request body.
+        secret (str): The secret of the webhook.
+        timestamp (int): The signing time in milliseconds.
+    Returns:
+        str: The header value, 't=<timestamp>,v1=<hex HMAC-SHA256 of "<timestamp>.<body>">'.
+    """
+    signed = f'{timestamp}.'.encode() + body
+    digest = hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
+    return f't={timestamp},v1={digest}'
+
+
+def verify_signature(body: bytes, header: str, secret: str, tolerance: float = 300):
+    """
+    Checks the signature of a webhook request.
+    Args:
+        body (bytes): The raw request body.
+        header (str): The x-hashnode-signature header.
+        secret (str): The secret of the webhook.
+        tolerance (float, optional): How old in seconds a signature may be, against replays. Defaults to 300.
+    """
+    if not header:
+        raise WebhookSignatureError(f"Missing {SIGNATURE_HEADER} header")
+    parts = dict(part.split('=', 1) for part in header.split(',') if '=' in part)
+    if 't' not in parts or 'v1' not in parts or not parts['t'].isdigit():
+        raise WebhookSignatureError(f"Malformed {SIGNATURE_HEADER} header")
+    timestamp = int(parts['t'])
+    if abs(time.time() - timestamp / 1000) > tolerance:
+        raise WebhookSignatureError("Webhook signature timestamp is outside the tolerance")
+    expected = sign(body, secret, timestamp).split('v1=', 1)[1]
+    if not hmac.compare_digest(expected, parts['v1']):
+        raise WebhookSignatureError("Webhook signature does not match")
+
+
+def parse_event(body: bytes) -> WebhookEvent:
+    """
+    Decodes a webhook body.
+    Args:
+        body (bytes): The raw request body.
+    Returns:
+        WebhookEvent: The event.
+    """
+    try:
+        return WebhookEvent(json.loads(body))
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid webhook payload: {e}") from e
+
+
+class WebhookReceiver:
+    def __init__(self, secret: str, client=None, mirror=None, on_event=None, tolerance: float = 300):
+        """
+        A WSGI application receiving Hashnode webhooks. Verified post events evict the client's cached
+        queries and update the mirror, so neither has to be refreshed by polling.
+        Args:
+            secret (str): The secret the webhook was created with.
+            client (optional): The HashnodeClient whose cache is invalidated and which fetches updated posts.
+            mirror (optional): A hashnode_py.mirror.Mirror kept current with published, updated and deleted posts.
+            on_event (optional): A callable receiving every verified WebhookEvent.
+            tolerance (float, optional): How old in seconds a signature may be. Defaults to 300.
+        """
+        super(WebhookReceiver, self).__init__()
+        if not secret:
+            raise ValueError("No secret provided")
+        if mirror is not None and client is None:
+            raise ValueError("A client is needed to update the mirror")
+        self.secret = secret
+        self.client = client
+        self.mirror = mirror
+        self.on_event = on_event
+        self.tolerance = tolerance
+
+    def receive(self, body: bytes, signature: str) -> WebhookEvent:
+        """
+        Verifies, parses and handles one webhook request.
+        Args:
+            body (bytes): The raw request body.
+            signature (str): The x-hashnode-signature header.
+        Returns:
+            WebhookEvent: The handled event.
+        """
+        verify_signature(body, signature, self.secret, self.tolerance)
+        event = parse_event(body)
+        self.handle(event)
+        return event
+
+    def handle(self, event: WebhookEvent):
+        """
+        Applies an event to the client cache and the mirror, then passes it to on_event.
+        """
+        mutation = _INVALIDATES_AS.get(event.event_type)
+        if mutation and self.client is not None:
+            self.client.invalidate(mutation, {'postId': event.post_id})
+        if mutation and self.mirror is not None:
+            if event.event_type == 'post_deleted':
+                self.mirror.remove_post(event.post_id)
+            else:
+                data = self.client.fetch_data(query=post_info, variables={'id': event.post_id}, use_cache=False)
+                if data['post'] is not None:
+                    self.mirror.store_post(event.publication_id, data['post'])
+        if self.on_event is not None:
+            self.on_event(event)
+
+    def __call__(self, environ, start_response):
+        if environ['REQUEST_METHOD'] != 'POST':
+            return _respond(start_response, '405 Method Not Allowed')
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+        body = environ['wsgi.input'].read(length)
+        try:
+            verify_signature(body, environ.get('HTTP_X_HASHNODE_SIGNATURE'), self.secret, self.tolerance)
+            event = parse_event(body)
+        except WebhookSignatureError:
+            return _respond(start_response, '401 Unauthorized')
+        except ValueError:
+            return _respond(start_response, '400 Bad Request')
+        self.handle(event)
+        return _respond(start_response, '200 OK')
+
+    def serve(self, host: str = '0.0.0.0', port: int = 8000):
+        """
+        Serves the receiver with the standard library's WSGI server until interrupted.
+        Production deployments can mount the receiver in any WSGI server instead.
+        """
+        from wsgiref.simple_server import make_server
+
+        with make_server(host, port, self) as server:
+            server.serve_forever()
+
+
+def _respond(start_response, status: str) -> list:
+    start_response(status, [('Content-Type', 'text/plain')])
+    return [status.encode()]
@@ -0,0 +1,127 @@
+import asyncio
+import unittest
+
+from gql.transport import AsyncTransport, Transport
+from graphql import ExecutionResult, print_ast
+
+from hashnode_py.client import HashnodeClient
+from hashnode_py.session import HashnodeSession
+
+
+def user_data(username: str) -> dict:
+    return {
+        'id': f'id-{username}',
+        'username': username,
+        'name': username.title(),
+        'bio': {'text': 'bio'},
+        'profilePicture': None,
+        'followersCount': 1,
+        'followingsCount': 2,
+        'tagline': None,
+        'dateJoined': '2024-01-01T00:00:00Z',
+        'location': None,
+        'availableFor': None,
+        'deactivated': False,
+        'following': False,
+        'followsBack': False,
+        'isPro': False,
+    }
+
+
+def post_data(post_id: str) -> dict:
+    return {
+        'id': post_id,
+        'slug': f'slug-{post_id}',
+        'title': f'Title {post_id}',
+        'subtitle': None,
+        'author': {'username': 'author'},
+        'url': f'https://blog.example.com/{post_id}',
+        'publication': {'title': 'Blog'},
+        'cuid': post_id,
+        'coverImage': None,
+        'brief': 'brief',
+        'readTimeInMinutes': 3,
+        'views': 10,
+        'reactionCount': 1,
+        'responseCount': 0,
+        'featured': False,
+        'bookmarked': False,
+        'featuredAt': None,
+        'publishedAt': '2024-01-01T00:00:00Z',
+        'updatedAt': '2024-01-02T00:00:00Z',
+        'isFollowed': False,
+        'content': {'markdown': f'# {post_id}'},
+    }
+
+
+class FakeTransport(Transport):
+    def __init__(self, handler):
+        """
+        A sync gql transport answering every request with handler(query, variables).
+        """
+        self.handler = handler
+        self.requests = []
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+
+    def close(self):
+        pass
+
+    def execute(self, document, variable_values=None, operation_name=None, **kwargs):
+        query = print_ast(document)
+        self.requests.append((query, variable_values))
+        return ExecutionResult(data=self.handler(query, variable_values or {}))
+
+
+class FakeAsyncTransport(AsyncTransport):
+    def __init__(self, handler, delay: float = 0):
+        """
+        An async gql transport answering every request with handler(query, variables) after a delay.
+        """
+        self.handler = handler
+        self.delay = delay
+        self.requests = []
+        self.connects = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def connect(self):
+        self.connects += 1
+
+    async def close(self):
+        pass
+
+    async def execute(self, document, variable_values=None, operation_name=None, **kwargs):
+        query = print_ast(document)
+        self.requests.append((query, variable_values))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            return ExecutionResult(data=self.handler(query, variable_values or {}))
+        finally:
+            self.in_flight -= 1
+
+    def subscribe(self, document, variable_values=None, operation_name=None):
+        raise NotImplementedError
+
+
+class OfflineClientTest(unittest.TestCase):
+    """
+    A test case whose client is backed by a FakeTransport answering with handler.
+    """
+    # Extra HashnodeClient arguments, e.g. {'batch_size': 5}.
+    client_options = {}
+
+    def handler(self, query: str, variables: dict) -> dict:
+        raise NotImplementedError
+
+    def setUp(self):
+        """
+        Set up a client backed by an offline transport.
+        """
+        self.transport = FakeTransport(self.handler)
+        self.session = HashnodeSession("token", transport=self.transport, fetch_schema=False)
+        self.client = HashnodeClient(token="token", session=self.session, **self.client_options)
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from gql.transport.exceptions import TransportQueryError
+from hashnode_py.async_client import AsyncHashnodeClient
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.resources.fields import AsyncClientError
+from hashnode_py.retry import RetryPolicy
+from tests.fake_transport import FakeAsyncTransport, post_data, user_data
+
+
+def handler(query, variables):
+    if 'comments' in query:
+        return {'post': {'comments': {'edges': []}}}
+    if 'post(' in query:
+        return {'post': post_data(variables['id'])}
+    return {'user': user_data(variables['username'])}
+
+
+class AsyncHashnodeClientTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up an async client backed by an offline transport.
+        """
+        self.transport = FakeAsyncTransport(handler, delay=0.01)
+        self.client = AsyncHashnodeClient(
+            token="token", max_concurrency=4, transport=self.transport, fetch_schema=False)
+
+    def test_gather_is_bounded(self):
+        async def run():
+            async with self.client:
+                return await asyncio.gather(*(self.client.get_user(f'user{i}') for i in range(20)))
+
+        users = asyncio.run(run())
+        self.assertEqual([user.username for user in users], [f'user{i}' for i in range(20)])
+        self.assertEqual(self.transport.connects, 1)
+        self.assertLessEqual(self.transport.max_in_flight, 4)
+        self.assertGreater(self.transport.max_in_flight, 1)
+
+    def test_resource_async_methods(self):
+        async def run():
+            async with self.client:
+                post = await self.client.get_post('p1')
+                return post, await post.aget_comments()
+
+        post, comments = asyncio.run(run())
+        self.assertEqual(post.id, 'p1')
+        self.assertEqual(comments, [])
+        with self.assertRaisesRegex(AsyncClientError, r'await Post\.aget_comments\(\)'):
+            post.get_comments()
+        user = asyncio.run(self.client.get_user('talaat049'))
+        with self.assertRaises(AsyncClientError):
+            user.get_badges()
+
+    def test_graphql_errors_with_a_transient_status_are_retried(self):
+        retry = RetryPolicy(max_attempts=3, backoff=0)
+
+        async def run(url):
+            async with AsyncHashnodeClient("token", url=url, retry=retry) as client:
+                await client.get_tag('python')
+
+        with MockHashnodeServer(error_rate=1.0, error_status=429) as server:
+            with self.assertRaises(TransportQueryError) as raised:
+                asyncio.run(run(server.url))
+            self.assertEqual((raised.exception.code, raised.exception.retry_after), (429, 0.0))
+            self.assertEqual(server.stats.requests, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
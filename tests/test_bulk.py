@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from hashnode_py.async_client import AsyncHashnodeClient
+from hashnode_py.client import HashnodeClient
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeAsyncTransport, FakeTransport, OfflineClientTest, post_data
+
+
+def handler(query, variables):
+    return {alias: None if key == 'missing' else post_data(key) for alias, key in variables.items()}
+
+
+class BulkFetchTest(OfflineClientTest):
+    handler = staticmethod(handler)
+    client_options = {'max_workers': 4, 'batch_size': 5}
+
+    def test_keeps_input_order(self):
+        ids = [f'p{i}' for i in range(20)]
+        result = self.client.get_posts(ids)
+        self.assertTrue(result.ok)
+        self.assertEqual([post.id for post in result], ids)
+
+    def test_batches_lookups_into_aliased_requests(self):
+        self.client.get_posts([f'p{i}' for i in range(12)])
+        self.assertEqual(len(self.transport.requests), 3)
+        query, variables = max(self.transport.requests, key=lambda request: len(request[1]))
+        self.assertIn('k4: post(id: $k4)', query)
+        self.assertEqual(len(variables), 5)
+
+    def test_reports_errors_per_key(self):
+        result = self.client.get_posts(['p1', 'missing', 'p2', 'p1'])
+        self.assertFalse(result.ok)
+        self.assertIsInstance(result.errors['missing'], LookupError)
+        self.assertIsNone(result[1])
+        self.assertEqual([post.id for key, post in result.items() if post], ['p1', 'p2', 'p1'])
+        self.assertEqual(len(self.transport.requests), 1)
+
+
+class CoalescingTest(unittest.TestCase):
+    def test_concurrent_calls_share_one_request(self):
+        transport = FakeTransport(handler)
+        session = HashnodeSession("token", transport=transport, fetch_schema=False)
+        client = HashnodeClient(token="token", session=session, coalesce=True, coalesce_wait=0.05)
+        ids = ['p1', 'p2', 'p1', 'p3']
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            posts = list(executor.map(client.get_post, ids))
+        self.assertEqual([post.id for post in posts], ids)
+        self.assertEqual(len(transport.requests), 1)
+        self.assertEqual(sorted(transport.requests[0][1].values()), ['p1', 'p2', 'p3'])
+        with self.assertRaises(LookupError):
+            client.get_post('missing')
+
+    def test_async_calls_share_one_request(self):
+        transport = FakeAsyncTransport(handler)
+        client = AsyncHashnodeClient(token="token", transport=transport, fetch_schema=False, coalesce=True)
+
+        async def run():
+            async with client:
+                return await asyncio.gather(*(client.get_post(i) for i in ['p1', 'p2', 'p1']))
+
+        posts = asyncio.run(run())
+        self.assertEqual([post.id for post in posts], ['p1', 'p2', 'p1'])
+        self.assertEqual(len(transport.requests), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from hashnode_py.cache import MemoryCache, ResponseCache, SQLiteCache
+from hashnode_py.client import HashnodeClient
+from hashnode_py.queries.mutations import like_post, toggle_follow
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeTransport, user_data
+
+
+def handler(query, variables):
+    if 'likePost' in query:
+        return {'likePost': {'post': {'id': variables['postId'], 'title': 'Title'}}}
+    if 'toggleFollow' in query:
+        return {'toggleFollow': {'user': {'username': variables['username'], 'following': True}}}
+    return {'user': user_data(variables['username'])}
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a cached client backed by an offline transport.
+        """
+        self.transport = FakeTransport(handler)
+        session = HashnodeSession("token", transport=self.transport, fetch_schema=False)
+        self.cache = MemoryCache(max_entries=2)
+        self.client = HashnodeClient(token="token", session=session, cache=self.cache)
+
+    def test_queries_are_cached(self):
+        self.client.get_user('talaat049')
+        user = self.client.get_user('talaat049')
+        self.assertEqual(user.username, 'talaat049')
+        self.assertEqual(len(self.transport.requests), 1)
+        self.assertEqual(self.cache.stats.as_dict()['hits'], 1)
+        self.client.fetch_data(self.transport.requests[0][0], {'username': 'talaat049'}, use_cache=False)
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_mutations_are_not_cached(self):
+        for _ in range(2):
+            self.client.fetch_data(like_post, {'postId': 'p1', 'likesCount': 1})
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_mutations_invalidate_stale_queries(self):
+        self.client.get_user('a')
+        self.client.get_user('b')
+        self.client.fetch_data(toggle_follow, {'username': 'a'})
+        self.assertEqual(len(self.cache), 1)
+        self.assertEqual(self.cache.stats.invalidations, 1)
+        self.client.get_user('b')
+        self.client.get_user('a')
+        self.assertEqual(len(self.transport.requests), 4)
+        self.client.invalidate('Unknown', {})
+        self.assertEqual(len(self.cache), 0)
+
+    def test_stale_while_revalidate(self):
+        cache = MemoryCache(default_ttl=0.1, stale_ttl=60)
+        client = HashnodeClient(token="token", session=self.client.session, cache=cache)
+        user = client.get_user('talaat049')
+        time.sleep(0.11)
+        self.assertIs(client.get_user('talaat049'), user)
+        client.close()
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(cache.stats.stale_hits, 1)
+        self.assertEqual(cache.stats.sets, 1)
+        self.assertIs(client.get_user('talaat049'), user)
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_failed_refreshes_are_counted(self):
+        failing = threading.Event()
+
+        def flaky(query, variables):
+            if failing.is_set():
+                raise ConnectionError('offline')
+            return handler(query, variables)
+
+        cache = MemoryCache(default_ttl=0.05, stale_ttl=60)
+        session = HashnodeSession("token", transport=FakeTransport(flaky), fetch_schema=False)
+        client = HashnodeClient(token="token", session=session, cache=cache)
+        user = client.get_user('talaat049')
+        time.sleep(0.06)
+        failing.set()
+        self.assertIs(client.get_user('talaat049'), user)
+        client.close()
+        self.assertEqual(cache.stats.as_dict()['refresh_errors'], 1)
+
+    def test_refresh_does_not_undo_an_invalidation(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow(query, variables):
+            if 'toggleFollow' not in query and started.is_set():
+                release.wait(5)
+                # Changed since cached, so the refresh would rewrite the entry.
+                return {'user': dict(user_data(variables['username']), name='Renamed')}
+            return handler(query, variables)
+
+        cache = MemoryCache(default_ttl=0.05, stale_ttl=60)
+        session = HashnodeSession("token", transport=FakeTransport(slow), fetch_schema=False)
+        client = HashnodeClient(token="token", session=session, cache=cache)
+        client.get_user('a')
+        time.sleep(0.06)
+        started.set()
+        client.get_user('a')
+        client.fetch_data(toggle_follow, {'username': 'a'})
+        release.set()
+        client.close()
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction_and_ttl(self):
+        for name in ['a', 'b', 'c']:
+            self.client.get_user(name)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.stats.evictions, 1)
+        self.cache.set('key', {'x': 1}, ttl=0.01)
+        time.sleep(0.02)
+        self.assertIsNone(self.cache.get('key'))
+        self.assertEqual(self.cache.stats.expirations, 1)
+
+    def test_lookups_return_copies(self):
+        self.cache.set('key', {'user': {'tags': ['python']}}, ttl=60)
+        self.cache.get('key')['user']['tags'].append('graphql')
+        self.assertEqual(self.cache.get('key'), {'user': {'tags': ['python']}})
+
+    def test_incomplete_caches_cannot_be_created(self):
+        class LookupOnly(ResponseCache):
+            def lookup(self, key: str):
+                return None
+
+        with self.assertRaises(TypeError):
+            LookupOnly()
+
+    def test_sqlite_cache_persists(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache.db')
+            cache = SQLiteCache(path, max_entries=1)
+            cache.set('a', {'user': {'id': 1}}, ttl=60, operation='User', variables={'username': 'a'})
+            cache.set('b', {'user': {'id': 2}}, ttl=60)
+            cache.close()
+            cache = SQLiteCache(path)
+            self.assertIsNone(cache.get('a'))
+            self.assertEqual(cache.get('b'), {'user': {'id': 2}})
+            cache.set('c', {'post': {'id': 'p1'}}, ttl=60, operation='Post', variables={'id': 'p1'})
+            cache.invalidate('Post', {'id': 'p1'})
+            self.assertIsNone(cache.get('c'))
+            cache.max_entries = 2
+            for key in 'bcd':
+                cache.set(key, {'user': {'id': key}}, ttl=60)
+            self.assertEqual((len(cache), cache._size, cache.stats.evictions), (2, 2, 1))
+            cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
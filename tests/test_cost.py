@@ -0,0 +1,37 @@
+import unittest
+from hashnode_py.client import HashnodeClient
+from hashnode_py.queries.builder import batch_query
+from hashnode_py.queries.cost import estimate, items_within
+from hashnode_py.queries.post_queries import feed
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeTransport
+from tests.test_pagination import TOTAL, handler
+
+
+class CostTest(unittest.TestCase):
+    def test_estimate_scales_with_page_size_and_weight(self):
+        small, large = estimate(feed, {'first': 10}), estimate(feed, {'first': 20})
+        self.assertGreater(large, small)
+        self.assertGreater(estimate(feed, {'first': 10}), estimate(feed, {'first': 10}, weights={}))
+        cost_of = lambda n: estimate(feed, {'first': n})
+        count = items_within(cost_of, budget=small)
+        self.assertLessEqual(cost_of(count), small)
+        self.assertGreater(cost_of(count + 1), small)
+
+    def test_large_feed_is_split_within_budget(self):
+        transport = FakeTransport(handler)
+        session = HashnodeSession("token", transport=transport, fetch_schema=False)
+        client = HashnodeClient(token="token", session=session, max_cost=estimate(feed, {'first': 10}))
+        posts = client.get_feed(TOTAL, lazy_content=False)
+        self.assertEqual([post.id for post in posts], [f'p{i}' for i in range(TOTAL)])
+        self.assertEqual([variables['first'] for _, variables in transport.requests], [10] * 5)
+
+    def test_batch_size_stays_within_budget(self):
+        session = HashnodeSession("token", transport=FakeTransport(handler), fetch_schema=False)
+        budget = estimate(batch_query('post', range(5))[0])
+        client = HashnodeClient(token="token", session=session, max_cost=budget)
+        self.assertEqual(client._batch_size('post'), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
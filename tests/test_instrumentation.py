@@ -0,0 +1,71 @@
+import unittest
+from gql.transport.exceptions import TransportQueryError
+from hashnode_py.client import HashnodeClient
+from hashnode_py.instrumentation import MetricsCollector, RequestHooks, SpanEmitter
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.retry import RetryPolicy
+from hashnode_py.session import HashnodeSession
+
+
+class Recorder(RequestHooks):
+    def __init__(self):
+        super(Recorder, self).__init__()
+        self.calls = []
+
+    def on_request_start(self, event):
+        self.calls.append(('start', event.operation))
+
+    def on_response(self, event):
+        self.calls.append(('response', event.as_dict()))
+
+    def on_error(self, event, error):
+        self.calls.append(('error', event.as_dict()))
+
+
+class InstrumentationTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockHashnodeServer(total_items=10).start()
+        self.addCleanup(self.server.stop)
+
+    def client(self, *hooks, retry=None):
+        return HashnodeClient('token', session=HashnodeSession('token', url=self.server.url),
+                              retry=retry, hooks=list(hooks))
+
+    def test_events(self):
+        recorder = Recorder()
+        self.client(recorder).get_tag('python')
+        (kind, operation), (kind_after, event) = recorder.calls
+        self.assertEqual((kind, operation, kind_after), ('start', 'Tag', 'response'))
+        self.assertEqual(event['status'], 200)
+        self.assertEqual(event['retries'], 0)
+        self.assertEqual(event['variables_bytes'], len('{"slug": "python"}'))
+        self.assertEqual(event['request_bytes'], self.server.stats.bytes_in)
+        self.assertEqual(event['response_bytes'], self.server.stats.bytes_out)
+        self.assertLessEqual(event['timings']['ttfb'], event['timings']['total'])
+
+    def test_retries_and_errors(self):
+        recorder, metrics, spans = Recorder(), MetricsCollector(), SpanEmitter()
+        self.server.error_rate = 1.0
+        client = self.client(recorder, metrics, spans, retry=RetryPolicy(max_attempts=3, backoff=0))
+        with self.assertRaises(TransportQueryError):
+            client.get_tag('python')
+        kind, event = recorder.calls[-1]
+        self.assertEqual((kind, event['retries'], event['status']), ('error', 2, 503))
+        self.assertEqual(metrics.as_dict()['Tag']['errors'], 1)
+        self.assertEqual(metrics.as_dict()['Tag']['retries'], 2)
+        self.assertEqual(spans.spans[0]['name'], 'query Tag')
+        self.assertEqual(spans.spans[0]['status']['code'], 'ERROR')
+
+    def test_prometheus_format(self):
+        metrics = MetricsCollector(buckets=(10,))
+        client = self.client(metrics)
+        client.get_tag('python')
+        client.get_tag('graphql')
+        text = metrics.render()
+        self.assertIn('hashnode_requests_total{operation="Tag"} 2\n', text)
+        self.assertIn('hashnode_request_duration_seconds_bucket{operation="Tag",le="10"} 2\n', text)
+        self.assertIn('# TYPE hashnode_request_duration_seconds histogram\n', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+from gql.transport.exceptions import TransportQueryError
+from hashnode_py.client import HashnodeClient
+from hashnode_py.mirror import Mirror
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeTransport, post_data
+
+
+def comment_data(comment_id: str) -> dict:
+    return {
+        'id': comment_id,
+        'content': {'text': 'Nice post'},
+        'author': {'username': 'reader'},
+        'dateAdded': '2024-01-03T00:00:00Z',
+        'stamp': None,
+        'totalReactions': 0,
+        'myTotalReactions': 0,
+    }
+
+
+def connection(nodes: list) -> dict:
+    return {'edges': [{'node': node} for node in nodes], 'pageInfo': {'hasNextPage': False, 'endCursor': None}}
+
+
+class MirrorTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a client whose offline transport serves a publication of two posts.
+        """
+        self.posts = {post_id: post_data(post_id) for post_id in ['p1', 'p2']}
+        # Posts listed by the publication but gone by the time they are fetched.
+        self.deleted = set()
+        self.member = True
+        self.transport = FakeTransport(self.handler)
+        session = HashnodeSession("token", transport=self.transport, fetch_schema=False)
+        self.client = HashnodeClient(token="token", session=session)
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'mirror.db')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def handler(self, query, variables):
+        if 'BatchPost' in query:
+            return {alias: None if post_id in self.deleted else self.posts[post_id]
+                    for alias, post_id in variables.items()}
+        if 'GetComments' in query:
+            if variables['id'] in self.deleted:
+                return {'post': None}
+            return {'post': {'comments': connection([comment_data(f"c-{variables['id']}")])}}
+        if 'PublicationDrafts' in query:
+            if not self.member:
+                raise TransportQueryError('Forbidden', errors=[{'message': 'Forbidden',
+                                                                'extensions': {'code': 'FORBIDDEN'}}])
+            return {'publication': {'drafts': connection([])}}
+        nodes = [{k: v for k, v in post.items() if k != 'content'} for post in self.posts.values()]
+        return {'publication': {'id': 'pub', 'posts': connection(nodes)}}
+
+    def content_requests(self) -> int:
+        return sum('BatchPost' in query for query, _ in self.transport.requests)
+
+    def test_sync_only_fetches_updated_posts(self):
+        result = self.client.sync_publication('blog.example.com', self.path)
+        self.assertEqual(result['fetched'], 2)
+        self.assertEqual(result['comments'], 2)
+
+        self.posts['p2']['updatedAt'] = '2024-02-01T00:00:00Z'
+        self.posts['p2']['content'] = {'markdown': 'edited'}
+        del self.posts['p1']
+        result = self.client.sync_publication('blog.example.com', self.path)
+        self.assertEqual((result['listed'], result['fetched'], result['removed']), (1, 1, 1))
+
+        self.transport.requests.clear()
+        result = self.client.sync_publication('blog.example.com', self.path)
+        self.assertEqual(result['fetched'], 0)
+        self.assertEqual(self.content_requests(), 0)
+
+        mirror = Mirror(self.path)
+        self.assertEqual(mirror.high_water('blog.example.com'), '2024-02-01T00:00:00Z')
+        self.assertEqual([post.content for post in mirror.posts(search='edited')], ['edited'])
+        self.assertIsNone(mirror.post('p1'))
+        self.assertEqual([c.id for c in mirror.comments('p2')], ['c-p2'])
+        mirror.close()
+
+    def test_posts_gone_during_sync_are_fetched_again(self):
+        self.client.sync_publication('blog.example.com', self.path)
+        high_water = Mirror(self.path).high_water('blog.example.com')
+        self.posts['p1']['updatedAt'] = '2024-02-01T00:00:00Z'
+        self.posts['p1']['content'] = {'markdown': 'edited'}
+        self.posts['p1']['responseCount'] = 5
+        self.posts['p2']['updatedAt'] = '2024-03-01T00:00:00Z'
+        self.deleted = {'p1'}
+        result = self.client.sync_publication('blog.example.com', self.path)
+        self.assertEqual(result['fetched'], 1)
+
+        mirror = Mirror(self.path)
+        self.assertEqual(mirror.high_water('blog.example.com'), high_water)
+        self.assertNotEqual(mirror.post('p1').content, 'edited')
+        self.assertEqual([c.id for c in mirror.comments('p1')], ['c-p1'])
+        mirror.close()
+
+        self.deleted = set()
+        result = self.client.sync_publication('blog.example.com', self.path)
+        mirror = Mirror(self.path)
+        self.assertEqual(mirror.post('p1').content, 'edited')
+        self.assertEqual(mirror.high_water('blog.example.com'), '2024-03-01T00:00:00Z')
+        mirror.close()
+
+    def test_drafts_need_a_member_token(self):
+        self.member = False
+        result = self.client.sync_publication('blog.example.com', self.path)
+        self.assertEqual((result['fetched'], result['drafts']), (2, None))
+        mirror = Mirror(self.path)
+        self.assertEqual(len(mirror.posts()), 2)
+        mirror.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
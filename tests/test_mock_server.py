@@ -0,0 +1,42 @@
+import unittest
+from gql.transport.exceptions import TransportQueryError
+from hashnode_py.client import HashnodeClient
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.retry import RetryPolicy
+from hashnode_py.session import HashnodeSession
+
+
+class MockServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = MockHashnodeServer(total_items=30, content_size=100).start()
+        self.addCleanup(self.server.stop)
+        self.client = HashnodeClient('token', session=HashnodeSession('token', url=self.server.url))
+
+    def test_queries(self):
+        self.assertEqual(len(self.client.get_feed(25)), 25)
+        followers = self.client.get_followers('alice', 20, 2)
+        self.assertEqual(len(followers.users), 10)
+        self.assertFalse(followers.has_next_page)
+        posts = self.client.get_user('alice').get_posts(10, 1, lazy_content=False)
+        self.assertEqual(posts[0].title, 'Title alice-post-0')
+        self.assertEqual(len(posts[0].content), 100)
+
+    def test_mutation(self):
+        publication = self.client.get_publication('blog.hashnode.dev')
+        message = publication.publish_post('Title', 'Body', tags_slug=[{'slug': 'python', 'name': 'Python'}])
+        self.assertIn('Successfully published', message)
+
+    def test_stats_and_injected_errors(self):
+        self.server.error_rate = 1.0
+        client = HashnodeClient('token', session=HashnodeSession('token', url=self.server.url),
+                                retry=RetryPolicy(max_attempts=2, backoff=0))
+        with self.assertRaises(TransportQueryError) as raised:
+            client.get_tag('python')
+        self.assertEqual(raised.exception.code, 503)
+        stats = self.server.stats.as_dict()
+        self.assertEqual((stats['requests'], stats['errors']), (2, 2))
+        self.assertGreater(stats['bytes_in'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
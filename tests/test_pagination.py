@@ -0,0 +1,99 @@
+import importlib.util
+import unittest
+from itertools import islice
+from hashnode_py.client import HashnodeClient
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeTransport, OfflineClientTest, post_data, user_data
+
+TOTAL = 45
+
+
+def handler(query, variables):
+    if 'feed' in query:
+        start = int(variables.get('after') or 0)
+        end = min(start + variables['first'], TOTAL)
+        return {'feed': {
+            'edges': [{'node': post_data(f'p{i}')} for i in range(start, end)],
+            'pageInfo': {'hasNextPage': end < TOTAL, 'endCursor': str(end)},
+        }}
+    size, page = variables['pageSize'], variables['page']
+    end = min(page * size, TOTAL)
+    return {'user': {'followers': {
+        'nodes': [user_data(f'user{i}') for i in range((page - 1) * size, end)],
+        'pageInfo': {
+            'hasNextPage': end < TOTAL,
+            'hasPreviousPage': page > 1,
+            'previousPage': page - 1 or None,
+            'nextPage': page + 1 if end < TOTAL else None,
+        },
+    }}}
+
+
+class PaginationTest(OfflineClientTest):
+    handler = staticmethod(handler)
+
+    def test_iter_feed_follows_cursor(self):
+        ids = [post.id for post in self.client.iter_feed(page_size=20, lazy_content=False)]
+        self.assertEqual(ids, [f'p{i}' for i in range(TOTAL)])
+        self.assertEqual([variables['after'] for _, variables in self.transport.requests], [None, '20', '40'])
+
+    def test_pages_are_fetched_on_demand(self):
+        first = list(islice(self.client.iter_feed(page_size=10), 5))
+        self.assertEqual(len(first), 5)
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_iter_followers_limit_and_stop(self):
+        users = list(self.client.iter_followers('talaat049', page_size=10, limit=25))
+        self.assertEqual(len(users), 25)
+        self.assertEqual([variables['page'] for _, variables in self.transport.requests], [1, 2, 3])
+        users = list(self.client.iter_followers('talaat049', page_size=10, stop=lambda u: u.username == 'user12'))
+        self.assertEqual(users[-1].username, 'user11')
+
+    def test_prefetch_keeps_order(self):
+        users = list(self.client.iter_followers('talaat049', page_size=10).prefetch(3))
+        self.assertEqual([user.username for user in users], [f'user{i}' for i in range(TOTAL)])
+        posts = list(self.client.iter_feed(page_size=20, lazy_content=False).prefetch())
+        self.assertEqual([post.id for post in posts], [f'p{i}' for i in range(TOTAL)])
+
+    def test_prefetch_window_is_bounded(self):
+        paginator = self.client.iter_followers('talaat049', page_size=5).prefetch(2)
+        next(iter(paginator))
+        self.assertLessEqual(len(self.transport.requests), 4)
+
+    def test_columnar_export(self):
+        paginator = self.client.iter_followers('talaat049', page_size=20, limit=30)
+        columns = paginator.columns()
+        self.assertEqual(columns['username'], [f'user{i}' for i in range(30)])
+        self.assertEqual(columns['bio'][0], 'bio')
+        self.assertEqual(paginator.schema()['followers_count'], 'int')
+        records = self.client.iter_feed(page_size=20, lazy_content=False).to_records()
+        self.assertEqual(len(records), TOTAL)
+        self.assertEqual((records[0]['title'], records[0]['content']), ('Title p0', '# p0'))
+        with self.assertRaises(ValueError):
+            self.client.iter_followers('talaat049', stop=lambda user: False).to_records()
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_to_arrow(self):
+        import pyarrow as pa
+        table = self.client.iter_followers('talaat049', page_size=20).to_arrow()
+        self.assertEqual(table.num_rows, TOTAL)
+        self.assertEqual(table.schema.field('followers_count').type, pa.int64())
+        self.assertEqual(table.schema.field('is_pro').type, pa.bool_())
+
+    @unittest.skipUnless(importlib.util.find_spec('pandas'), 'pandas is not installed')
+    def test_to_pandas(self):
+        frame = self.client.iter_followers('talaat049', page_size=20).to_pandas()
+        self.assertEqual(len(frame), TOTAL)
+        self.assertEqual(str(frame['followers_count'].dtype), 'Int64')
+
+        empty = {'user': {'followers': {'nodes': [], 'pageInfo': {
+            'hasNextPage': False, 'hasPreviousPage': False, 'previousPage': None, 'nextPage': None}}}}
+        session = HashnodeSession("token", transport=FakeTransport(lambda query, variables: empty), fetch_schema=False)
+        paginator = HashnodeClient(token="token", session=session).iter_followers('talaat049')
+        frame = paginator.to_pandas()
+        self.assertEqual((len(frame), list(frame.columns)), (0, list(paginator.schema())))
+        self.assertEqual(str(frame['followers_count'].dtype), 'Int64')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import hashlib
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from hashnode_py.client import HashnodeClient
+from hashnode_py.queries.persisted import persisted_hashes
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import user_data
+
+
+class PersistedQueryServer(BaseHTTPRequestHandler):
+    """
+    A stub GraphQL endpoint implementing the automatic persisted query protocol.
+    """
+    store = {}
+    bodies = []
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.bodies.append(body)
+        digest = body['extensions']['persistedQuery']['sha256Hash']
+        if 'query' in body:
+            if hashlib.sha256(body['query'].encode()).hexdigest() != digest:
+                return self.reply({'errors': [{'message': 'provided sha does not match query'}]})
+            self.store[digest] = body['query']
+        if digest not in self.store:
+            return self.reply({'errors': [{
+                'message': 'PersistedQueryNotFound', 'extensions': {'code': 'PERSISTED_QUERY_NOT_FOUND'}}]})
+        self.reply({'data': {'user': user_data(body['variables']['username'])}})
+
+    def reply(self, payload: dict):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class PersistedQueryTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Start the stub server and a client sending persisted queries to it.
+        """
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), PersistedQueryServer)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        url = f'http://127.0.0.1:{self.server.server_address[1]}/'
+        self.session = HashnodeSession("token", url=url, fetch_schema=False, persisted_queries=True)
+        self.client = HashnodeClient(token="token", session=self.session)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_hash_first_then_full_query_on_miss(self):
+        for name in ['a', 'b']:
+            self.assertEqual(self.client.get_user(name).username, name)
+        bodies = PersistedQueryServer.bodies
+        self.assertEqual(['query' in body for body in bodies], [False, True, False])
+        self.assertEqual(bodies[0]['extensions']['persistedQuery']['sha256Hash'], persisted_hashes()['user_info'])
+        transport = self.session.transport
+        self.assertEqual((transport.persisted_hits, transport.persisted_misses), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
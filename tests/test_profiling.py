@@ -0,0 +1,68 @@
+import os
+import sys
+import tempfile
+import unittest
+from hashnode_py.client import HashnodeClient
+from hashnode_py.documents import documents
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.profiling import PHASES, classify
+from hashnode_py.session import HashnodeSession
+
+
+class ProfilingTest(unittest.TestCase):
+    def test_classify(self):
+        client = ['hashnode_py.session', 'hashnode_py.client']
+        self.assertEqual(classify(['graphql.language.visitor', 'graphql.validation.validate',
+                                   'hashnode_py.documents'] + client), 'validate')
+        self.assertEqual(classify(['graphql.language.parser', 'hashnode_py.documents'] + client), 'parse')
+        self.assertEqual(classify(['socket', 'urllib3.connectionpool', 'requests.sessions',
+                                   'gql.transport.requests'] + client), 'transport')
+        self.assertEqual(classify(['json.decoder', 'requests.models', 'gql.transport.requests'] + client), 'decode')
+        self.assertEqual(classify(['_strptime', 'hashnode_py.resources.post'] + client), 'build')
+        self.assertEqual(classify(['hashnode_py.cache'] + client), 'client')
+
+    def test_classify_parse_stack(self):
+        stacks = []
+
+        def capture(frame, event, arg):
+            if event == 'call' and not stacks and frame.f_globals.get('__name__') == 'graphql.language.parser':
+                modules = []
+                while frame is not None:
+                    modules.append(frame.f_globals.get('__name__') or '')
+                    frame = frame.f_back
+                stacks.append(modules)
+
+        sys.setprofile(capture)
+        try:
+            documents.parse('query ProfiledParse { tag(slug: "python") { id } }')
+        finally:
+            sys.setprofile(None)
+        self.assertIn('gql.gql', stacks[0])
+        self.assertEqual(classify(stacks[0]), 'parse')
+
+    def test_profile(self):
+        with MockHashnodeServer(total_items=50) as server:
+            client = HashnodeClient('token', session=HashnodeSession('token', url=server.url))
+            with client.profile(interval=0.0005) as profiler:
+                for _ in range(3):
+                    client.get_feed(20)
+                    client.get_followers('alice', 50, 1)
+        report = profiler.report()
+        self.assertGreater(report['samples'], 0)
+        self.assertEqual(set(report['phases']), set(PHASES))
+        self.assertGreater(report['phases']['transport'], 0)
+        self.assertLessEqual(set(report['calls']), {'HashnodeClient.get_feed', 'HashnodeClient.get_followers'})
+
+        line = profiler.collapsed().splitlines()[0]
+        stack, microseconds = line.rsplit(' ', 1)
+        self.assertTrue(stack.startswith('hashnode_py.client:HashnodeClient.get_f'))
+        self.assertTrue(microseconds.isdigit())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'client.folded')
+            profiler.dump(path)
+            with open(path) as f:
+                self.assertEqual(f.read(), profiler.collapsed())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+from hashnode_py.async_client import AsyncHashnodeClient
+from hashnode_py.client import HashnodeClient
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.ratelimit import RateLimiter
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeAsyncTransport, FakeTransport, user_data
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_requests_are_paced_across_threads(self):
+        limiter = RateLimiter(rate=50, burst=1)
+        transport = FakeTransport(lambda query, variables: {'user': user_data(variables['username'])})
+        session = HashnodeSession("token", transport=transport, fetch_schema=False)
+        client = HashnodeClient(token="token", session=session, rate_limiter=limiter)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(client.get_user, [f'user{i}' for i in range(6)]))
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+        self.assertEqual(limiter.stats.requests, 6)
+
+    def test_adapts_to_throttling(self):
+        limiter = RateLimiter(rate=10)
+        limiter.throttle(retry_after=0.05)
+        self.assertEqual(limiter.rate, 5)
+        self.assertGreaterEqual(limiter._reserve(), 0.04)
+        for _ in range(20):
+            limiter.observe()
+        self.assertEqual(limiter.rate, 10)
+        limiter.observe({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0.05'})
+        self.assertGreater(limiter._reserve(), 0.03)
+
+    def test_throttled_by_429(self):
+        def handler(query, variables):
+            raise TransportServerError('429 Too Many Requests', 429)
+
+        limiter = RateLimiter(rate=10)
+        session = HashnodeSession("token", transport=FakeTransport(handler), fetch_schema=False)
+        client = HashnodeClient(token="token", session=session, rate_limiter=limiter)
+        with self.assertRaises(TransportServerError):
+            client.get_user('talaat049')
+        self.assertEqual((limiter.stats.throttled, limiter.rate), (1, 5))
+
+    def test_throttled_by_429_with_graphql_errors(self):
+        limiter = RateLimiter(rate=10)
+        with MockHashnodeServer(error_rate=1.0, error_status=429) as server:
+            client = HashnodeClient('token', session=HashnodeSession('token', url=server.url), rate_limiter=limiter)
+            with self.assertRaises(TransportQueryError):
+                client.get_tag('python')
+        self.assertEqual((limiter.stats.throttled, limiter.rate), (1, 5))
+
+    def test_async_throttled_by_429_with_graphql_errors(self):
+        limiter = RateLimiter(rate=10)
+
+        async def run(url):
+            async with AsyncHashnodeClient("token", url=url, rate_limiter=limiter) as client:
+                await client.get_tag('python')
+
+        with MockHashnodeServer(error_rate=1.0, error_status=429) as server:
+            with self.assertRaises(TransportQueryError):
+                asyncio.run(run(server.url))
+        self.assertEqual((limiter.stats.throttled, limiter.rate), (1, 5))
+
+    def test_async_in_flight_limit(self):
+        transport = FakeAsyncTransport(lambda query, variables: {'user': user_data(variables['username'])}, 0.01)
+        limiter = RateLimiter(rate=1000, max_in_flight=2)
+
+        async def run():
+            async with AsyncHashnodeClient("token", transport=transport, fetch_schema=False,
+                                           rate_limiter=limiter) as client:
+                await asyncio.gather(*(client.get_user(f'user{i}') for i in range(6)))
+
+        asyncio.run(run())
+        self.assertEqual(transport.max_in_flight, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import re
+import unittest
+from hashnode_py.resources.fields import FieldNotFetchedError
+from tests.fake_transport import OfflineClientTest, post_data
+
+
+def selected(data: dict, query: str) -> dict:
+    names = set(re.findall(r'\w+', query))
+    return {key: value for key, value in data.items() if key in names}
+
+
+def handler(query, variables):
+    if 'k0:' in query:
+        return {alias: selected(post_data(key), query) for alias, key in variables.items()}
+    if 'feed' in query:
+        return {'feed': {'edges': [{'node': selected(post_data(f'p{i}'), query)} for i in range(3)]}}
+    return {'post': selected(post_data(variables['id']), query)}
+
+
+class ResourceTest(OfflineClientTest):
+    handler = staticmethod(handler)
+
+    def test_projected_feed(self):
+        posts = self.client.get_feed(3, fields=['title', 'url'])
+        query, _ = self.transport.requests[0]
+        self.assertNotIn('markdown', query)
+        self.assertEqual(posts[0].title, 'Title p0')
+        self.assertEqual(posts[0].id, 'p0')
+        with self.assertRaises(FieldNotFetchedError):
+            posts[0].views
+
+    def test_lazy_content_is_batched(self):
+        posts = self.client.get_feed(3)
+        self.assertNotIn('markdown', self.transport.requests[0][0])
+        self.assertEqual(posts[1].content, '# p1')
+        self.assertEqual(len(self.transport.requests), 2)
+        self.assertEqual(sorted(self.transport.requests[1][1].values()), ['p0', 'p1', 'p2'])
+        self.assertEqual(posts[0].content, '# p0')
+        self.assertEqual(len(self.transport.requests), 2)
+
+    def test_eager_content(self):
+        posts = self.client.get_feed(3, lazy_content=False)
+        self.assertIn('markdown', self.transport.requests[0][0])
+        self.assertEqual(posts[2].content, '# p2')
+        self.assertEqual(len(self.transport.requests), 1)
+
+    def test_unknown_field(self):
+        with self.assertRaises(ValueError):
+            self.client.get_post('p1', fields=['nope'])
+        with self.assertRaises(AttributeError):
+            self.client.get_post('p1').nope
+
+    def test_raw_data_is_opt_in(self):
+        post = self.client.get_post('p1')
+        self.assertFalse(hasattr(post, '__dict__'))
+        self.assertIsNone(post.data)
+        self.client.keep_raw = True
+        self.assertEqual(self.client.get_post('p2').data['id'], 'p2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from gql.transport.exceptions import TransportQueryError, TransportServerError
+from hashnode_py.client import HashnodeClient
+from hashnode_py.mock import MockHashnodeServer
+from hashnode_py.queries.mutations import like_post
+from hashnode_py.retry import RetryPolicy, retry_after
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeTransport, user_data
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a client whose offline transport fails with a 503 a given number of times.
+        """
+        self.failures = 0
+        self.transport = FakeTransport(self.handler)
+        session = HashnodeSession("token", transport=self.transport, fetch_schema=False)
+        self.retry = RetryPolicy(max_attempts=3, backoff=0)
+        self.client = HashnodeClient(token="token", session=session, retry=self.retry)
+
+    def handler(self, query, variables):
+        if self.failures:
+            self.failures -= 1
+            error = TransportServerError('503 Server Error', 503)
+            error.retry_after = 0
+            raise error
+        if 'likePost' in query:
+            return {'likePost': {'post': {'id': variables['postId'], 'title': 'Title'}}}
+        return {'user': user_data(variables['username'])}
+
+    def test_queries_are_retried(self):
+        self.failures = 2
+        self.assertEqual(self.client.get_user('talaat049').username, 'talaat049')
+        self.assertEqual(self.retry.stats.as_dict()['retries_by_operation'], {'User': 2})
+        self.failures = 3
+        with self.assertRaises(TransportServerError):
+            self.client.get_user('talaat049')
+        self.assertEqual(self.retry.stats.gave_up, 1)
+
+    def test_mutations_are_retried_only_when_safe(self):
+        self.failures = 1
+        with self.assertRaises(TransportServerError):
+            self.client.fetch_data(like_post, {'postId': 'p1', 'likesCount': 1})
+        self.failures = 1
+        self.client.fetch_data(like_post, {'postId': 'p1', 'likesCount': 1}, retry_mutation=True)
+        self.assertEqual(self.retry.stats.retries, 1)
+
+    def test_graphql_errors_with_a_transient_status_are_retried(self):
+        with MockHashnodeServer(error_rate=1.0, error_status=429) as server:
+            retry = RetryPolicy(max_attempts=3, backoff=0)
+            client = HashnodeClient('token', session=HashnodeSession('token', url=server.url), retry=retry)
+            with self.assertRaises(TransportQueryError) as raised:
+                client.get_tag('python')
+            self.assertEqual((raised.exception.code, raised.exception.retry_after), (429, 0.0))
+            self.assertEqual(server.stats.requests, 3)
+            server.error_status = 400
+            with self.assertRaises(TransportQueryError):
+                client.get_tag('python')
+            self.assertEqual(server.stats.requests, 4)
+
+    def test_retry_after(self):
+        self.assertEqual(retry_after({'Retry-After': '2'}), 2.0)
+        self.assertIsNone(retry_after({}))
+        self.assertEqual(retry_after({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}), 0.0)
+        self.assertEqual(RetryPolicy(max_backoff=5).delay(1, type('E', (), {'retry_after': 60})()), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
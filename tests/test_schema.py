@@ -0,0 +1,60 @@
+import unittest
+from graphql import GraphQLError, validate
+from hashnode_py.client import HashnodeClient
+from hashnode_py.documents import documents
+from hashnode_py.queries import MUTATIONS, QUERIES
+from hashnode_py.queries.builder import LOOKUPS, batch_query
+from hashnode_py.schema import load_schema
+from hashnode_py.session import HashnodeSession
+from tests.fake_transport import FakeTransport, user_data
+
+
+class BundledSchemaTest(unittest.TestCase):
+    def test_every_document_is_valid(self):
+        schema = load_schema()
+        self.assertIs(load_schema(), schema)
+        texts = {**QUERIES, **MUTATIONS}
+        texts.update({kind: batch_query(kind, ['a', 'b'])[0] for kind in LOOKUPS})
+        for name, text in texts.items():
+            self.assertEqual(validate(schema, documents.parse(text)), [], name)
+
+    def test_validation_without_introspection(self):
+        transport = FakeTransport(lambda query, variables: {'user': user_data(variables['username'])})
+        session = HashnodeSession("token", transport=transport)
+        client = HashnodeClient(token="token", session=session, validate=True)
+        self.assertFalse(session.client.fetch_schema_from_transport)
+        with self.assertRaises(GraphQLError):
+            client.fetch_data('query { user(username: "a") { karma } }')
+        self.assertEqual(transport.requests, [])
+        client = HashnodeClient(token="token", session=session, validate=False)
+        client.fetch_data('query($username: String!) { user(username: $username) { karma } }', {'username': 'a'})
+        self.assertEqual(len(transport.requests), 1)
+
+    def test_only_package_documents_are_validated_by_default(self):
+        transport = FakeTransport(lambda query, variables: {'me': {'id': '1'}})
+        session = HashnodeSession("token", transport=transport)
+        client = HashnodeClient(token="token", session=session)
+        # Not covered by the bundled snapshot, so left to the server.
+        self.assertEqual(client.fetch_data('{ me { id } }'), {'me': {'id': '1'}})
+        self.assertTrue(documents.is_own(QUERIES['user_info']))
+        self.assertTrue(documents.is_own(batch_query('user', ['a', 'b'])[0]))
+        self.assertFalse(documents.is_own('{ me { id } }'))
+
+    def test_built_queries_stay_own_after_eviction(self):
+        query = batch_query('tag', ['a'])[0]
+        for i in range(documents.max_entries):
+            documents.own(f'{{ tag(slug: "{i}") {{ id }} }}')
+        self.assertFalse(documents.is_own(query))
+        self.assertTrue(documents.is_own(batch_query('tag', ['a'])[0]))
+
+    def test_settings_stay_per_client(self):
+        transport = FakeTransport(lambda query, variables: {'user': user_data('a')})
+        session = HashnodeSession("token", transport=transport)
+        HashnodeClient(token="token", session=session, validate=False, persisted_queries=True)
+        client = HashnodeClient(token="token", session=session, validate=True)
+        with self.assertRaises(GraphQLError):
+            client.fetch_data('query { user(username: "a") { karma } }')
+        self.assertFalse(hasattr(session, 'validate'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from graphql import build_schema
+from hashnode_py.client import HashnodeClient
+from hashnode_py.documents import DocumentCache
+from hashnode_py.session import get_session
+from tests.fake_transport import OfflineClientTest, user_data
+
+
+def followers_handler(query, variables):
+    return {
+        'user': {
+            'followers': {
+                'nodes': [user_data(f'user{i}') for i in range(50)],
+                'pageInfo': {
+                    'hasNextPage': False,
+                    'hasPreviousPage': False,
+                    'previousPage': None,
+                    'nextPage': None,
+                },
+            }
+        }
+    }
+
+
+class HashnodeSessionTest(OfflineClientTest):
+    handler = staticmethod(followers_handler)
+
+    def test_clients_share_session_per_token(self):
+        self.assertIs(get_session("shared-token"), get_session("shared-token"))
+        self.assertIsNot(get_session("shared-token"), get_session("other-token"))
+        self.assertIs(HashnodeClient("shared-token").session, HashnodeClient("shared-token").session)
+
+    def test_pool_grows_for_larger_clients(self):
+        session = get_session("pool-token", pool_size=10)
+        session.connect()
+        HashnodeClient("pool-token", max_workers=32)
+        self.assertEqual(session.transport.pool_size, 32)
+        self.assertEqual(session.transport.session.get_adapter('https://gql.hashnode.com/')._pool_maxsize, 32)
+        get_session("pool-token", pool_size=4)
+        self.assertEqual(session.transport.pool_size, 32)
+        session.close()
+
+    def test_resources_reuse_client(self):
+        followers = self.client.get_followers("talaat049", 50, 1)
+        self.assertIs(followers.client, self.client)
+        self.assertTrue(all(user.client is self.client for user in followers.users))
+
+    def test_transport_connects_once(self):
+        for _ in range(3):
+            self.client.get_followers("talaat049", 50, 1)
+        self.assertEqual(self.transport.connects, 1)
+        self.assertEqual(len(self.transport.requests), 3)
+
+
+class DocumentCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = DocumentCache()
+        self.query = "query User($username: String!) { user(username: $username) { username } }"
+
+    def test_parse_once(self):
+        first = self.cache.parse(self.query)
+        second = self.cache.parse(self.query)
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats()['misses'], 1)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_validate_once_per_schema(self):
+        schema = build_schema("type User { username: String } type Query { user(username: String!): User }")
+        document = self.cache.parse(self.query)
+        self.cache.validate(document, schema)
+        self.cache.validate(document, schema)
+        self.assertEqual(self.cache.stats()['validation_misses'], 1)
+        self.assertEqual(self.cache.stats()['validation_hits'], 1)
+        with self.assertRaises(Exception):
+            self.cache.validate(self.cache.parse("{ user(username: \"a\") { missing } }"), schema)
+
+    def test_bounded(self):
+        cache = DocumentCache(max_entries=2)
+        schema = build_schema("type User { username: String } type Query { user(username: String!): User }")
+        first = cache.parse(self.query)
+        for username in 'abc':
+            document = cache.parse(f'{{ user(username: "{username}") {{ username }} }}')
+            cache.validate(document, schema)
+            cache.digest(document)
+            cache.parse(self.query)
+        self.assertIs(cache.parse(self.query), first)
+        self.assertEqual(cache.stats()['size'], 2)
+        self.assertEqual(len(cache._validated[schema]), 2)
+        self.assertEqual(len(cache._digests), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
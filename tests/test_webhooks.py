@@ -0,0 +1,86 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from hashnode_py.cache import MemoryCache
+from hashnode_py.client import HashnodeClient
+from hashnode_py.mirror import Mirror
+from hashnode_py.session import HashnodeSession
+from hashnode_py.webhooks import WebhookReceiver, WebhookSignatureError, sign, verify_signature
+from tests.fake_transport import FakeTransport, post_data
+
+
+def event_body(event_type: str, post_id: str) -> bytes:
+    payload = {
+        'metadata': {'uuid': 'u1'},
+        'data': {'publication': {'id': 'pub'}, 'post': {'id': post_id}, 'eventType': event_type},
+    }
+    return json.dumps(payload).encode()
+
+
+def handler(query, variables):
+    if 'publication(' in query:
+        # An empty publication, so syncing only records it in the mirror.
+        return {'publication': {'id': 'pub', 'posts': {
+            'edges': [], 'pageInfo': {'hasNextPage': False, 'endCursor': None}}}}
+    return {'post': post_data(variables['id'])}
+
+
+class WebhookReceiverTest(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a cached client, a mirror of one publication and a receiver updating both.
+        """
+        self.transport = FakeTransport(handler)
+        session = HashnodeSession("token", transport=self.transport, fetch_schema=False)
+        self.client = HashnodeClient(token="token", session=session, cache=MemoryCache())
+        self.directory = tempfile.TemporaryDirectory()
+        self.mirror = Mirror(os.path.join(self.directory.name, 'mirror.db'))
+        self.mirror.sync(self.client, 'blog.example.com', drafts=False, comments=False)
+        self.events = []
+        self.receiver = WebhookReceiver('secret', self.client, self.mirror, on_event=self.events.append)
+
+    def tearDown(self):
+        self.mirror.close()
+        self.directory.cleanup()
+
+    def post(self, body: bytes, signature: str) -> str:
+        statuses = []
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+            'HTTP_X_HASHNODE_SIGNATURE': signature,
+        }
+        self.receiver(environ, lambda status, headers: statuses.append(status))
+        return statuses[0]
+
+    def test_signature(self):
+        body = event_body('post_updated', 'p1')
+        now = int(time.time() * 1000)
+        verify_signature(body, sign(body, 'secret', now), 'secret')
+        with self.assertRaises(WebhookSignatureError):
+            verify_signature(body, sign(body, 'other', now), 'secret')
+        with self.assertRaises(WebhookSignatureError):
+            verify_signature(body, sign(body, 'secret', now - 600000), 'secret')
+        self.assertEqual(self.post(body, sign(body, 'other', now)), '401 Unauthorized')
+        self.assertEqual(self.post(b'{}', sign(b'{}', 'secret', now)), '400 Bad Request')
+        self.assertEqual(self.events, [])
+
+    def test_events_update_cache_and_mirror(self):
+        self.client.get_post('p1')
+        body = event_body('post_updated', 'p1')
+        self.assertEqual(self.post(body, sign(body, 'secret', int(time.time() * 1000))), '200 OK')
+        self.assertEqual(len(self.client.cache), 0)
+        self.assertEqual(self.mirror.post('p1').content, '# p1')
+        self.assertEqual(self.events[0].event_type, 'post_updated')
+
+        body = event_body('post_deleted', 'p1')
+        self.post(body, sign(body, 'secret', int(time.time() * 1000)))
+        self.assertIsNone(self.mirror.post('p1'))
+
+
+if __name__ == '__main__':
+    unittest.main()